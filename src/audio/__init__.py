@@ -1,4 +1,9 @@
 from .capture import AudioCapture
 from .transcription_recorder import TranscriptionRecorder, TranscriptSegment
+from .vad import VoiceActivityDetector, create_vad
+from .file_source import FileAudioSource
 
-__all__ = ['AudioCapture', 'TranscriptionRecorder', 'TranscriptSegment']
+__all__ = [
+    'AudioCapture', 'TranscriptionRecorder', 'TranscriptSegment',
+    'VoiceActivityDetector', 'create_vad', 'FileAudioSource',
+]
@@ -1,16 +1,32 @@
 """Audio capture from microphone with voice activity detection"""
 
 import threading
-import queue
 import numpy as np
 from typing import Callable, Optional
 import logging
 
+from .pipeline import PipelineStage, DropPolicy
+from .ring_buffer import AudioRingBuffer
+from .vad import VoiceActivityDetector, EnergyVAD
+from .file_source import FileAudioSource
+
 logger = logging.getLogger(__name__)
 
 
 class AudioCapture:
-    """Captures audio from microphone with VAD filtering"""
+    """
+    Captures audio from microphone with VAD filtering.
+    
+    Backends:
+        blocking: a capture thread calls stream.read() in a loop
+        callback: PortAudio invokes a stream callback; no capture thread.
+            Input overflows/underflows reported by PortAudio are counted.
+    
+    If a FileAudioSource is given, it replaces the microphone and the
+    recorded audio goes through the same VAD path.
+    """
+    
+    BACKENDS = ("blocking", "callback")
     
     def __init__(
         self,
@@ -18,22 +34,60 @@ class AudioCapture:
         chunk_duration_ms: int = 100,
         vad_threshold: float = 0.5,
         device_index: Optional[int] = None,
+        queue_size: int = 50,
+        drop_policy: str = DropPolicy.DROP_OLDEST,
+        max_utterance_seconds: float = 30.0,
+        backend: str = "blocking",
+        vad: Optional[VoiceActivityDetector] = None,
+        source: Optional[FileAudioSource] = None,
+        partial_interval_ms: int = 0,
+        partial_window_seconds: float = 6.0,
     ):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown audio backend: {backend}")
+        if backend == "callback" and drop_policy == DropPolicy.BLOCK:
+            logger.warning("'block' policy would stall the audio callback, using drop_oldest")
+            drop_policy = DropPolicy.DROP_OLDEST
+        
         self.sample_rate = sample_rate
         self.chunk_duration_ms = chunk_duration_ms
         self.vad_threshold = vad_threshold
+        self.vad = vad or EnergyVAD(vad_threshold)
         self.device_index = device_index
+        self.source = source
+        self.backend = "file" if source is not None else backend
         
         # Calculate chunk size
         self.chunk_size = int(sample_rate * chunk_duration_ms / 1000)
+        if source is not None:
+            source.chunk_size = self.chunk_size
+        
+        # Preallocated float32 chunk slots, converted into in place. Two more
+        # than the queue holds so a slot is never rewritten while queued or
+        # being processed by the VAD worker.
+        self._chunk_pool = np.zeros((queue_size + 2, self.chunk_size), dtype=np.float32)
+        self._pool_index = 0
         
-        # Audio buffer for accumulating speech
-        self.audio_queue: queue.Queue = queue.Queue()
+        # Capture health counters
+        self._chunks_captured = 0
+        self._utterances = 0
+        self._partials = 0
+        self._overflows = 0
+        self._underruns = 0
+        
+        # Capture thread only enqueues raw chunks; VAD runs on its own worker
+        self._vad_stage = PipelineStage(
+            "vad",
+            self._process_chunk,
+            maxsize=queue_size,
+            policy=drop_policy,
+        )
         
         # Control flags
         self._running = False
         self._paused = False
         self._thread: Optional[threading.Thread] = None
+        self._source_done = threading.Event()
         
         # PyAudio instance (lazy init)
         self._pyaudio = None
@@ -41,28 +95,72 @@ class AudioCapture:
         
         # Callbacks
         self._on_audio: Optional[Callable[[np.ndarray], None]] = None
+        self._on_partial: Optional[Callable[[np.ndarray, int], None]] = None
         
-        # VAD state
-        self._silence_chunks = 0
-        self._speech_buffer = []
-        self._in_speech = False
+        # Streaming partials: every N chunks during speech, hand the newest
+        # window of the in-progress utterance to on_partial (0 disables)
+        self._partial_every = (
+            max(1, round(partial_interval_ms / chunk_duration_ms)) if partial_interval_ms > 0 else 0
+        )
+        self._partial_window = int(sample_rate * partial_window_seconds)
+        self._chunks_since_partial = 0
         
         # VAD settings
         self._speech_start_chunks = 3  # Chunks of speech to start
         self._silence_end_chunks = 10  # Chunks of silence to end
+        self._preroll_chunks = 5       # Chunks kept before speech for context
+        
+        # VAD state - preallocated so long utterances don't grow lists of arrays
+        self._silence_chunks = 0
+        self._speech_buffer = AudioRingBuffer(int(sample_rate * max_utterance_seconds))
+        self._in_speech = False
     
-    def start(self, on_audio: Callable[[np.ndarray], None]) -> None:
-        """Start capturing audio"""
+    def start(
+        self,
+        on_audio: Callable[[np.ndarray], None],
+        on_partial: Optional[Callable[[np.ndarray, int], None]] = None,
+    ) -> None:
+        """
+        Start capturing audio.
+        
+        Args:
+            on_audio: Called with each complete utterance
+            on_partial: Called during speech with the newest window of the
+                utterance in progress and its utterance number (see
+                utterance_count), if partials are enabled
+        
+        Raises:
+            Exception: The callback backend could not open or start the
+                stream (capture is left stopped)
+        """
         if self._running:
             return
         
         self._on_audio = on_audio
+        self._on_partial = on_partial
         self._running = True
         self._paused = False
         
-        self._thread = threading.Thread(target=self._capture_loop, daemon=True)
-        self._thread.start()
-        logger.info("Audio capture started")
+        self._vad_stage.start()
+        if self.source is not None:
+            self._source_done.clear()
+            self._thread = threading.Thread(target=self._source_loop, daemon=True)
+            self._thread.start()
+        elif self.backend == "callback":
+            try:
+                self._init_pyaudio(stream_callback=self._stream_callback)
+                self._stream.start_stream()
+            except Exception as e:
+                # Leave capture stopped so a later start() can try again
+                logger.error(f"Audio capture error: {e}")
+                self._running = False
+                self._vad_stage.stop()
+                self._cleanup()
+                raise
+        else:
+            self._thread = threading.Thread(target=self._capture_loop, daemon=True)
+            self._thread.start()
+        logger.info(f"Audio capture started ({self.backend} backend)")
     
     def stop(self) -> None:
         """Stop capturing audio"""
@@ -70,6 +168,7 @@ class AudioCapture:
         if self._thread:
             self._thread.join(timeout=2.0)
             self._thread = None
+        self._vad_stage.stop()
         self._cleanup()
         logger.info("Audio capture stopped")
     
@@ -91,7 +190,29 @@ class AudioCapture:
     def is_paused(self) -> bool:
         return self._paused
     
-    def _init_pyaudio(self):
+    @property
+    def metrics(self) -> dict:
+        """Capture queue depth and VAD stage latency"""
+        return self._vad_stage.metrics.to_dict()
+    
+    @property
+    def utterance_count(self) -> int:
+        """Utterances emitted so far (the number of the last one)"""
+        return self._utterances
+    
+    @property
+    def capture_stats(self) -> dict:
+        """Chunk, overflow and underrun counts for the capture backend"""
+        return {
+            "backend": self.backend,
+            "chunks": self._chunks_captured,
+            "utterances": self._utterances,
+            "partials": self._partials,
+            "overflows": self._overflows,
+            "underruns": self._underruns,
+        }
+    
+    def _init_pyaudio(self, stream_callback=None):
         """Initialize PyAudio"""
         import pyaudio
         self._pyaudio = pyaudio.PyAudio()
@@ -104,6 +225,7 @@ class AudioCapture:
             input=True,
             input_device_index=self.device_index,
             frames_per_buffer=self.chunk_size,
+            stream_callback=stream_callback,
         )
     
     def _cleanup(self):
@@ -116,6 +238,29 @@ class AudioCapture:
             self._pyaudio.terminate()
             self._pyaudio = None
     
+    def wait_source_done(self, timeout: Optional[float] = None) -> bool:
+        """Block until a file source is exhausted and the VAD has drained"""
+        if not self._source_done.wait(timeout):
+            return False
+        return self._vad_stage.wait_idle(timeout)
+    
+    def _source_loop(self):
+        """Replay loop for a FileAudioSource (paced by the source)"""
+        import time
+        
+        try:
+            for chunk in self.source.chunks():
+                while self._paused and self._running:
+                    time.sleep(0.1)
+                if not self._running:
+                    break
+                self._chunks_captured += 1
+                self._vad_stage.submit(chunk)
+        except Exception as e:
+            logger.error(f"Audio replay error: {e}")
+        finally:
+            self._source_done.set()
+    
     def _capture_loop(self):
         """Main capture loop running in thread"""
         try:
@@ -130,10 +275,10 @@ class AudioCapture:
                 try:
                     # Read audio chunk
                     data = self._stream.read(self.chunk_size, exception_on_overflow=False)
-                    audio = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
+                    audio = self._convert_chunk(data)
                     
-                    # Process with VAD
-                    self._process_chunk(audio)
+                    # Hand off to the VAD worker; never blocks the stream
+                    self._vad_stage.submit(audio)
                     
                 except Exception as e:
                     logger.error(f"Error reading audio: {e}")
@@ -145,19 +290,52 @@ class AudioCapture:
         finally:
             self._cleanup()
     
+    def _stream_callback(self, in_data, frame_count, time_info, status):
+        """PortAudio callback: convert and enqueue, nothing else"""
+        import pyaudio
+        
+        if status & pyaudio.paInputOverflow:
+            self._overflows += 1
+        if status & pyaudio.paInputUnderflow:
+            self._underruns += 1
+        
+        if in_data and not self._paused:
+            self._vad_stage.submit(self._convert_chunk(in_data))
+        
+        return (None, pyaudio.paContinue if self._running else pyaudio.paComplete)
+    
+    def _convert_chunk(self, data: bytes) -> np.ndarray:
+        """Scale int16 PCM into the next preallocated float32 slot (no allocation)"""
+        samples = np.frombuffer(data, dtype=np.int16)
+        slot = self._chunk_pool[self._pool_index]
+        self._pool_index = (self._pool_index + 1) % len(self._chunk_pool)
+        
+        n = min(len(samples), self.chunk_size)
+        out = slot[:n]
+        np.multiply(samples[:n], 1.0 / 32768.0, out=out)
+        self._chunks_captured += 1
+        return out
+    
     def _process_chunk(self, audio: np.ndarray):
         """Process audio chunk with VAD"""
-        # Simple energy-based VAD
-        energy = np.sqrt(np.mean(audio ** 2))
-        is_speech = energy > self.vad_threshold * 0.01
+        is_speech = self.vad.is_speech(audio)
         
         if is_speech:
             self._silence_chunks = 0
             self._speech_buffer.append(audio)
             
-            if not self._in_speech and len(self._speech_buffer) >= self._speech_start_chunks:
+            if not self._in_speech and len(self._speech_buffer) >= self._speech_start_chunks * self.chunk_size:
                 self._in_speech = True
                 logger.debug("Speech started")
+            
+            if self._in_speech and self._speech_buffer.free < self.chunk_size:
+                # Utterance hit the buffer cap; flush it and keep listening
+                logger.debug("Max utterance length reached, flushing")
+                self._emit_utterance()
+            elif self._in_speech and self._partial_every and self._on_partial:
+                self._chunks_since_partial += 1
+                if self._chunks_since_partial >= self._partial_every:
+                    self._emit_partial()
         else:
             if self._in_speech:
                 self._silence_chunks += 1
@@ -165,19 +343,32 @@ class AudioCapture:
                 
                 if self._silence_chunks >= self._silence_end_chunks:
                     # Speech ended, send accumulated audio
-                    if self._speech_buffer and self._on_audio:
-                        full_audio = np.concatenate(self._speech_buffer)
-                        self._on_audio(full_audio)
-                    
-                    self._speech_buffer = []
+                    self._emit_utterance()
                     self._in_speech = False
                     self._silence_chunks = 0
                     logger.debug("Speech ended")
+                elif self._speech_buffer.free < self.chunk_size:
+                    logger.debug("Max utterance length reached, flushing")
+                    self._emit_utterance()
             else:
                 # Keep a small buffer for context
                 self._speech_buffer.append(audio)
-                if len(self._speech_buffer) > 5:
-                    self._speech_buffer.pop(0)
+                self._speech_buffer.keep_last(self._preroll_chunks * self.chunk_size)
+    
+    def _emit_utterance(self):
+        """Send the buffered utterance (one contiguous copy) and reset the buffer"""
+        if len(self._speech_buffer) and self._on_audio:
+            self._utterances += 1
+            self._on_audio(self._speech_buffer.read())
+        self._speech_buffer.clear()
+        self._chunks_since_partial = 0
+    
+    def _emit_partial(self):
+        """Send the newest window of the utterance in progress"""
+        self._chunks_since_partial = 0
+        self._partials += 1
+        window = min(len(self._speech_buffer), self._partial_window)
+        self._on_partial(self._speech_buffer.read(window), self._utterances + 1)
     
     @staticmethod
     def list_devices() -> list:
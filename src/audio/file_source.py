@@ -0,0 +1,168 @@
+"""WAV file audio source for offline replay of recorded meetings"""
+
+import struct
+import time
+from pathlib import Path
+from typing import Iterator, List, Tuple, Union
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+def _read_wav(path: Path) -> Tuple[int, int, int, int, bytes]:
+    """
+    Parse a RIFF/WAVE file.
+
+    The stdlib wave module only reads plain integer PCM; this also accepts
+    IEEE float and WAVE_FORMAT_EXTENSIBLE headers (common for 24-bit files).
+
+    Returns:
+        (format tag, channels, sample width in bytes, frame rate, sample data)
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < 12 or data[:4] != b'RIFF' or data[8:12] != b'WAVE':
+        raise ValueError(f"{path} is not a WAV file")
+
+    fmt = None
+    frames = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        size = struct.unpack_from('<I', data, offset + 4)[0]
+        body = data[offset + 8:offset + 8 + size]
+        if chunk_id == b'fmt ' and len(body) >= 16:
+            tag, channels, rate, _, block_align, bits = struct.unpack_from('<HHIIHH', body)
+            if tag == WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+                tag = struct.unpack_from('<H', body, 24)[0]  # First field of the subformat GUID
+            fmt = (tag, channels, (bits + 7) // 8, rate, block_align)
+        elif chunk_id == b'data':
+            frames = body  # May be short if the recording was cut off
+        offset += 8 + size + (size & 1)  # Chunks are word aligned
+
+    if fmt is None or frames is None:
+        raise ValueError(f"{path} has no {'fmt' if fmt is None else 'data'} chunk")
+    tag, channels, width, rate, block_align = fmt
+    if channels < 1 or width < 1 or block_align != channels * width:
+        raise ValueError(f"Malformed WAV header in {path}")
+    return tag, channels, width, rate, frames[:len(frames) - len(frames) % block_align]
+
+
+def load_wav(path: Path, sample_rate: int = 16000) -> np.ndarray:
+    """
+    Load a WAV file as mono float32, resampled to sample_rate.
+
+    Supports 8/16/24/32-bit integer PCM and 32/64-bit float. Resampling is
+    linear interpolation, which is adequate for speech recognition input.
+
+    Raises:
+        ValueError: Not a WAV file, or an encoding other than the above
+            (e.g. compressed formats such as ADPCM or mu-law)
+    """
+    tag, channels, width, rate, frames = _read_wav(path)
+
+    if tag == WAVE_FORMAT_PCM and width == 1:
+        audio = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif tag == WAVE_FORMAT_PCM and width == 2:
+        audio = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+    elif tag == WAVE_FORMAT_PCM and width == 3:
+        # Widen little-endian 24-bit samples to int32 by adding a low zero byte
+        padded = np.zeros((len(frames) // 3, 4), dtype=np.uint8)
+        padded[:, 1:] = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3)
+        audio = padded.view('<i4').ravel().astype(np.float32) / 2147483648.0
+    elif tag == WAVE_FORMAT_PCM and width == 4:
+        audio = np.frombuffer(frames, dtype='<i4').astype(np.float32) / 2147483648.0
+    elif tag == WAVE_FORMAT_IEEE_FLOAT and width in (4, 8):
+        audio = np.frombuffer(frames, dtype='<f4' if width == 4 else '<f8').astype(np.float32)
+    else:
+        kind = {WAVE_FORMAT_PCM: "integer PCM", WAVE_FORMAT_IEEE_FLOAT: "float"}.get(tag, f"format 0x{tag:04x}")
+        raise ValueError(f"Unsupported WAV encoding in {path}: {width * 8}-bit {kind} "
+                         f"(use 8/16/24/32-bit PCM or 32/64-bit float)")
+
+    if channels > 1:
+        audio = audio.reshape(-1, channels).mean(axis=1)
+
+    if rate != sample_rate and len(audio):
+        duration = len(audio) / rate
+        target = np.arange(int(duration * sample_rate)) / sample_rate
+        source = np.arange(len(audio)) / rate
+        audio = np.interp(target, source, audio).astype(np.float32)
+
+    return audio
+
+
+class FileAudioSource:
+    """
+    Feeds recorded WAV files to AudioCapture in place of a microphone.
+
+    Each file is followed by a stretch of silence so the VAD closes the
+    final utterance before the next file starts.
+    """
+
+    def __init__(
+        self,
+        paths: Union[str, Path, List[Union[str, Path]]],
+        sample_rate: int = 16000,
+        chunk_size: int = 1600,
+        realtime: bool = True,
+        tail_silence_seconds: float = 1.5,
+    ):
+        if not isinstance(paths, (list, tuple)):
+            paths = [paths]
+        self.files = self._expand(paths)
+        if not self.files:
+            raise FileNotFoundError(f"No WAV files found in {paths}")
+
+        self.sample_rate = sample_rate
+        self.chunk_size = chunk_size
+        self.realtime = realtime
+        self.tail_silence_seconds = tail_silence_seconds
+
+        self.samples_read = 0
+
+    @staticmethod
+    def _expand(paths) -> List[Path]:
+        """Resolve directories into their sorted *.wav files"""
+        files = []
+        for path in paths:
+            path = Path(path).expanduser()
+            if path.is_dir():
+                files.extend(sorted(path.glob("*.wav")))
+            elif path.exists():
+                files.append(path)
+        return files
+
+    @property
+    def seconds_read(self) -> float:
+        return self.samples_read / self.sample_rate
+
+    def chunks(self) -> Iterator[np.ndarray]:
+        """Yield float32 chunks, sleeping between them in real-time mode"""
+        chunk_seconds = self.chunk_size / self.sample_rate
+        silence = np.zeros(int(self.tail_silence_seconds * self.sample_rate), dtype=np.float32)
+        started = time.monotonic()
+        emitted = 0
+
+        for path in self.files:
+            logger.info(f"Replaying {path}")
+            audio = np.concatenate([load_wav(path, self.sample_rate), silence])
+
+            for offset in range(0, len(audio), self.chunk_size):
+                chunk = audio[offset:offset + self.chunk_size]
+                if len(chunk) < self.chunk_size:
+                    chunk = np.pad(chunk, (0, self.chunk_size - len(chunk)))
+
+                if self.realtime:
+                    delay = started + emitted * chunk_seconds - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+
+                emitted += 1
+                self.samples_read += len(chunk)
+                yield chunk
@@ -0,0 +1,265 @@
+"""Bounded queues and worker stages for the audio processing pipeline"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class DropPolicy:
+    """What a stage queue does when it is full"""
+    BLOCK = "block"              # Producer waits (backpressure)
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest queued item
+    DROP_NEWEST = "drop_newest"  # Discard the incoming item
+
+    ALL = (BLOCK, DROP_OLDEST, DROP_NEWEST)
+
+
+class StageQueue:
+    """Bounded queue with a configurable overflow policy and counters"""
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 8,
+        policy: str = DropPolicy.DROP_OLDEST,
+        block_timeout: Optional[float] = None,
+    ):
+        if policy not in DropPolicy.ALL:
+            raise ValueError(f"Unknown drop policy: {policy}")
+
+        self.name = name
+        self.maxsize = maxsize
+        self.policy = policy
+        self.block_timeout = block_timeout
+
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+        self.enqueued = 0
+        self.dropped = 0
+        self.max_depth = 0
+
+    def put(self, item: Any) -> bool:
+        """
+        Add an item according to the drop policy.
+
+        Returns:
+            True if the item was queued, False if it was dropped
+        """
+        entry = (item, time.monotonic())
+
+        if self.policy == DropPolicy.BLOCK:
+            try:
+                self._queue.put(entry, timeout=self.block_timeout)
+            except queue.Full:
+                self._count_drop()
+                return False
+        else:
+            with self._lock:
+                try:
+                    self._queue.put_nowait(entry)
+                except queue.Full:
+                    if self.policy == DropPolicy.DROP_NEWEST:
+                        self._count_drop()
+                        return False
+                    # DROP_OLDEST: make room for the new item
+                    try:
+                        self._queue.get_nowait()
+                        self._queue.task_done()
+                        self._count_drop()
+                    except queue.Empty:
+                        pass
+                    self._queue.put_nowait(entry)
+
+        self.enqueued += 1
+        self.max_depth = max(self.max_depth, self._queue.qsize())
+        return True
+
+    def get(self, timeout: Optional[float] = None):
+        """
+        Get the next item.
+
+        Returns:
+            Tuple of (item, enqueued_at monotonic timestamp)
+
+        Raises:
+            queue.Empty if nothing arrived within the timeout
+        """
+        return self._queue.get(timeout=timeout)
+
+    def task_done(self):
+        """Mark an item from get() as fully handled"""
+        self._queue.task_done()
+
+    def clear(self):
+        """Discard all queued items"""
+        with self._lock:
+            while True:
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                except queue.Empty:
+                    break
+
+    def _count_drop(self):
+        self.dropped += 1
+        if self.dropped == 1 or self.dropped % 50 == 0:
+            logger.warning(f"Queue '{self.name}' full, dropped {self.dropped} item(s) so far")
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def unfinished(self) -> int:
+        """Items queued or taken by get() but not yet marked task_done()"""
+        return self._queue.unfinished_tasks
+
+
+@dataclass
+class StageMetrics:
+    """Counters and timings for a single pipeline stage"""
+    name: str
+    queue_depth: int = 0
+    queue_max_depth: int = 0
+    enqueued: int = 0
+    dropped: int = 0
+    processed: int = 0
+    errors: int = 0
+    last_latency_ms: float = 0.0
+    avg_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    avg_wait_ms: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "queue_depth": self.queue_depth,
+            "queue_max_depth": self.queue_max_depth,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "processed": self.processed,
+            "errors": self.errors,
+            "last_latency_ms": round(self.last_latency_ms, 1),
+            "avg_latency_ms": round(self.avg_latency_ms, 1),
+            "max_latency_ms": round(self.max_latency_ms, 1),
+            "avg_wait_ms": round(self.avg_wait_ms, 1),
+        }
+
+
+class PipelineStage:
+    """
+    Worker thread that consumes a StageQueue and runs a handler per item.
+
+    If the handler returns a value other than None and a downstream stage is
+    connected, the value is submitted to that stage.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Any], Any],
+        maxsize: int = 8,
+        policy: str = DropPolicy.DROP_OLDEST,
+        downstream: Optional["PipelineStage"] = None,
+    ):
+        self.name = name
+        self.handler = handler
+        self.downstream = downstream
+        self.input = StageQueue(name, maxsize=maxsize, policy=policy)
+
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._processed = 0
+        self._errors = 0
+        self._last_latency_ms = 0.0
+        self._total_latency_ms = 0.0
+        self._max_latency_ms = 0.0
+        self._total_wait_ms = 0.0
+
+    def start(self) -> None:
+        """Start the worker thread"""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name=f"stage-{self.name}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the worker thread, discarding anything still queued"""
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.input.clear()
+
+    def submit(self, item: Any) -> bool:
+        """Queue an item for this stage (never blocks unless policy is 'block')"""
+        return self.input.put(item)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until the queue is empty and the handler is not running"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.is_busy:
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _run(self):
+        """Worker loop"""
+        while self._running:
+            try:
+                item, enqueued_at = self.input.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            start = time.monotonic()
+            self._total_wait_ms += (start - enqueued_at) * 1000
+
+            try:
+                output = self.handler(item)
+                if output is not None and self.downstream is not None:
+                    self.downstream.submit(output)
+            except Exception as e:
+                self._errors += 1
+                logger.error(f"Stage '{self.name}' error: {e}")
+            finally:
+                latency_ms = (time.monotonic() - start) * 1000
+                self._processed += 1
+                self._last_latency_ms = latency_ms
+                self._total_latency_ms += latency_ms
+                self._max_latency_ms = max(self._max_latency_ms, latency_ms)
+                # After any downstream submit, so the item is always counted somewhere
+                self.input.task_done()
+
+    @property
+    def is_busy(self) -> bool:
+        """True from submit() until the handler has finished with the item"""
+        return self.input.unfinished > 0
+
+    @property
+    def metrics(self) -> StageMetrics:
+        """Snapshot of queue and latency metrics"""
+        processed = self._processed
+        return StageMetrics(
+            name=self.name,
+            queue_depth=self.input.depth,
+            queue_max_depth=self.input.max_depth,
+            enqueued=self.input.enqueued,
+            dropped=self.input.dropped,
+            processed=processed,
+            errors=self._errors,
+            last_latency_ms=self._last_latency_ms,
+            avg_latency_ms=self._total_latency_ms / processed if processed else 0.0,
+            max_latency_ms=self._max_latency_ms,
+            avg_wait_ms=self._total_wait_ms / processed if processed else 0.0,
+        )
@@ -0,0 +1,110 @@
+"""Fixed-capacity NumPy ring buffer for audio samples"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class AudioRingBuffer:
+    """
+    Preallocated circular buffer of samples.
+
+    Appending never allocates; once full, the oldest samples are overwritten.
+    Reads return either zero-copy views (views()) or a single contiguous copy
+    (read()).
+    """
+
+    def __init__(self, capacity: int, dtype=np.float32):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._buffer = np.zeros(capacity, dtype=dtype)
+        self._capacity = capacity
+        self._start = 0  # Index of the oldest sample
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def is_full(self) -> bool:
+        return self._size == self._capacity
+
+    @property
+    def free(self) -> int:
+        return self._capacity - self._size
+
+    def clear(self):
+        """Discard all samples (no deallocation)"""
+        self._start = 0
+        self._size = 0
+
+    def append(self, samples: np.ndarray) -> int:
+        """
+        Append samples, overwriting the oldest if capacity is exceeded.
+
+        Returns:
+            Number of old samples that were overwritten
+        """
+        n = len(samples)
+        if n == 0:
+            return 0
+
+        if n >= self._capacity:
+            # Only the newest `capacity` samples survive
+            overwritten = self._size + n - self._capacity
+            self._buffer[:] = samples[-self._capacity:]
+            self._start = 0
+            self._size = self._capacity
+            return overwritten
+
+        overwritten = max(0, self._size + n - self._capacity)
+        end = (self._start + self._size) % self._capacity
+        first = min(n, self._capacity - end)
+        self._buffer[end:end + first] = samples[:first]
+        if first < n:
+            self._buffer[:n - first] = samples[first:]
+
+        if overwritten:
+            self._start = (self._start + overwritten) % self._capacity
+        self._size = min(self._capacity, self._size + n)
+        return overwritten
+
+    def keep_last(self, n: int):
+        """Drop all but the newest n samples"""
+        if n >= self._size:
+            return
+        drop = self._size - max(0, n)
+        self._start = (self._start + drop) % self._capacity
+        self._size -= drop
+
+    def views(self, n: Optional[int] = None) -> Tuple[np.ndarray, ...]:
+        """
+        Zero-copy views of the newest n samples (all if None), oldest first.
+
+        Returns one view if the data is contiguous, otherwise two. The views
+        are invalidated by subsequent appends.
+        """
+        size = self._size if n is None else min(n, self._size)
+        if size == 0:
+            return (self._buffer[:0],)
+
+        begin = (self._start + self._size - size) % self._capacity
+        end = begin + size
+        if end <= self._capacity:
+            return (self._buffer[begin:end],)
+        return (self._buffer[begin:], self._buffer[:end - self._capacity])
+
+    def read(self, n: Optional[int] = None) -> np.ndarray:
+        """Copy the newest n samples (all if None) into one contiguous array"""
+        parts = self.views(n)
+        if len(parts) == 1:
+            return parts[0].copy()
+
+        out = np.empty(len(parts[0]) + len(parts[1]), dtype=self._buffer.dtype)
+        out[:len(parts[0])] = parts[0]
+        out[len(parts[0]):] = parts[1]
+        return out
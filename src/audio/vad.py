@@ -0,0 +1,242 @@
+"""Voice activity detection engines"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class VoiceActivityDetector(ABC):
+    """Abstract base class for per-chunk speech/non-speech decisions"""
+
+    def __init__(self):
+        self.chunks = 0
+        self.speech_chunks = 0
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Return the engine name"""
+        pass
+
+    @abstractmethod
+    def _detect(self, audio: np.ndarray) -> bool:
+        """Engine-specific decision for one float32 chunk"""
+        pass
+
+    def is_speech(self, audio: np.ndarray) -> bool:
+        """
+        Decide whether a chunk contains speech.
+
+        Args:
+            audio: float32 chunk normalized to -1.0 to 1.0
+
+        Returns:
+            True if the chunk looks like speech
+        """
+        speech = bool(self._detect(audio))
+        self.chunks += 1
+        if speech:
+            self.speech_chunks += 1
+        return speech
+
+    def reset(self):
+        """Reset adaptive state"""
+        pass
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "engine": self.name,
+            "chunks": self.chunks,
+            "speech_chunks": self.speech_chunks,
+            "speech_ratio": round(self.speech_chunks / self.chunks, 3) if self.chunks else 0.0,
+        }
+
+
+class EnergyVAD(VoiceActivityDetector):
+    """RMS energy threshold (original behaviour)"""
+
+    def __init__(self, threshold: float = 0.5):
+        super().__init__()
+        self.threshold = threshold
+
+    @property
+    def name(self) -> str:
+        return "energy"
+
+    def _detect(self, audio: np.ndarray) -> bool:
+        energy = np.sqrt(np.mean(audio ** 2))
+        return energy > self.threshold * 0.01
+
+
+class SpectralVAD(VoiceActivityDetector):
+    """
+    Speech-band energy, zero-crossing rate and an adaptive noise floor.
+
+    A chunk is speech when its 300-3400 Hz energy is well above the tracked
+    noise floor, enough of its energy is in the speech band (rejects fan rumble
+    and hiss) and its zero-crossing rate is in the voiced range (rejects
+    clicks and keyboard noise).
+
+    The noise floor falls quickly but not instantly (so a moment of silence
+    or an all-zero chunk from a muted device cannot pin it at min_energy),
+    and rises slowly on non-speech. A sound classed as speech for longer
+    than max_speech_seconds is steady noise, so the floor then adapts to it
+    as well.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        band_hz: Tuple[float, float] = (300.0, 3400.0),
+        snr_db: float = 6.0,
+        min_band_ratio: float = 0.3,
+        zcr_range: Tuple[float, float] = (0.01, 0.5),
+        noise_adapt_rate: float = 0.05,
+        noise_fall_rate: float = 0.3,
+        max_speech_seconds: float = 15.0,
+        min_energy: float = 1e-7,
+    ):
+        super().__init__()
+        self.sample_rate = sample_rate
+        self.band_hz = band_hz
+        self.snr = 10 ** (snr_db / 10)
+        self.min_band_ratio = min_band_ratio
+        self.zcr_range = zcr_range
+        self.noise_adapt_rate = noise_adapt_rate
+        self.noise_fall_rate = noise_fall_rate
+        self.max_speech_seconds = max_speech_seconds
+        self.min_energy = min_energy
+
+        self._noise_floor: Optional[float] = None
+        self._speech_seconds = 0.0  # Length of the current run of speech chunks
+        # Window and band mask depend only on chunk length; computed once each
+        self._windows: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    @property
+    def name(self) -> str:
+        return "spectral"
+
+    @property
+    def noise_floor(self) -> Optional[float]:
+        return self._noise_floor
+
+    def reset(self):
+        self._noise_floor = None
+        self._speech_seconds = 0.0
+
+    def _window(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        cached = self._windows.get(n)
+        if cached is None:
+            freqs = np.fft.rfftfreq(n, d=1.0 / self.sample_rate)
+            mask = (freqs >= self.band_hz[0]) & (freqs <= self.band_hz[1])
+            cached = (np.hanning(n).astype(np.float32), mask)
+            self._windows[n] = cached
+        return cached
+
+    def _detect(self, audio: np.ndarray) -> bool:
+        n = len(audio)
+        if n < 2:
+            return False
+
+        window, mask = self._window(n)
+        power = np.abs(np.fft.rfft(audio * window)) ** 2
+        total = float(power.sum()) / n
+        band = float(power[mask].sum()) / n
+        band_ratio = band / total if total > 0 else 0.0
+
+        signs = np.signbit(audio)
+        zcr = np.count_nonzero(signs[1:] != signs[:-1]) / (n - 1)
+
+        if self._noise_floor is None:
+            self._noise_floor = max(band, self.min_energy)
+            return False
+
+        speech = (
+            band > self._noise_floor * self.snr
+            and band > self.min_energy
+            and band_ratio >= self.min_band_ratio
+            and self.zcr_range[0] <= zcr <= self.zcr_range[1]
+        )
+
+        self._speech_seconds = self._speech_seconds + n / self.sample_rate if speech else 0.0
+
+        # Track the floor: fall quickly, rise slowly on non-speech (or on
+        # "speech" that has gone on too long to be anything but noise)
+        if band < self._noise_floor:
+            a = self.noise_fall_rate
+            self._noise_floor = max((1 - a) * self._noise_floor + a * band, self.min_energy)
+        elif not speech or self._speech_seconds > self.max_speech_seconds:
+            a = self.noise_adapt_rate
+            self._noise_floor = (1 - a) * self._noise_floor + a * band
+
+        return speech
+
+
+class WebRtcVAD(VoiceActivityDetector):
+    """Google WebRTC VAD (requires the optional webrtcvad package)"""
+
+    FRAME_MS = 30
+
+    def __init__(self, sample_rate: int = 16000, aggressiveness: int = 2, min_voiced_ratio: float = 0.5):
+        super().__init__()
+        import webrtcvad
+
+        if sample_rate not in (8000, 16000, 32000, 48000):
+            raise ValueError(f"webrtcvad does not support {sample_rate} Hz")
+
+        self.sample_rate = sample_rate
+        self.min_voiced_ratio = min_voiced_ratio
+        self._vad = webrtcvad.Vad(aggressiveness)
+        self._frame = int(sample_rate * self.FRAME_MS / 1000)
+
+    @property
+    def name(self) -> str:
+        return "webrtc"
+
+    def _detect(self, audio: np.ndarray) -> bool:
+        pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+        frames = len(pcm) // self._frame
+        if frames == 0:
+            return False
+
+        voiced = 0
+        for i in range(frames):
+            frame = pcm[i * self._frame:(i + 1) * self._frame].tobytes()
+            if self._vad.is_speech(frame, self.sample_rate):
+                voiced += 1
+        return voiced / frames >= self.min_voiced_ratio
+
+
+def create_vad(audio_config: dict, sample_rate: int = 16000) -> VoiceActivityDetector:
+    """
+    Build a VAD engine from the 'audio' settings section.
+
+    Falls back to the spectral engine if webrtcvad is requested but not installed.
+    """
+    engine = audio_config.get('vad_engine', 'energy')
+
+    if engine == 'webrtc':
+        try:
+            return WebRtcVAD(
+                sample_rate=sample_rate,
+                aggressiveness=audio_config.get('vad_aggressiveness', 2),
+            )
+        except ImportError:
+            logger.warning("webrtcvad not available, falling back to spectral VAD")
+            engine = 'spectral'
+
+    if engine == 'spectral':
+        return SpectralVAD(
+            sample_rate=sample_rate,
+            snr_db=audio_config.get('vad_snr_db', 6.0),
+            min_band_ratio=audio_config.get('vad_band_ratio', 0.3),
+        )
+
+    if engine != 'energy':
+        logger.warning(f"Unknown VAD engine '{engine}', using energy")
+    return EnergyVAD(threshold=audio_config.get('vad_threshold', 0.5))
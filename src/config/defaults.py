@@ -14,14 +14,42 @@ Keep responses under 150 words. Be accurate - this will be used in live customer
 DEFAULT_SETTINGS = {
     "audio": {
         "device": "default",
+        "backend": "blocking",  # blocking (read loop) or callback (PortAudio callback)
         "sample_rate": 16000,
         "chunk_duration_ms": 100,
-        "vad_threshold": 0.5,
+        "vad_engine": "energy",      # energy, spectral or webrtc (needs webrtcvad)
+        "vad_threshold": 0.5,        # energy engine
+        "vad_snr_db": 6.0,           # spectral engine: dB above noise floor
+        "vad_band_ratio": 0.3,       # spectral engine: min 300-3400 Hz energy share
+        "vad_aggressiveness": 2,     # webrtc engine: 0-3
+        "max_utterance_seconds": 30,  # Longer speech is flushed in pieces
     },
     "speech": {
         "model": "whisper-1",  # API model (or tiny/base/small for local)
         "language": "en",
         "use_api": True,  # Use OpenAI API for better compatibility
+        "upload_format": "flac",  # wav, flac or ogg (compressed needs soundfile)
+        "base_url": "",  # Override API endpoint, e.g. http://127.0.0.1:8765/v1 (src.tools.mockapi)
+        "cache": {
+            "enabled": False,  # Also cache live meetings (kept until evicted, outside logging retention)
+            "replay": True,  # Cache --replay runs, so re-running a recording skips ASR
+            "path": "",  # Default: ~/MeetingAssistant/cache/transcripts.sqlite3
+            "memory_max_entries": 512,
+            "disk_max_entries": 20000,
+            "disk_enabled": True,
+        },
+        "streaming": {
+            "enabled": False,  # Transcribe partial windows during speech for earlier triggers
+            "interval_ms": 600,  # How often to transcribe the utterance in progress
+            "window_seconds": 6.0,  # Newest audio included in each partial
+            "stable_partials": 2,  # Consecutive partials with the same topic before research starts
+        },
+        "local_worker": {
+            "enabled": True,  # Local mode: load and warm the model in a separate process at startup
+            "slots": 4,  # Shared-memory audio buffers (requests queued; the worker transcribes one at a time)
+            "batch_size": 0,  # >0: decode one utterance's 30 s windows in batches (faster-whisper BatchedInferencePipeline)
+            "slot_timeout_seconds": 30,  # Fail an utterance if no slot frees up (worker hung)
+        },
     },
     "triggers": {
         "research": [
@@ -44,6 +72,14 @@ DEFAULT_SETTINGS = {
             "stop recording",
         ],
         "custom": [],
+        "fuzzy": {
+            "enabled": False,  # Also accept near-misses such as "did ya say" or "lookup" (research triggers only)
+            "min_score": 0.8,  # Minimum similarity (0-1); also reported as the match confidence
+            "phonetic_weight": 0.5,  # Share of the score from sound-alike keys vs spelling
+            "min_phrase_chars": 5,  # Shorter phrases only match exactly
+            "min_spelling_score": 0.85,  # Spelling similarity required on its own (rejects sound-alikes)
+            "reduction_score": 0.9,  # Score factor for expanded reductions ("what's", "ya")
+        },
     },
     "research": {
         "default_provider": "openai",
@@ -53,23 +89,62 @@ DEFAULT_SETTINGS = {
         "temperature": 0.3,
         "timeout_seconds": 15,
         "web_search": True,
+        "streaming": True,  # Render responses in the overlay as they arrive
+        "coalesce_requests": True,  # Concurrent requests for the same topic share one provider call
+        "latest_wins": True,  # A new trigger cancels the research still running for the overlay
+        "fallback_chain": [],  # Providers to try after default_provider fails; empty: all enabled
+        "health": {
+            "window": 20,  # Requests in the rolling error rate
+            "min_requests": 5,  # Before the error rate can open a circuit
+            "failure_rate": 0.5,  # Error rate that opens a circuit
+            "consecutive_failures": 3,  # Failures in a row that open a circuit
+            "open_seconds": 30,  # Skip an open provider this long, then send one trial request
+            "max_open_seconds": 300,  # Cap for the cool-down, which doubles while trials fail
+        },
+        "prefetch": {
+            "enabled": False,  # Research names heard in conversation before anyone asks (uses API budget)
+            "rate_per_minute": 4,  # Sustained prefetch rate
+            "max_requests": 60,  # Prefetch budget per session
+            "max_in_flight": 1,
+            "queue_size": 8,  # Newest candidates kept; older ones are dropped
+            "max_age_seconds": 60,  # Candidates not reached by then are dropped
+            "dictionary": [],  # Known product names, matched even when lowercase
+        },
+        "hedging": {
+            "enabled": False,  # Race a second provider when the first is slow to respond
+            "secondary_provider": "",  # Empty: first enabled provider other than default_provider
+            "first_token_budget_ms": 1200,  # Wait this long for a first token before hedging
+            "probe_every": 10,  # Let every Nth losing primary reach its first token to estimate savings (0: never)
+        },
+        "cache": {
+            "enabled": True,
+            "path": "~/MeetingAssistant/cache/research.sqlite3",
+            "memory_max_entries": 256,   # In-process LRU size
+            "disk_max_entries": 5000,    # SQLite store size cap (LRU-evicted)
+            "ttl_seconds": 604800,       # 7 days
+            "disk_enabled": True,
+        },
     },
     "api": {
         "openai": {
             "model": "gpt-4o-mini",
             "enabled": True,
+            "base_url": "",  # Override API endpoint (e.g. local mock server)
         },
         "deepseek": {
             "model": "deepseek-chat",
-            "enabled": False,
+            "enabled": False,  # Needs DEEPSEEK_API_KEY
+            "base_url": "",
         },
         "gemini": {
             "model": "gemini-1.5-flash",
-            "enabled": False,
+            "enabled": False,  # Needs GEMINI_API_KEY
+            "base_url": "",
         },
         "glm": {
             "model": "glm-4",
-            "enabled": False,
+            "enabled": False,  # Needs GLM_API_KEY
+            "base_url": "",
         },
     },
     "overlay": {
@@ -81,6 +156,15 @@ DEFAULT_SETTINGS = {
         "max_visible": 3,
         "animation_ms": 200,
     },
+    "pipeline": {
+        # Bounded queues between stages; policy is one of
+        # "drop_oldest", "drop_newest" or "block" (backpressure)
+        "vad": {"queue_size": 50, "drop_policy": "drop_oldest"},
+        "asr": {"queue_size": 8, "drop_policy": "drop_oldest"},
+        "trigger": {"queue_size": 16, "drop_policy": "drop_oldest"},
+        "research": {"queue_size": 4, "drop_policy": "drop_oldest"},
+        "partial": {"queue_size": 1, "drop_policy": "drop_oldest"},  # Only the newest window matters
+    },
     "transcription": {
         "auto_stop_silence_seconds": 5,
         "max_duration_seconds": 60,
@@ -98,6 +182,9 @@ DEFAULT_SETTINGS = {
     "logging": {
         "level": "INFO",
         "log_dir": "~/MeetingAssistant/logs",
-        "retain_days": 30,
+        "retain_days": 30,  # Delete sessions older than this (0 keeps everything)
+        "archive_after_days": 7,  # Pack older days into YYYY-MM-DD.tar.gz (0 disables)
+        "writer_queue_size": 1000,  # Pending writes before log calls block
+        "index_enabled": True,  # SQLite index of past sessions (index.sqlite3 in log_dir)
     },
 }
@@ -0,0 +1,5 @@
+"""Search over past meeting sessions"""
+
+from .search import HistorySearch, SearchHit, build_query
+
+__all__ = ['HistorySearch', 'SearchHit', 'build_query']
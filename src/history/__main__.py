@@ -0,0 +1,96 @@
+"""
+Command line history search.
+
+    python -m src.history search "exabeam" --from 2024-05-01
+    python -m src.history search "zero trust" --kind transcript --json
+    python -m src.history reindex
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from ..config import SettingsManager
+from .search import KINDS, HistorySearch
+
+
+def _log_dir(args) -> Path:
+    if args.log_dir:
+        return Path(args.log_dir).expanduser()
+    return SettingsManager().get_log_dir()
+
+
+def _search(args) -> int:
+    history = HistorySearch.open(_log_dir(args))
+    try:
+        hits = history.search(
+            " ".join(args.query),
+            kind=args.kind,
+            date_from=args.date_from,
+            date_to=args.date_to,
+            limit=args.limit,
+            offset=args.offset,
+            match_any=args.any,
+            raw=args.raw,
+            sort=args.sort,
+        )
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    finally:
+        history.close()
+
+    if args.json:
+        print(json.dumps([hit.to_dict() for hit in hits], indent=2))
+        return 0
+
+    if not hits:
+        print("No matches")
+        return 1
+
+    for hit in hits:
+        when = (hit.timestamp or hit.date or "")[:16].replace("T", " ")
+        label = "research" if hit.kind == "search" else "transcript"
+        print(f"{when}  [{label}] {hit.title}")
+        print(f"    {hit.highlighted(chr(27) + '[1m', chr(27) + '[0m') if sys.stdout.isatty() else hit.highlighted()}")
+    return 0
+
+
+def _reindex(args) -> int:
+    history = HistorySearch.open(_log_dir(args), refresh=False)
+    try:
+        count = history.index.rebuild(_log_dir(args))
+    finally:
+        history.close()
+    print(f"Indexed {count} session(s)")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.history", description="Search past meeting sessions")
+    parser.add_argument("--log-dir", help="Session log directory (default: from settings)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    search = commands.add_parser("search", help="Full-text search over transcripts and research results")
+    search.add_argument("query", nargs="+", help="Words to search for")
+    search.add_argument("--kind", choices=KINDS, help="Only research results or only transcripts")
+    search.add_argument("--from", dest="date_from", metavar="YYYY-MM-DD", help="Earliest day")
+    search.add_argument("--to", dest="date_to", metavar="YYYY-MM-DD", help="Latest day")
+    search.add_argument("--limit", type=int, default=20)
+    search.add_argument("--offset", type=int, default=0)
+    search.add_argument("--any", action="store_true", help="Match any word instead of all")
+    search.add_argument("--raw", action="store_true", help="Treat the query as FTS5 syntax")
+    search.add_argument("--sort", choices=("rank", "date"), default="rank")
+    search.add_argument("--json", action="store_true", help="Print hits as JSON")
+    search.set_defaults(func=_search)
+
+    reindex = commands.add_parser("reindex", help="Rebuild the index from the session files")
+    reindex.set_defaults(func=_reindex)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""Full-text search over past transcripts and research results"""
+
+import re
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+import logging
+
+from ..logging.index import SessionIndex
+
+logger = logging.getLogger(__name__)
+
+KINDS = ("search", "transcript")
+
+# Snippet markers; the CLI renders them as highlighting
+MATCH_START = "\x02"
+MATCH_END = "\x03"
+
+
+@dataclass
+class SearchHit:
+    """One ranked match"""
+    kind: str  # "search" or "transcript"
+    session_id: str
+    date: str
+    timestamp: Optional[str]
+    title: str  # Research topic or transcript trigger
+    snippet: str
+    score: float  # Higher is better
+
+    def to_dict(self) -> dict:
+        return {
+            "kind": self.kind,
+            "session_id": self.session_id,
+            "date": self.date,
+            "timestamp": self.timestamp,
+            "title": self.title,
+            "snippet": self.highlighted(),
+            "score": round(self.score, 3),
+        }
+
+    def highlighted(self, start: str = "[", end: str = "]") -> str:
+        return self.snippet.replace(MATCH_START, start).replace(MATCH_END, end)
+
+
+def build_query(text: str, match_any: bool = False) -> str:
+    """
+    Turn free text into an FTS5 query.
+
+    Each word becomes a quoted prefix term, so punctuation in the input can't
+    produce FTS5 syntax errors. Terms are ANDed unless match_any is set.
+    """
+    terms = [f'"{word}"*' for word in re.findall(r"\w+", text, re.UNICODE)]
+    return (" OR " if match_any else " ").join(terms)
+
+
+class HistorySearch:
+    """
+    Ranked full-text search over the session index.
+
+    Topics weigh more than summary/transcript text; results can be filtered
+    by kind and date range and are paged with limit/offset.
+    """
+
+    TITLE_WEIGHT = 5.0
+    BODY_WEIGHT = 1.0
+
+    def __init__(self, index: SessionIndex):
+        self.index = index
+
+    @classmethod
+    def open(cls, log_dir: Path, refresh: bool = True) -> "HistorySearch":
+        """Open the index in a log directory, indexing any new session files"""
+        log_dir = Path(log_dir)
+        # The app may be running: leave its live session to it
+        index = SessionIndex(log_dir / "index.sqlite3", recover_live=False)
+        if refresh:
+            index.backfill(log_dir)
+        return cls(index)
+
+    def search(
+        self,
+        text: str,
+        kind: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+        match_any: bool = False,
+        raw: bool = False,
+        sort: str = "rank",
+    ) -> List[SearchHit]:
+        """
+        Search transcripts, topics and research summaries.
+
+        Args:
+            text: Words to look for (or an FTS5 expression with raw=True)
+            kind: Restrict to "search" or "transcript"
+            date_from: Earliest day to include (YYYY-MM-DD)
+            date_to: Latest day to include (YYYY-MM-DD)
+            limit: Page size
+            offset: Hits to skip
+            match_any: Match any word instead of all words
+            raw: Pass text through as FTS5 query syntax
+            sort: "rank" (best match first) or "date" (newest first)
+
+        Returns:
+            Ranked hits
+        """
+        query = text if raw else build_query(text, match_any)
+        if not query:
+            return []
+        if kind is not None and kind not in KINDS:
+            raise ValueError(f"Unknown kind '{kind}', expected one of {KINDS}")
+
+        clauses = ["history_fts MATCH ?"]
+        params: list = [query]
+        if kind:
+            clauses.append("kind = ?")
+            params.append(kind)
+        if date_from:
+            clauses.append("date >= ?")
+            params.append(date_from)
+        if date_to:
+            clauses.append("date <= ?")
+            params.append(date_to)
+
+        order = "timestamp DESC" if sort == "date" else "score"
+        sql = f"""
+            SELECT kind, session_id, date, timestamp, title,
+                   snippet(history_fts, -1, '{MATCH_START}', '{MATCH_END}', '…', 16) AS snippet,
+                   bm25(history_fts, {self.TITLE_WEIGHT}, {self.BODY_WEIGHT}) AS score
+            FROM history_fts
+            WHERE {" AND ".join(clauses)}
+            ORDER BY {order}
+            LIMIT ? OFFSET ?
+        """
+        try:
+            rows = self.index.query(sql, (*params, limit, offset))
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query {query!r}: {e}") from e
+
+        # bm25() is lower-is-better; flip it so callers can sort descending
+        return [
+            SearchHit(
+                kind=row["kind"],
+                session_id=row["session_id"],
+                date=row["date"],
+                timestamp=row["timestamp"],
+                title=row["title"] or "",
+                snippet=row["snippet"] or "",
+                score=-row["score"],
+            )
+            for row in rows
+        ]
+
+    def close(self):
+        self.index.close()
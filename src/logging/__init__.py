@@ -1,3 +1,5 @@
+from .index import SessionIndex
+from .retention import RetentionJob
 from .session import SessionLogger
 
-__all__ = ['SessionLogger']
+__all__ = ['RetentionJob', 'SessionIndex', 'SessionLogger']
@@ -0,0 +1,77 @@
+"""Packed day directories: one tar.gz per day of session logs"""
+
+import os
+import re
+import shutil
+import tarfile
+from pathlib import Path
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_SUFFIX = ".tar.gz"
+DAY_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def archive_path_for(date_dir: Path) -> Path:
+    """Archive file that replaces a day directory"""
+    date_dir = Path(date_dir)
+    return date_dir.with_name(date_dir.name + ARCHIVE_SUFFIX)
+
+
+def pack_day(date_dir: Path) -> Path:
+    """
+    Pack a day directory into YYYY-MM-DD.tar.gz and remove the directory.
+
+    The archive is written to a temporary name and renamed into place before
+    the directory is deleted, so an interruption never loses data.
+    """
+    date_dir = Path(date_dir)
+    archive = archive_path_for(date_dir)
+    tmp = archive.with_name(archive.name + ".tmp")
+
+    with tarfile.open(tmp, "w:gz") as tar:
+        for path in sorted(date_dir.rglob("*")):
+            if path.is_file():
+                tar.add(path, arcname=f"{date_dir.name}/{path.relative_to(date_dir).as_posix()}")
+    os.replace(tmp, archive)
+    shutil.rmtree(date_dir)
+    return archive
+
+
+def archive_members(archive: Path) -> Dict[str, float]:
+    """Map member paths (YYYY-MM-DD/...) to their modification times"""
+    with tarfile.open(archive, "r:gz") as tar:
+        return {member.name: float(member.mtime) for member in tar.getmembers() if member.isfile()}
+
+
+def read_log_file(path: Path) -> Optional[bytes]:
+    """
+    Read a file in the log tree, whether it is on disk or packed.
+
+    Paths keep their original form (log_dir/YYYY-MM-DD/...) after the day is
+    archived, so index rows and session references stay valid.
+    """
+    path = Path(path)
+    if path.exists():
+        return path.read_bytes()
+
+    # Walk up to the day directory and look for its archive
+    for date_dir in path.parents:
+        if not DAY_PATTERN.match(date_dir.name):
+            continue
+        archive = archive_path_for(date_dir)
+        if archive.exists():
+            member = f"{date_dir.name}/{path.relative_to(date_dir).as_posix()}"
+            try:
+                with tarfile.open(archive, "r:gz") as tar:
+                    extracted = tar.extractfile(member)
+                    return extracted.read() if extracted is not None else None
+            except KeyError:
+                return None
+            except (OSError, tarfile.TarError) as e:
+                logger.error(f"Error reading {member} from {archive}: {e}")
+                return None
+        break
+    return None
@@ -0,0 +1,521 @@
+"""SQLite index over past sessions for fast history queries"""
+
+import os
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import logging
+
+from .archive import ARCHIVE_SUFFIX, archive_members, read_log_file
+from .journal import load_session
+
+logger = logging.getLogger(__name__)
+
+# Bump when the schema changes; the index is rebuilt from the session files
+SCHEMA_VERSION = 5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    file TEXT NOT NULL UNIQUE,
+    date TEXT NOT NULL,
+    started_at TEXT,
+    ended_at TEXT,
+    meeting_context TEXT NOT NULL DEFAULT '',
+    search_count INTEGER NOT NULL DEFAULT 0,
+    transcript_count INTEGER NOT NULL DEFAULT 0,
+    live INTEGER NOT NULL DEFAULT 0,
+    owner_pid INTEGER,  -- Process writing a live session
+    indexed_mtime REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_started ON sessions(started_at);
+CREATE INDEX IF NOT EXISTS idx_sessions_date ON sessions(date);
+
+CREATE TABLE IF NOT EXISTS searches (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL REFERENCES sessions(session_id) ON DELETE CASCADE,
+    timestamp TEXT,
+    trigger_phrase TEXT,
+    topic TEXT,
+    topic_norm TEXT,
+    response TEXT,
+    provider TEXT,
+    model TEXT,
+    latency_ms INTEGER,
+    first_token_ms INTEGER,
+    success INTEGER,
+    error TEXT,
+    cached INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_searches_session ON searches(session_id);
+CREATE INDEX IF NOT EXISTS idx_searches_topic ON searches(topic_norm);
+CREATE INDEX IF NOT EXISTS idx_searches_timestamp ON searches(timestamp);
+
+CREATE TABLE IF NOT EXISTS transcript_segments (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL REFERENCES sessions(session_id) ON DELETE CASCADE,
+    timestamp TEXT,
+    trigger TEXT,
+    duration_seconds REAL,
+    transcript TEXT,
+    file TEXT,
+    text TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_segments_session ON transcript_segments(session_id);
+
+-- Day archives already scanned, so backfill doesn't have to decompress them again
+CREATE TABLE IF NOT EXISTS archives (
+    name TEXT PRIMARY KEY,
+    mtime REAL NOT NULL
+);
+
+-- Full-text index over research topics/summaries and full transcripts,
+-- kept in sync with the tables above by triggers. Rows are keyed by rowid
+-- (search id * 2, segment id * 2 + 1) so deletes are point lookups; the
+-- UNINDEXED columns can only be scanned
+CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5(
+    title,
+    body,
+    kind UNINDEXED,
+    ref_id UNINDEXED,
+    session_id UNINDEXED,
+    date UNINDEXED,
+    timestamp UNINDEXED,
+    tokenize = 'porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS searches_fts_insert AFTER INSERT ON searches BEGIN
+    INSERT INTO history_fts (rowid, title, body, kind, ref_id, session_id, date, timestamp)
+    VALUES (new.id * 2, new.topic, new.response, 'search', new.id, new.session_id,
+            (SELECT date FROM sessions WHERE session_id = new.session_id), new.timestamp);
+END;
+CREATE TRIGGER IF NOT EXISTS searches_fts_delete AFTER DELETE ON searches BEGIN
+    DELETE FROM history_fts WHERE rowid = old.id * 2;
+END;
+
+CREATE TRIGGER IF NOT EXISTS segments_fts_insert AFTER INSERT ON transcript_segments BEGIN
+    INSERT INTO history_fts (rowid, title, body, kind, ref_id, session_id, date, timestamp)
+    VALUES (new.id * 2 + 1, new.trigger, COALESCE(new.text, new.transcript), 'transcript', new.id, new.session_id,
+            (SELECT date FROM sessions WHERE session_id = new.session_id), new.timestamp);
+END;
+CREATE TRIGGER IF NOT EXISTS segments_fts_delete AFTER DELETE ON transcript_segments BEGIN
+    DELETE FROM history_fts WHERE rowid = old.id * 2 + 1;
+END;
+"""
+
+DROP_SCHEMA = """
+DROP TABLE IF EXISTS archives;
+DROP TABLE IF EXISTS history_fts;
+DROP TABLE IF EXISTS transcript_segments;
+DROP TABLE IF EXISTS searches;
+DROP TABLE IF EXISTS sessions;
+"""
+
+
+def _session_files(date_dir: Path) -> Dict[Path, float]:
+    """Map each session's JSON path to the newest mtime of its JSON/journal files"""
+    files: Dict[Path, float] = {}
+    for pattern in ("session_*.json", "session_*.jsonl"):
+        for path in date_dir.glob(pattern):
+            key = path.with_suffix(".json")
+            files[key] = max(files.get(key, 0.0), path.stat().st_mtime)
+    return files
+
+
+def _archived_session_files(archive: Path) -> Dict[Path, float]:
+    """Same as _session_files for a packed day, keyed by the original paths"""
+    files: Dict[Path, float] = {}
+    for member, mtime in archive_members(archive).items():
+        name = member.rsplit("/", 1)[-1]
+        if member.count("/") == 1 and name.startswith("session_") and name.endswith((".json", ".jsonl")):
+            key = (archive.parent / member).with_suffix(".json")
+            files[key] = max(files.get(key, 0.0), mtime)
+    return files
+
+
+def _process_alive(pid: Optional[int]) -> bool:
+    """Whether a process with this id is running"""
+    if not pid:
+        return False
+    if pid == os.getpid():
+        return True
+    if sys.platform == "win32":
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return ctypes.GetLastError() == 5  # ERROR_ACCESS_DENIED: exists, owned by someone else
+        try:
+            code = ctypes.c_ulong()
+            kernel32.GetExitCodeProcess(handle, ctypes.byref(code))
+            return code.value == 259  # STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SessionIndex:
+    """
+    Persistent index of sessions, searches and transcript segments.
+
+    The running session is indexed incrementally by SessionLogger (rows
+    marked live, with the writing process's id); sessions written before the
+    index existed, or left behind by a crash, are picked up by `backfill`,
+    which only stats files and parses the ones that are new or changed.
+    """
+
+    def __init__(self, path: Path, recover_live: bool = True):
+        """
+        Args:
+            path: SQLite file
+            recover_live: Hand live rows whose process has exited (a crashed
+                session) back to backfill. Readers opening the index while
+                the app may be running (e.g. the history CLI) pass False.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA foreign_keys=ON")
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            # Everything in the index can be re-read from the session files
+            self._db.executescript(DROP_SCHEMA)
+            self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._db.executescript(SCHEMA)
+        if recover_live:
+            self._recover_live()
+        self._db.commit()
+
+    def _recover_live(self):
+        """
+        Live rows whose writer has exited belong to a crashed session; let
+        backfill re-read them from their journal. Sessions still being
+        written by another running process are left alone.
+        """
+        crashed = [
+            (row["session_id"],)
+            for row in self._db.execute("SELECT session_id, owner_pid FROM sessions WHERE live = 1")
+            if not _process_alive(row["owner_pid"])
+        ]
+        self._db.executemany(
+            "UPDATE sessions SET live = 0, indexed_mtime = 0 WHERE session_id = ?", crashed
+        )
+
+    # Incremental updates (called from the session writer thread)
+
+    def start_session(self, session_id: str, file: Path, started_at: str):
+        """Register the running session"""
+        file = Path(file)
+        with self._lock:
+            self._db.execute(
+                """INSERT OR REPLACE INTO sessions (session_id, file, date, started_at, live, owner_pid)
+                   VALUES (?, ?, ?, ?, 1, ?)""",
+                (session_id, str(file), file.parent.name, started_at, os.getpid()),
+            )
+
+    def set_meeting_context(self, session_id: str, context: str):
+        with self._lock:
+            self._db.execute(
+                "UPDATE sessions SET meeting_context = ? WHERE session_id = ?",
+                (context, session_id),
+            )
+
+    def add_search(self, session_id: str, entry: Dict[str, Any]):
+        with self._lock:
+            self._insert_search(session_id, entry)
+            self._db.execute(
+                "UPDATE sessions SET search_count = search_count + 1 WHERE session_id = ?",
+                (session_id,),
+            )
+
+    def add_transcript_segment(self, session_id: str, entry: Dict[str, Any], text: Optional[str] = None):
+        """Index a segment; text is the full transcript (the entry holds a preview)"""
+        with self._lock:
+            self._insert_segment(session_id, entry, text)
+            self._db.execute(
+                "UPDATE sessions SET transcript_count = transcript_count + 1 WHERE session_id = ?",
+                (session_id,),
+            )
+
+    def end_session(self, session_id: str, ended_at: str, mtime: float = 0.0):
+        """Mark the session finished; mtime is that of its final JSON file"""
+        with self._lock:
+            self._db.execute(
+                "UPDATE sessions SET ended_at = ?, live = 0, indexed_mtime = ? WHERE session_id = ?",
+                (ended_at, mtime, session_id),
+            )
+            self._db.commit()
+
+    def commit(self):
+        """Commit pending incremental updates (once per writer batch)"""
+        with self._lock:
+            self._db.commit()
+
+    # Backfill
+
+    def index_session(self, file: Path, data: Dict[str, Any], mtime: float = 0.0):
+        """Replace a session's rows with the contents of a loaded session file"""
+        file = Path(file)
+        session_id = data.get("session_id")
+        if not session_id:
+            return
+
+        with self._lock:
+            self._db.execute("DELETE FROM sessions WHERE session_id = ? OR file = ?",
+                             (session_id, str(file)))
+            searches = data.get("searches", [])
+            segments = data.get("transcript_segments", [])
+            self._db.execute(
+                """INSERT INTO sessions (session_id, file, date, started_at, ended_at,
+                       meeting_context, search_count, transcript_count, live, indexed_mtime)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, ?)""",
+                (session_id, str(file), file.parent.name, data.get("started_at"),
+                 data.get("ended_at"), data.get("meeting_context") or "",
+                 len(searches), len(segments), mtime),
+            )
+            for entry in searches:
+                self._insert_search(session_id, entry)
+            for entry in segments:
+                self._insert_segment(session_id, entry, self._read_segment_text(file, entry))
+
+    def backfill(self, log_dir: Path) -> int:
+        """
+        Index new or changed session files and drop rows for deleted ones.
+
+        Returns:
+            Number of sessions (re)indexed
+        """
+        log_dir = Path(log_dir)
+        with self._lock:
+            known = {
+                Path(row["file"]): (row["indexed_mtime"], row["live"])
+                for row in self._db.execute("SELECT file, indexed_mtime, live FROM sessions")
+            }
+            scanned = {
+                row["name"]: row["mtime"] for row in self._db.execute("SELECT name, mtime FROM archives")
+            }
+
+        on_disk: Dict[Path, float] = {}
+        archives: Dict[str, float] = {}
+        if log_dir.exists():
+            for date_dir in log_dir.iterdir():
+                if date_dir.is_dir():
+                    on_disk.update(_session_files(date_dir))
+                elif date_dir.name.endswith(ARCHIVE_SUFFIX):
+                    mtime = date_dir.stat().st_mtime
+                    archives[date_dir.name] = mtime
+                    if scanned.get(date_dir.name) == mtime:
+                        # Unchanged since it was last scanned: its sessions are indexed
+                        day = date_dir.name[:-len(ARCHIVE_SUFFIX)]
+                        on_disk.update({
+                            file: state[0] for file, state in known.items() if file.parent.name == day
+                        })
+                        continue
+                    try:
+                        on_disk.update(_archived_session_files(date_dir))
+                    except Exception as e:
+                        logger.error(f"Error reading archive {date_dir}: {e}")
+                        archives.pop(date_dir.name)
+
+        indexed = 0
+        for file, mtime in on_disk.items():
+            previous = known.get(file)
+            # Live sessions are kept current by SessionLogger itself
+            if previous is not None and (previous[1] or previous[0] >= mtime):
+                continue
+            try:
+                data = load_session(file)
+            except Exception as e:
+                logger.error(f"Error indexing session {file}: {e}")
+                continue
+            if data is not None:
+                self.index_session(file, data, mtime)
+                indexed += 1
+
+        with self._lock:
+            for file in set(known) - set(on_disk):
+                self._db.execute("DELETE FROM sessions WHERE file = ?", (str(file),))
+            self._db.execute("DELETE FROM archives")
+            self._db.executemany("INSERT INTO archives (name, mtime) VALUES (?, ?)", archives.items())
+            self._db.commit()
+
+        if indexed:
+            logger.info(f"Indexed {indexed} session(s) from {log_dir}")
+        return indexed
+
+    def remove_date(self, date: str) -> int:
+        """Drop every session of a day (YYYY-MM-DD); returns the number removed"""
+        with self._lock:
+            removed = self._db.execute("DELETE FROM sessions WHERE date = ? AND live = 0", (date,)).rowcount
+            self._db.commit()
+        return removed
+
+    def rebuild(self, log_dir: Path) -> int:
+        """Drop the index and rebuild it from the session files"""
+        with self._lock:
+            self._db.execute("DELETE FROM sessions WHERE live = 0")
+            self._db.execute("DELETE FROM archives")
+            self._db.commit()
+        return self.backfill(log_dir)
+
+    # Queries
+
+    def list_sessions(
+        self,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        List sessions, newest first.
+
+        Args:
+            date_from: Earliest day to include (YYYY-MM-DD)
+            date_to: Latest day to include (YYYY-MM-DD)
+            limit: Page size
+            offset: Rows to skip
+
+        Returns:
+            Session summaries in the SessionLogger.list_sessions shape
+        """
+        where, params = self._date_filter(date_from, date_to)
+        with self._lock:
+            rows = self._db.execute(
+                f"""SELECT file, session_id, started_at, ended_at, search_count, transcript_count
+                    FROM sessions {where}
+                    ORDER BY started_at DESC LIMIT ? OFFSET ?""",
+                (*params, limit, offset),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def count_sessions(self, date_from: Optional[str] = None, date_to: Optional[str] = None) -> int:
+        where, params = self._date_filter(date_from, date_to)
+        with self._lock:
+            return self._db.execute(f"SELECT COUNT(*) FROM sessions {where}", params).fetchone()[0]
+
+    def find_topic(self, topic: str, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        """Searches whose topic contains the given text, newest first"""
+        with self._lock:
+            rows = self._db.execute(
+                """SELECT s.session_id, ss.file, ss.date, s.timestamp, s.topic, s.trigger_phrase,
+                          s.response, s.provider, s.model, s.latency_ms, s.success, s.cached
+                   FROM searches s JOIN sessions ss ON ss.session_id = s.session_id
+                   WHERE s.topic_norm LIKE ? ESCAPE '\\'
+                   ORDER BY s.timestamp DESC LIMIT ? OFFSET ?""",
+                (f"%{self._escape_like(topic.strip().lower())}%", limit, offset),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def session_searches(self, session_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT * FROM searches WHERE session_id = ? ORDER BY id", (session_id,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def session_transcripts(self, session_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT * FROM transcript_segments WHERE session_id = ? ORDER BY id", (session_id,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def provider_stats(self, date_from: Optional[str] = None, date_to: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Per provider/model search counts, success rate and latency"""
+        where, params = self._date_filter(date_from, date_to, column="ss.date")
+        with self._lock:
+            rows = self._db.execute(
+                f"""SELECT s.provider, s.model,
+                           COUNT(*) AS searches,
+                           SUM(s.success) AS successes,
+                           SUM(s.cached) AS cached,
+                           AVG(CASE WHEN s.cached = 0 THEN s.latency_ms END) AS avg_latency_ms,
+                           MIN(CASE WHEN s.cached = 0 THEN s.latency_ms END) AS min_latency_ms,
+                           MAX(CASE WHEN s.cached = 0 THEN s.latency_ms END) AS max_latency_ms,
+                           AVG(s.first_token_ms) AS avg_first_token_ms
+                    FROM searches s JOIN sessions ss ON ss.session_id = s.session_id
+                    {where}
+                    GROUP BY s.provider, s.model
+                    ORDER BY searches DESC""",
+                params,
+            ).fetchall()
+
+        stats = []
+        for row in rows:
+            item = dict(row)
+            item["success_rate"] = round(item["successes"] / item["searches"], 3) if item["searches"] else 0.0
+            for key in ("avg_latency_ms", "avg_first_token_ms"):
+                if item[key] is not None:
+                    item[key] = round(item[key], 1)
+            stats.append(item)
+        return stats
+
+    def query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        """Run a read-only query against the index (used by src.history)"""
+        with self._lock:
+            return [dict(row) for row in self._db.execute(sql, params).fetchall()]
+
+    def close(self):
+        with self._lock:
+            self._db.commit()
+            self._db.close()
+
+    # Helpers
+
+    def _insert_search(self, session_id: str, entry: Dict[str, Any]):
+        topic = entry.get("topic") or ""
+        self._db.execute(
+            """INSERT INTO searches (session_id, timestamp, trigger_phrase, topic, topic_norm,
+                   response, provider, model, latency_ms, first_token_ms, success, error, cached)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (session_id, entry.get("timestamp"), entry.get("trigger_phrase"), topic,
+             topic.strip().lower(), entry.get("response"), entry.get("provider"),
+             entry.get("model"), entry.get("latency_ms"), entry.get("first_token_ms"),
+             int(bool(entry.get("success"))), entry.get("error"), int(bool(entry.get("cached")))),
+        )
+
+    def _insert_segment(self, session_id: str, entry: Dict[str, Any], text: Optional[str] = None):
+        self._db.execute(
+            """INSERT INTO transcript_segments (session_id, timestamp, trigger,
+                   duration_seconds, transcript, file, text)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            (session_id, entry.get("timestamp"), entry.get("trigger"),
+             entry.get("duration_seconds"), entry.get("transcript"), entry.get("file"), text),
+        )
+
+    @staticmethod
+    def _read_segment_text(session_file: Path, entry: Dict[str, Any]) -> Optional[str]:
+        """Full transcript from the segment's text file, if it is still there"""
+        if not entry.get("file"):
+            return None
+        data = read_log_file(session_file.parent / entry["file"])
+        return data.decode("utf-8", errors="replace") if data is not None else None
+
+    @staticmethod
+    def _date_filter(date_from: Optional[str], date_to: Optional[str], column: str = "date"):
+        clauses, params = [], []
+        if date_from:
+            clauses.append(f"{column} >= ?")
+            params.append(date_from)
+        if date_to:
+            clauses.append(f"{column} <= ?")
+            params.append(date_to)
+        return ("WHERE " + " AND ".join(clauses)) if clauses else "", tuple(params)
+
+    @staticmethod
+    def _escape_like(text: str) -> str:
+        return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -0,0 +1,152 @@
+"""Append-only JSONL event journal for sessions"""
+
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+import logging
+
+from .archive import read_log_file
+
+logger = logging.getLogger(__name__)
+
+
+def utc_timestamp() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
+class SessionJournal:
+    """
+    Writes one JSON line per session event.
+
+    Every event is flushed to the OS as soon as it is written, so a crash of
+    the app loses at most the event being written. fsync (protection against
+    power loss) is batched: every `fsync_every` events or `fsync_interval`
+    seconds, whichever comes first.
+    """
+
+    def __init__(self, path: Path, fsync_every: int = 8, fsync_interval: float = 1.0):
+        self.path = Path(path)
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def append(self, event_type: str, **data: Any):
+        """Append an event"""
+        self.write_event({"type": event_type, "ts": utc_timestamp(), **data})
+
+    def write_event(self, event: Dict[str, Any], flush: bool = True):
+        """Append a prebuilt event dict"""
+        if self._file is None:
+            raise ValueError(f"Journal {self.path} is closed")
+
+        self._file.write(json.dumps(event, separators=(",", ":")) + "\n")
+        self._unsynced += 1
+        if flush:
+            self.flush()
+
+    def flush(self):
+        """Flush to the OS, fsync if the batch is due"""
+        if self._file is None:
+            return
+        self._file.flush()
+        if (self._unsynced >= self.fsync_every
+                or time.monotonic() - self._last_sync >= self.fsync_interval):
+            self.sync()
+
+    def sync(self):
+        """Force buffered events to disk"""
+        if self._file is None or self._unsynced == 0:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        """Sync and close the journal"""
+        if self._file is None:
+            return
+        self.sync()
+        self._file.close()
+        self._file = None
+
+    @staticmethod
+    def read(path: Path) -> List[Dict[str, Any]]:
+        """Read all complete events, ignoring a truncated trailing line"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return SessionJournal.parse(f, path)
+
+    @staticmethod
+    def parse(lines: Iterable[str], source: Any = "journal") -> List[Dict[str, Any]]:
+        """Parse journal lines into events"""
+        events = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping truncated journal line in {source}")
+        return events
+
+
+def materialize(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Fold journal events into the session JSON shape"""
+    data: Dict[str, Any] = {
+        "session_id": None,
+        "started_at": None,
+        "ended_at": None,
+        "meeting_context": "",
+        "searches": [],
+        "transcript_segments": [],
+    }
+
+    for event in events:
+        event_type = event.get("type")
+        if event_type == "session_started":
+            data["session_id"] = event.get("session_id")
+            data["started_at"] = event.get("started_at")
+        elif event_type == "meeting_context":
+            data["meeting_context"] = event.get("context", "")
+        elif event_type == "search":
+            data["searches"].append(event.get("entry", {}))
+        elif event_type == "transcript_segment":
+            data["transcript_segments"].append(event.get("entry", {}))
+        elif event_type == "session_ended":
+            data["ended_at"] = event.get("ended_at")
+
+    return data
+
+
+def write_session_json(path: Path, data: Dict[str, Any]):
+    """Atomically write a materialized session file"""
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def load_session(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load a session from its JSON file or, failing that, its journal.
+
+    Sessions in archived day directories are read from the day's archive.
+    """
+    path = Path(path)
+    if path.suffix == ".json":
+        data = read_log_file(path)
+        if data is not None:
+            return json.loads(data)
+        path = path.with_suffix(".jsonl")
+    data = read_log_file(path)
+    if data is not None:
+        return materialize(SessionJournal.parse(data.decode('utf-8').splitlines(), path))
+    return None
@@ -0,0 +1,148 @@
+"""Retention and compaction of old session logs"""
+
+import shutil
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, List, Optional
+import logging
+
+from .archive import ARCHIVE_SUFFIX, DAY_PATTERN, pack_day
+from .index import SessionIndex
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetentionReport:
+    """What one retention pass did"""
+    pruned: List[str] = field(default_factory=list)  # Days deleted
+    archived: List[str] = field(default_factory=list)  # Days packed into archives
+    sessions_removed: int = 0  # Index rows dropped with pruned days
+    errors: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "pruned": self.pruned,
+            "archived": self.archived,
+            "sessions_removed": self.sessions_removed,
+            "errors": self.errors,
+        }
+
+
+class RetentionJob:
+    """
+    Enforces logging.retain_days and packs older days into archives.
+
+    Days older than `retain_days` are deleted (with their index rows); days
+    older than `archive_after_days` are packed into YYYY-MM-DD.tar.gz, which
+    the index and load_session read transparently. Either limit is disabled
+    when set to 0. Work is done one day at a time with a pause in between,
+    so a large backlog never competes with the live pipeline for disk.
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        retain_days: int = 30,
+        archive_after_days: int = 7,
+        index: Optional[SessionIndex] = None,
+        pause_seconds: float = 0.2,
+    ):
+        self.log_dir = Path(log_dir)
+        self.retain_days = retain_days
+        self.archive_after_days = archive_after_days
+        self.index = index
+        self.pause_seconds = pause_seconds
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.last_report: Optional[RetentionReport] = None
+
+    def start(self, before: Optional[Callable[[], None]] = None):
+        """
+        Run one pass on a background thread.
+
+        Args:
+            before: Optional callable run first on the same thread (e.g. an
+                index backfill that should not race with pruning)
+        """
+        def run():
+            if before is not None:
+                before()
+            self.run()
+
+        self._thread = threading.Thread(target=run, name="log-retention", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        """Ask a running pass to stop after the current day"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+
+    def run(self, today: Optional[date] = None) -> RetentionReport:
+        """Run one retention pass synchronously"""
+        today = today or date.today()
+        report = RetentionReport()
+
+        for path, day in self._days():
+            if self._stop.is_set():
+                break
+
+            age = (today - day).days
+            name = day.isoformat()
+            try:
+                if self.retain_days > 0 and age > self.retain_days:
+                    self._prune(path)
+                    if self.index is not None:
+                        report.sessions_removed += self.index.remove_date(name)
+                    report.pruned.append(name)
+                elif (self.archive_after_days > 0 and age > self.archive_after_days
+                        and path.is_dir() and not self._in_use(path)):
+                    pack_day(path)
+                    report.archived.append(name)
+                else:
+                    continue
+            except Exception as e:
+                logger.error(f"Retention failed for {path}: {e}")
+                report.errors.append(f"{name}: {e}")
+
+            time.sleep(self.pause_seconds)
+
+        if report.pruned or report.archived:
+            logger.info(f"Log retention: pruned {len(report.pruned)} day(s), "
+                        f"archived {len(report.archived)} day(s)")
+        self.last_report = report
+        return report
+
+    def _days(self):
+        """Day directories and archives, oldest first"""
+        if not self.log_dir.exists():
+            return []
+
+        days = []
+        for path in self.log_dir.iterdir():
+            name = path.name[:-len(ARCHIVE_SUFFIX)] if path.name.endswith(ARCHIVE_SUFFIX) else path.name
+            if not DAY_PATTERN.match(name) or not (path.is_dir() or path.name.endswith(ARCHIVE_SUFFIX)):
+                continue
+            try:
+                days.append((path, datetime.strptime(name, "%Y-%m-%d").date()))
+            except ValueError:
+                continue
+        return sorted(days, key=lambda item: item[1])
+
+    @staticmethod
+    def _in_use(date_dir: Path, idle_seconds: float = 3600.0) -> bool:
+        """A journal written to recently may belong to a session still running"""
+        cutoff = time.time() - idle_seconds
+        return any(p.stat().st_mtime > cutoff for p in date_dir.glob("session_*.jsonl"))
+
+    @staticmethod
+    def _prune(path: Path):
+        if path.is_dir():
+            shutil.rmtree(path)
+        else:
+            path.unlink()
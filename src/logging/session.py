@@ -1,6 +1,5 @@
 """Session logging for research and transcription"""
 
-import json
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -8,15 +7,34 @@ from typing import Optional, List, Dict, Any
 import logging
 
 from ..research.providers.base import ResearchResult
+from .archive import ARCHIVE_SUFFIX, archive_members
+from .index import SessionIndex
+from .journal import SessionJournal, load_session, materialize, utc_timestamp, write_session_json
+from .writer import BackgroundWriter, WriterStats
 
 logger = logging.getLogger(__name__)
 
 
 class SessionLogger:
-    """Manages session logging for searches and transcriptions"""
+    """
+    Manages session logging for searches and transcriptions.
     
-    def __init__(self, log_dir: Path):
+    Entries are built on the caller's thread (so timestamps and counts are
+    exact) but all file I/O happens on a background writer thread, keeping
+    disk latency off the trigger-to-overlay path. The writer flushes the
+    journal to the OS after every batch, so a crash loses only the events
+    still queued (normally none or a handful; at most `queue_size`).
+    """
+    
+    def __init__(
+        self,
+        log_dir: Path,
+        fsync_every: int = 8,
+        queue_size: int = 1000,
+        index: Optional[SessionIndex] = None,
+    ):
         self.log_dir = Path(log_dir)
+        self.index = index
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
         self._session_id = str(uuid.uuid4())
@@ -32,31 +50,55 @@ class SessionLogger:
         self._transcripts_dir = self._date_dir / "transcripts"
         self._transcripts_dir.mkdir(exist_ok=True)
         
-        # Session file path
+        # Session file paths: append-only journal while running, JSON on end
         self._session_file = self._date_dir / f"session_{self._started_at.strftime('%H-%M-%S')}.json"
+        self._journal = SessionJournal(self._session_file.with_suffix(".jsonl"), fsync_every=fsync_every)
+        self._writer = BackgroundWriter(on_batch=self._flush_batch, maxsize=queue_size)
+        started_at = self._started_at.isoformat() + "Z"
+        self._append("session_started", session_id=self._session_id, started_at=started_at)
+        self._index(lambda index: index.start_session(self._session_id, self._session_file, started_at))
         
         logger.info(f"Session started: {self._session_id}")
     
+    def _append(self, event_type: str, **data: Any):
+        """Queue a journal event; the writer flushes once per batch"""
+        event = {"type": event_type, "ts": utc_timestamp(), **data}
+        self._writer.submit(lambda: self._journal.write_event(event, flush=False))
+    
+    def _index(self, update):
+        """Queue an index update on the writer thread"""
+        if self.index is not None:
+            self._writer.submit(lambda: update(self.index))
+    
+    def _flush_batch(self):
+        self._journal.flush()
+        if self.index is not None:
+            self.index.commit()
+    
     def set_meeting_context(self, context: str):
         """Set the meeting context for this session"""
         self._meeting_context = context
-        self._save()
+        self._append("meeting_context", context=context)
+        self._index(lambda index: index.set_meeting_context(self._session_id, context))
     
     def log_search(self, result: ResearchResult, trigger_phrase: str = ""):
         """Log a research search"""
         entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": utc_timestamp(),
             "trigger_phrase": trigger_phrase,
             "topic": result.topic,
             "response": result.summary,
             "provider": result.provider,
             "model": result.model,
             "latency_ms": result.latency_ms,
+            "first_token_ms": result.first_token_ms,
             "success": result.success,
             "error": result.error,
+            "cached": result.cached,
         }
         self._searches.append(entry)
-        self._save()
+        self._append("search", entry=entry)
+        self._index(lambda index: index.add_search(self._session_id, entry))
         logger.debug(f"Logged search: {result.topic}")
     
     def log_transcript_segment(
@@ -75,58 +117,65 @@ class SessionLogger:
         filename = f"segment_{segment_num:03d}.txt"
         filepath = self._transcripts_dir / filename
         
-        # Save transcript text
-        with open(filepath, 'w') as f:
-            f.write(transcript)
+        self._writer.submit(lambda: filepath.write_text(transcript))
         
         entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": utc_timestamp(),
             "trigger": trigger,
             "duration_seconds": duration_seconds,
             "transcript": transcript[:500] + ("..." if len(transcript) > 500 else ""),
             "file": f"transcripts/{filename}",
         }
         self._transcripts.append(entry)
-        self._save()
+        self._append("transcript_segment", entry=entry)
+        self._index(lambda index: index.add_transcript_segment(self._session_id, entry, transcript))
         
         logger.debug(f"Logged transcript segment: {filename}")
         return filename
     
-    def _save(self):
-        """Save session data to file"""
-        data = {
+    def _session_data(self, ended_at: Optional[str] = None) -> dict:
+        """Current session in the session JSON shape"""
+        return {
             "session_id": self._session_id,
             "started_at": self._started_at.isoformat() + "Z",
-            "ended_at": None,
+            "ended_at": ended_at,
             "meeting_context": self._meeting_context,
             "searches": self._searches,
             "transcript_segments": self._transcripts,
         }
-        
-        with open(self._session_file, 'w') as f:
-            json.dump(data, f, indent=2)
+    
+    def materialize(self) -> Path:
+        """Write the session JSON file from the current state (on demand)"""
+        # The journal is only touched on the writer thread
+        self._writer.submit(self._journal.sync)
+        self._writer.drain()
+        write_session_json(self._session_file, self._session_data())
+        return self._session_file
     
     def end_session(self):
         """End the current session"""
-        data = self._load_session()
-        data["ended_at"] = datetime.utcnow().isoformat() + "Z"
+        ended_at = utc_timestamp()
+        self._append("session_ended", ended_at=ended_at)
+        self._writer.close()
+        self._journal.close()
         
-        with open(self._session_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_session_json(self._session_file, self._session_data(ended_at))
+        # The JSON now holds everything the journal did
+        self._journal.path.unlink(missing_ok=True)
+        if self.index is not None:
+            self.index.end_session(self._session_id, ended_at, self._session_file.stat().st_mtime)
         
         logger.info(f"Session ended: {self._session_id}")
     
-    def _load_session(self) -> dict:
-        """Load current session data"""
-        if self._session_file.exists():
-            with open(self._session_file, 'r') as f:
-                return json.load(f)
-        return {}
-    
     @property
     def session_id(self) -> str:
         return self._session_id
     
+    @property
+    def writer_stats(self) -> WriterStats:
+        """Queue depth and write latency of the background writer"""
+        return self._writer.stats
+    
     @property
     def search_count(self) -> int:
         return len(self._searches)
@@ -136,26 +185,58 @@ class SessionLogger:
         return len(self._transcripts)
     
     @staticmethod
-    def list_sessions(log_dir: Path) -> List[Dict[str, Any]]:
-        """List all sessions in the log directory"""
+    def list_sessions(log_dir: Path, index: Optional[SessionIndex] = None) -> List[Dict[str, Any]]:
+        """
+        List all sessions in the log directory (including unfinished ones).
+        
+        With an index, only new or changed session files are read; otherwise
+        every session file is loaded.
+        """
+        if index is not None:
+            index.backfill(log_dir)
+            return index.list_sessions(limit=-1)
+        
         sessions = []
         log_dir = Path(log_dir)
         
         for date_dir in sorted(log_dir.iterdir(), reverse=True):
             if date_dir.is_dir() and date_dir.name != "transcripts":
-                for session_file in sorted(date_dir.glob("session_*.json"), reverse=True):
-                    try:
-                        with open(session_file, 'r') as f:
-                            data = json.load(f)
-                            sessions.append({
-                                "file": str(session_file),
-                                "session_id": data.get("session_id"),
-                                "started_at": data.get("started_at"),
-                                "ended_at": data.get("ended_at"),
-                                "search_count": len(data.get("searches", [])),
-                                "transcript_count": len(data.get("transcript_segments", [])),
-                            })
-                    except Exception as e:
-                        logger.error(f"Error loading session {session_file}: {e}")
+                # A finished session has a JSON file; a running or crashed one
+                # only has its journal
+                files = {p.with_suffix(".json") for p in date_dir.glob("session_*.json")}
+                files |= {p.with_suffix(".json") for p in date_dir.glob("session_*.jsonl")}
+            elif date_dir.name.endswith(ARCHIVE_SUFFIX):
+                # Packed day: session paths keep their original form
+                files = {
+                    (log_dir / member).with_suffix(".json")
+                    for member in archive_members(date_dir)
+                    if member.count("/") == 1 and member.split("/")[1].startswith("session_")
+                }
+            else:
+                continue
+            
+            for session_file in sorted(files, reverse=True):
+                try:
+                    data = load_session(session_file)
+                    if data is None:
+                        continue
+                    sessions.append({
+                        "file": str(session_file),
+                        "session_id": data.get("session_id"),
+                        "started_at": data.get("started_at"),
+                        "ended_at": data.get("ended_at"),
+                        "search_count": len(data.get("searches", [])),
+                        "transcript_count": len(data.get("transcript_segments", [])),
+                    })
+                except Exception as e:
+                    logger.error(f"Error loading session {session_file}: {e}")
         
         return sessions
+    
+    @staticmethod
+    def recover_session(journal_path: Path) -> Path:
+        """Materialize the session JSON for a journal left behind by a crash"""
+        journal_path = Path(journal_path)
+        session_file = journal_path.with_suffix(".json")
+        write_session_json(session_file, materialize(SessionJournal.read(journal_path)))
+        return session_file
@@ -0,0 +1,155 @@
+"""Background writer thread for session log I/O"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WriterStats:
+    """Queue and latency counters for the background writer"""
+    queue_depth: int = 0
+    queue_max_depth: int = 0
+    submitted: int = 0
+    written: int = 0
+    batches: int = 0
+    errors: int = 0
+    avg_batch_size: float = 0.0
+    avg_write_ms: float = 0.0
+    max_write_ms: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "queue_depth": self.queue_depth,
+            "queue_max_depth": self.queue_max_depth,
+            "submitted": self.submitted,
+            "written": self.written,
+            "batches": self.batches,
+            "errors": self.errors,
+            "avg_batch_size": round(self.avg_batch_size, 2),
+            "avg_write_ms": round(self.avg_write_ms, 2),
+            "max_write_ms": round(self.max_write_ms, 2),
+        }
+
+
+class BackgroundWriter:
+    """
+    Runs write operations on a dedicated thread.
+
+    Operations are plain callables queued in order. Whatever has queued up by
+    the time the thread wakes is run as one batch, followed by a single call
+    to `on_batch` (e.g. a journal flush), so bursts cost one flush.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        on_batch: Optional[Callable[[], None]] = None,
+        maxsize: int = 1000,
+        max_batch: int = 256,
+        name: str = "session-writer",
+    ):
+        self.on_batch = on_batch
+        self.max_batch = max_batch
+
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._stats = WriterStats()
+        self._total_write_ms = 0.0
+        self._stopped = False
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, op: Callable[[], None]):
+        """
+        Queue a write operation.
+
+        Blocks only if the queue is full (the writer has fallen far behind),
+        so log entries are never dropped. Once the writer is closed, the
+        operation is ignored.
+        """
+        if self._stopped:
+            logger.debug("Session writer is closed, ignoring write")
+            return
+        self._queue.put(op)
+        self._stats.submitted += 1
+        self._stats.queue_max_depth = max(self._stats.queue_max_depth, self._queue.qsize())
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything submitted so far has been written"""
+        if self._stopped:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0):
+        """Drain, flush and stop the writer thread"""
+        if self._stopped:
+            return
+        self._stopped = True
+        self._queue.put(self._STOP)
+        self._thread.join(timeout=timeout)
+        if self._thread.is_alive():
+            logger.warning("Session writer did not finish draining in time")
+
+    def _run(self):
+        """Writer loop"""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            barriers = []
+            start = time.monotonic()
+            for op in batch:
+                if op is self._STOP:
+                    stop = True
+                    continue
+                if isinstance(op, threading.Event):
+                    barriers.append(op)
+                    continue
+                try:
+                    op()
+                    self._stats.written += 1
+                except Exception as e:
+                    self._stats.errors += 1
+                    logger.error(f"Session write failed: {e}")
+
+            if self.on_batch is not None:
+                try:
+                    self.on_batch()
+                except Exception as e:
+                    self._stats.errors += 1
+                    logger.error(f"Session flush failed: {e}")
+
+            elapsed_ms = (time.monotonic() - start) * 1000
+            self._stats.batches += 1
+            self._total_write_ms += elapsed_ms
+            self._stats.max_write_ms = max(self._stats.max_write_ms, elapsed_ms)
+
+            # Release drain() callers only once their writes are flushed
+            for barrier in barriers:
+                barrier.set()
+
+            if stop:
+                break
+
+    @property
+    def stats(self) -> WriterStats:
+        stats = WriterStats(**vars(self._stats))
+        stats.queue_depth = self._queue.qsize()
+        if stats.batches:
+            stats.avg_batch_size = stats.written / stats.batches
+            stats.avg_write_ms = self._total_write_ms / stats.batches
+        return stats
@@ -4,11 +4,17 @@ Main entry point
 """
 
 import sys
+import time
 import signal
 import logging
+import argparse
 import threading
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+import numpy as np
 
 from dotenv import load_dotenv
 from rich.logging import RichHandler
@@ -17,13 +23,17 @@ from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QThread, pyqtSignal, QObject
 
 from .config import SettingsManager
-from .audio import AudioCapture, TranscriptionRecorder, TranscriptSegment
-from .speech import SpeechRecognizer, TriggerDetector
+from .audio import (
+    AudioCapture, TranscriptionRecorder, TranscriptSegment, FileAudioSource, create_vad
+)
+from .audio.pipeline import PipelineStage, DropPolicy
+from .speech import ASRWorker, SpeechRecognizer, TranscriptCache, TriggerDetector
 from .research import ResearchEngine
+from .research.cache import normalize_topic
+from .research.prefetch import Prefetcher
 from .research.providers.base import ResearchResult
 from .ui import OverlayWindow, SystemTray
-from .logging import SessionLogger
-from .utils import HotkeyManager
+from .logging import RetentionJob, SessionIndex, SessionLogger
 
 
 # Load environment variables
@@ -45,10 +55,47 @@ def setup_logging(level: str = "INFO"):
     )
 
 
+@dataclass
+class Utterance:
+    """Speech segment handed from VAD to ASR"""
+    audio: np.ndarray
+    received_at: float  # time.monotonic() when VAD closed the utterance
+    utterance_id: int = 0
+
+
+@dataclass
+class PartialUtterance:
+    """Newest window of an utterance still in progress"""
+    audio: np.ndarray
+    received_at: float
+    utterance_id: int
+
+
+@dataclass
+class Transcript:
+    """ASR output handed to trigger detection"""
+    text: str
+    confidence: float
+    received_at: float
+    utterance_id: int = 0
+
+
+@dataclass
+class ResearchRequest:
+    """Research trigger handed to the research stage"""
+    match: Any  # TriggerMatch
+    received_at: float
+
+
 class AudioProcessor(QObject):
-    """Processes audio in background thread, emits signals for UI updates"""
+    """
+    Runs the ASR -> trigger detection -> research stages on their own worker
+    threads, connected by bounded queues. Emits signals for UI updates.
+    """
     
-    result_ready = pyqtSignal(object)  # ResearchResult
+    result_ready = pyqtSignal(int, object)  # Request id, ResearchResult
+    result_started = pyqtSignal(int, str)   # Request id, topic, before streaming begins
+    result_delta = pyqtSignal(int, str)     # Request id, streamed text delta
     status_changed = pyqtSignal(str)   # Status string
     transcription_ready = pyqtSignal(str, str)  # trigger, transcript
     recording_started = pyqtSignal()
@@ -62,6 +109,10 @@ class AudioProcessor(QObject):
         research_engine: ResearchEngine,
         session_logger: SessionLogger,
         transcription_recorder: TranscriptionRecorder,
+        pipeline_config: Optional[dict] = None,
+        streaming: bool = True,
+        partials_config: Optional[dict] = None,
+        prefetcher: Optional[Prefetcher] = None,
     ):
         super().__init__()
         self.audio = audio_capture
@@ -70,69 +121,315 @@ class AudioProcessor(QObject):
         self.research = research_engine
         self.logger = session_logger
         self.recorder = transcription_recorder
+        self.streaming = streaming
+        
+        # Speculative research of names heard in ordinary conversation; it
+        # waits while triggered research is running
+        self.prefetcher = prefetcher
+        if prefetcher is not None:
+            prefetcher.busy = lambda: self._inflight_research > 0
+        
+        pipeline_config = pipeline_config or {}
+        
+        def stage_args(name: str) -> dict:
+            config = pipeline_config.get(name, {})
+            return {
+                "maxsize": config.get('queue_size', 8),
+                "policy": config.get('drop_policy', DropPolicy.DROP_OLDEST),
+            }
+        
+        # Built back to front so each stage can hand off to the next
+        self._research_stage = PipelineStage(
+            "research", self._handle_research, **stage_args('research')
+        )
+        self._trigger_stage = PipelineStage(
+            "trigger", self._handle_transcript,
+            downstream=self._research_stage, **stage_args('trigger')
+        )
+        self._asr_stage = PipelineStage(
+            "asr", self._handle_audio,
+            downstream=self._trigger_stage, **stage_args('asr')
+        )
+        self._stages = [self._asr_stage, self._trigger_stage, self._research_stage]
+        self._inflight_research = 0
+        self._inflight_lock = threading.Lock()
+        
+        # Streaming partials: transcribe windows of the utterance in progress
+        # and start research once the same topic shows up in consecutive
+        # partials; the final transcript then skips that topic
+        self._partial_stage = None
+        if partials_config is not None:
+            self._partial_stage = PipelineStage(
+                "partial", self._handle_partial,
+                downstream=self._research_stage, **stage_args('partial')
+            )
+            self._stages.append(self._partial_stage)
+        self._stable_partials = (partials_config or {}).get('stable_partials', 2)
+        self._partial_lock = threading.Lock()
+        self._partial_streak = (0, None, 0)  # (utterance_id, topic key, count)
+        self._early_topics = {}  # utterance_id -> topic key researched early
+        self._final_utterance = 0  # Last utterance closed by VAD
+        self.partials = 0
+        self.early_triggers = 0
+        self.deduped_triggers = 0
         
-        self._processing = False
+        # End-to-end latency: utterance closed by VAD -> research result ready
+        self._trigger_latencies: deque = deque(maxlen=500)
+        self.transcripts = 0
+        self.triggers = 0
+    
+    def start(self):
+        """Start all stage workers"""
+        for stage in self._stages:
+            stage.start()
+    
+    def stop(self):
+        """Stop all stage workers"""
+        for stage in self._stages:
+            stage.stop()
     
     def on_audio(self, audio_data):
-        """Handle audio data from capture"""
-        logger = logging.getLogger(__name__)
+        """Handle an utterance from capture (called on the VAD thread, never blocks)"""
+        utterance_id = self.audio.utterance_count
+        self._final_utterance = utterance_id
+        self._asr_stage.submit(Utterance(audio_data, time.monotonic(), utterance_id))
+    
+    def on_partial(self, audio_data, utterance_id: int):
+        """Handle a partial window from capture (called on the VAD thread)"""
+        if self._partial_stage is not None:
+            self._partial_stage.submit(PartialUtterance(audio_data, time.monotonic(), utterance_id))
+    
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until every stage has drained and no research is in flight"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if not self._is_busy():
+                return True
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.05)
+    
+    def _is_busy(self) -> bool:
+        """
+        True while any work is queued, being handled or researched.
         
-        # If recording, add audio to recorder
-        if self.recorder.is_recording:
-            segment = self.recorder.add_audio(audio_data)
-            if segment:
-                # Recording auto-stopped (silence or max duration)
-                self._process_transcript_segment(segment)
-            return  # Don't process triggers while recording
+        Items only move downstream, so the stages are checked upstream first
+        and in-flight research last: an item handed on during the scan is
+        still seen by a later check.
+        """
+        stages = [self._asr_stage, self._partial_stage, self._trigger_stage, self._research_stage]
+        if any(stage.is_busy for stage in stages if stage is not None):
+            return True
+        return self._inflight_research > 0
+    
+    def metrics(self) -> dict:
+        """Queue depth and per-stage latency for every pipeline stage"""
+        stages = {
+            "capture": self.audio.capture_stats,
+            "vad_engine": self.audio.vad.stats,
+            "vad": self.audio.metrics,
+        }
+        for stage in self._stages:
+            stages[stage.name] = stage.metrics.to_dict()
+        stages["session_writer"] = self.logger.writer_stats.to_dict()
+        if self.recognizer.transcript_cache is not None:
+            stages["asr_cache"] = self.recognizer.transcript_cache.stats.to_dict()
+        if self.recognizer.asr_worker is not None:
+            stages["asr_worker"] = self.recognizer.asr_worker.stats.to_dict()
+        cache_stats = self.research.cache_stats
+        if cache_stats is not None:
+            stages["research_cache"] = cache_stats.to_dict()
+        stages["research_health"] = {
+            name: health.to_dict() for name, health in self.research.provider_health().items()
+        }
+        if self.prefetcher is not None:
+            stages["research_prefetch"] = self.prefetcher.stats.to_dict()
+        stages["research_cancellation"] = self.research.cancellation_stats.to_dict()
+        coalesce_stats = self.research.coalesce_stats
+        if coalesce_stats is not None:
+            stages["research_coalescing"] = coalesce_stats.to_dict()
+        hedge_stats = self.research.hedge_stats
+        if hedge_stats is not None:
+            stages["research_hedging"] = hedge_stats.to_dict()
         
-        if self._processing:
+        latencies = sorted(self._trigger_latencies)
+        if latencies:
+            stages["trigger_latency_ms"] = {
+                "count": len(latencies),
+                "avg": round(sum(latencies) / len(latencies), 1),
+                "p50": round(latencies[len(latencies) // 2], 1),
+                "p95": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 1),
+                "max": round(latencies[-1], 1),
+            }
+        if self._partial_stage is not None:
+            stages["partials"] = {
+                "transcribed": self.partials,
+                "early_triggers": self.early_triggers,
+                "deduped_triggers": self.deduped_triggers,
+            }
+        return stages
+    
+    def _update_status(self):
+        """Emit processing/listening depending on pipeline activity"""
+        if self.recorder.is_recording:
             return
+        self.status_changed.emit('processing' if self._is_busy() else 'listening')
+    
+    def _handle_audio(self, item):
+        """ASR stage: transcribe an utterance or a completed recording segment"""
+        logger = logging.getLogger(__name__)
         
-        self._processing = True
-        self.status_changed.emit('processing')
+        if isinstance(item, TranscriptSegment):
+            self._process_transcript_segment(item)
+            return None
+        
+        # If recording, add audio to recorder (auto-stop invokes the
+        # completion callback on this thread)
+        if self.recorder.is_recording:
+            self.recorder.add_audio(item.audio)
+            return None  # Don't process triggers while recording
         
+        self.status_changed.emit('processing')
         try:
-            # Transcribe
-            text, confidence = self.recognizer.transcribe(audio_data)
+            text, confidence = self.recognizer.transcribe(item.audio)
+        finally:
+            self._update_status()
+        
+        if text and confidence > 0.3:
+            logger.debug(f"Transcribed: '{text}'")
+            self.transcripts += 1
+            return Transcript(text, confidence, item.received_at, item.utterance_id)
+        return None
+    
+    def _handle_partial(self, item: PartialUtterance):
+        """Partial stage: early research trigger from a window of ongoing speech"""
+        logger = logging.getLogger(__name__)
+        
+        if self.recorder.is_recording or self._is_stale(item.utterance_id):
+            return None
+        
+        text, confidence = self.recognizer.transcribe(item.audio, use_cache=False)
+        if not text or confidence <= 0.3 or self._is_stale(item.utterance_id):
+            return None
+        self.partials += 1
+        logger.debug(f"Partial #{item.utterance_id}: '{text}'")
+        
+        match = self.trigger_detector.detect(text)
+        with self._partial_lock:
+            if not match or match.trigger_type != 'research' or not match.topic:
+                self._partial_streak = (item.utterance_id, None, 0)
+                return None
+            
+            # The topic is whatever follows the trigger, so it keeps growing
+            # while the speaker talks; fire once it stops changing
+            key = normalize_topic(match.topic)
+            streak_id, streak_key, count = self._partial_streak
+            count = count + 1 if (streak_id, streak_key) == (item.utterance_id, key) else 1
+            self._partial_streak = (item.utterance_id, key, count)
+            if count < self._stable_partials:
+                return None
             
-            if text and confidence > 0.3:
-                logger.debug(f"Transcribed: '{text}'")
-                
-                # Check for triggers
-                match = self.trigger_detector.detect(text)
-                
-                if match:
-                    if match.trigger_type == 'research' and match.topic:
-                        # Research the topic
-                        result = self.research.research_sync(match.topic)
-                        self.logger.log_search(result, match.trigger_phrase)
-                        logger.info(f"Emitting result_ready signal for: {result.topic}")
-                        self.result_ready.emit(result)
-                        
-                    elif match.trigger_type == 'transcription_start':
-                        # Start recording
-                        logger.info(f"Starting transcription recording: {match.trigger_phrase}")
-                        self.recorder.start_recording(
-                            match.trigger_phrase,
-                            self._process_transcript_segment
-                        )
-                        self.recording_started.emit()
-                        
-                    elif match.trigger_type == 'transcription_stop':
-                        # Stop recording
-                        if self.recorder.is_recording:
-                            logger.info("Stopping transcription recording")
-                            segment = self.recorder.stop_recording()
-                            if segment:
-                                self._process_transcript_segment(segment)
+            self._early_topics[item.utterance_id] = key
+            for old in [u for u in self._early_topics if u < item.utterance_id - 8]:
+                del self._early_topics[old]
         
-        except Exception as e:
-            logger.error(f"Processing error: {e}")
+        logger.info(f"Early research trigger from partial: '{match.topic}'")
+        self.triggers += 1
+        self.early_triggers += 1
+        return ResearchRequest(match, item.received_at)
+    
+    def _is_stale(self, utterance_id: int) -> bool:
+        """True once the utterance (or a later one) has been closed, or research already started"""
+        if utterance_id <= self._final_utterance:
+            return True
+        with self._partial_lock:
+            return utterance_id in self._early_topics
+    
+    def _handle_transcript(self, transcript: Transcript):
+        """Trigger stage: detect triggers, forward research matches"""
+        logger = logging.getLogger(__name__)
+        
+        match = self.trigger_detector.detect(transcript.text)
+        with self._partial_lock:
+            early_topic = self._early_topics.pop(transcript.utterance_id, None)
+        if not match:
+            if self.prefetcher is not None and not self.recorder.is_recording:
+                self.prefetcher.observe(transcript.text)
+            return None
+        
+        if match.trigger_type == 'research' and match.topic:
+            if early_topic is not None and early_topic == normalize_topic(match.topic):
+                # Already researched from a partial transcript
+                self.deduped_triggers += 1
+                return None
+            self.triggers += 1
+            return ResearchRequest(match, transcript.received_at)
+        
+        self.triggers += 1
+        if match.trigger_type == 'transcription_start':
+            # Start recording
+            logger.info(f"Starting transcription recording: {match.trigger_phrase}")
+            started = self.recorder.start_recording(
+                match.trigger_phrase,
+                self._process_transcript_segment,
+            )
+            if started:
+                self.recording_started.emit()
+        
+        elif match.trigger_type == 'transcription_stop':
+            # Stop recording
+            if self.recorder.is_recording:
+                logger.info("Stopping transcription recording")
+                segment = self.recorder.stop_recording()
+                if segment:
+                    self._asr_stage.submit(segment)
+                else:
+                    self.recording_stopped.emit()
         
+        return None
+    
+    def _handle_research(self, request: ResearchRequest):
+        """Research stage: hand the topic to the research engine's event loop"""
+        match = request.match
+        with self._inflight_lock:
+            self._inflight_research += 1
+        self.status_changed.emit('processing')
+        
+        if self.prefetcher is not None:
+            self.prefetcher.record_trigger(match.topic)
+        
+        # The overlay shows one result: a newer trigger cancels this one
+        token = self.research.create_token(match.topic, slot='overlay')
+        on_delta = None
+        if self.streaming:
+            self.result_started.emit(token.request_id, match.topic)
+            on_delta = lambda delta: self.result_delta.emit(token.request_id, delta)
+        
+        future = self.research.submit(match.topic, on_delta=on_delta, token=token)
+        future.add_done_callback(lambda f: self._on_research_done(f, request, token.request_id))
+        return None
+    
+    def _on_research_done(self, future, request: ResearchRequest, request_id: int):
+        """Publish a finished lookup (runs on the research event loop thread)"""
+        logger = logging.getLogger(__name__)
+        
+        try:
+            if future.cancelled():
+                logger.info(f"Research #{request_id} cancelled: {request.match.topic}")
+                return
+            result = future.result()
+            self._trigger_latencies.append((time.monotonic() - request.received_at) * 1000)
+            self.logger.log_search(result, request.match.trigger_phrase)
+            logger.info(f"Emitting result_ready signal for #{request_id}: {result.topic}")
+            self.result_ready.emit(request_id, result)
+        except Exception as e:
+            logger.error(f"Research error: {e}")
         finally:
-            self._processing = False
-            if not self.recorder.is_recording:
-                self.status_changed.emit('listening')
+            with self._inflight_lock:
+                self._inflight_research -= 1
+            self._update_status()
+            if self.prefetcher is not None:
+                self.prefetcher.schedule_pump()
     
     def _process_transcript_segment(self, segment: TranscriptSegment):
         """Process a completed transcript segment"""
@@ -165,12 +462,23 @@ class AudioProcessor(QObject):
 class MeetingAssistant:
     """Main application class"""
     
-    def __init__(self):
+    def __init__(self, replay_source: Optional[FileAudioSource] = None):
+        """
+        Args:
+            replay_source: Recorded audio to use instead of the microphone
+        """
         self.logger = logging.getLogger(__name__)
+        self.replay_source = replay_source
         
         # Load settings
         self.settings = SettingsManager()
         
+        if replay_source is not None and not replay_source.realtime:
+            # As-fast-as-possible replay: apply backpressure instead of
+            # dropping, so every recorded utterance is processed
+            for stage in (self.settings.get('pipeline') or {}):
+                self.settings.set('pipeline', stage, 'drop_policy', DropPolicy.BLOCK)
+        
         # Initialize components
         self._init_audio()
         self._init_speech()
@@ -181,19 +489,65 @@ class MeetingAssistant:
     def _init_audio(self):
         """Initialize audio capture"""
         audio_config = self.settings.get('audio')
+        vad_queue = self.settings.get('pipeline', 'vad') or {}
+        sample_rate = audio_config.get('sample_rate', 16000)
+        partials = self._partials_config() or {}
         self.audio = AudioCapture(
-            sample_rate=audio_config.get('sample_rate', 16000),
+            sample_rate=sample_rate,
             chunk_duration_ms=audio_config.get('chunk_duration_ms', 100),
             vad_threshold=audio_config.get('vad_threshold', 0.5),
+            queue_size=vad_queue.get('queue_size', 50),
+            drop_policy=vad_queue.get('drop_policy', DropPolicy.DROP_OLDEST),
+            max_utterance_seconds=audio_config.get('max_utterance_seconds', 30),
+            backend=audio_config.get('backend', 'blocking'),
+            vad=create_vad(audio_config, sample_rate),
+            source=self.replay_source,
+            partial_interval_ms=partials.get('interval_ms', 0),
+            partial_window_seconds=partials.get('window_seconds', 6.0),
         )
     
     def _init_speech(self):
         """Initialize speech recognition"""
         speech_config = self.settings.get('speech')
+        
+        # Live transcripts are only cached on request: the cache is not pruned
+        # by logging retention. Replays cache by default, their audio is on disk anyway
+        cache_config = speech_config.get('cache') or {}
+        self.transcript_cache = None
+        replaying = self.replay_source is not None
+        if cache_config.get('enabled', False) or (replaying and cache_config.get('replay', True)):
+            path = cache_config.get('path')
+            self.transcript_cache = TranscriptCache(
+                path=Path(path).expanduser() if path else None,
+                memory_max_entries=cache_config.get('memory_max_entries', 512),
+                disk_max_entries=cache_config.get('disk_max_entries', 20000),
+                disk_enabled=cache_config.get('disk_enabled', True),
+            )
+        
+        # Local mode: load and warm up the model in a worker process now,
+        # rather than on the first utterance
+        self.asr_worker = None
+        worker_config = speech_config.get('local_worker') or {}
+        if not speech_config.get('use_api', False) and worker_config.get('enabled', False):
+            self.asr_worker = ASRWorker(
+                model_size=speech_config.get('model', 'tiny'),
+                language=speech_config.get('language', 'en'),
+                sample_rate=self.settings.get('audio', 'sample_rate', default=16000),
+                max_audio_seconds=self.settings.get('audio', 'max_utterance_seconds', default=30),
+                slots=worker_config.get('slots', 4),
+                batch_size=worker_config.get('batch_size', 0),
+                slot_timeout=worker_config.get('slot_timeout_seconds', 30),
+            )
+            self.asr_worker.start()
+        
         self.recognizer = SpeechRecognizer(
             model_size=speech_config.get('model', 'tiny'),
             language=speech_config.get('language', 'en'),
             use_api=speech_config.get('use_api', False),
+            upload_format=speech_config.get('upload_format', 'wav'),
+            base_url=speech_config.get('base_url') or None,
+            transcript_cache=self.transcript_cache,
+            asr_worker=self.asr_worker,
         )
         
         triggers_config = self.settings.get('triggers')
@@ -202,11 +556,50 @@ class MeetingAssistant:
     def _init_research(self):
         """Initialize research engine"""
         self.research = ResearchEngine(self.settings.all)
+        
+        self.prefetcher = None
+        prefetch_config = self.settings.get('research', 'prefetch') or {}
+        if prefetch_config.get('enabled', False):
+            if not self.settings.get('research', 'cache', 'enabled', default=True):
+                self.logger.warning("Prefetching needs research.cache.enabled, not starting it")
+            else:
+                self.prefetcher = Prefetcher(
+                    self.research,
+                    rate_per_minute=prefetch_config.get('rate_per_minute', 4),
+                    max_requests=prefetch_config.get('max_requests', 60),
+                    max_in_flight=prefetch_config.get('max_in_flight', 1),
+                    queue_size=prefetch_config.get('queue_size', 8),
+                    max_age_seconds=prefetch_config.get('max_age_seconds', 60),
+                    dictionary=prefetch_config.get('dictionary', []),
+                )
     
     def _init_logging(self):
         """Initialize session logging"""
         log_dir = self.settings.get_log_dir()
-        self.session_logger = SessionLogger(log_dir)
+        
+        self.session_index = None
+        if self.settings.get('logging', 'index_enabled', default=True):
+            try:
+                self.session_index = SessionIndex(log_dir / "index.sqlite3")
+            except Exception as e:
+                self.logger.error(f"Failed to open session index: {e}")
+        
+        # Background maintenance: index sessions written before the index
+        # existed, then prune and archive old days
+        self.retention = RetentionJob(
+            log_dir,
+            retain_days=self.settings.get('logging', 'retain_days', default=30),
+            archive_after_days=self.settings.get('logging', 'archive_after_days', default=7),
+            index=self.session_index,
+        )
+        index = self.session_index
+        self.retention.start(before=(lambda: index.backfill(log_dir)) if index is not None else None)
+        
+        self.session_logger = SessionLogger(
+            log_dir,
+            queue_size=self.settings.get('logging', 'writer_queue_size', default=1000),
+            index=self.session_index,
+        )
     
     def _init_transcription(self):
         """Initialize transcription recorder"""
@@ -217,6 +610,26 @@ class MeetingAssistant:
             max_duration_seconds=trans_config.get('max_duration_seconds', 60),
         )
     
+    def _create_processor(self) -> AudioProcessor:
+        """Create the ASR/trigger/research pipeline"""
+        return AudioProcessor(
+            self.audio,
+            self.recognizer,
+            self.trigger_detector,
+            self.research,
+            self.session_logger,
+            self.transcription_recorder,
+            pipeline_config=self.settings.get('pipeline'),
+            streaming=self.settings.get('research', 'streaming', default=True),
+            partials_config=self._partials_config(),
+            prefetcher=self.prefetcher,
+        )
+    
+    def _partials_config(self) -> Optional[dict]:
+        """speech.streaming settings if streaming partials are enabled"""
+        config = self.settings.get('speech', 'streaming') or {}
+        return config if config.get('enabled', False) else None
+    
     def run(self):
         """Run the application"""
         # Create Qt application
@@ -237,32 +650,34 @@ class MeetingAssistant:
         self.tray = SystemTray(app)
         
         # Create audio processor
-        self.processor = AudioProcessor(
-            self.audio,
-            self.recognizer,
-            self.trigger_detector,
-            self.research,
-            self.session_logger,
-            self.transcription_recorder,
-        )
+        self.processor = self._create_processor()
         
         # Connect signals (use QueuedConnection for thread safety)
         from PyQt6.QtCore import Qt
         self.processor.result_ready.connect(self._on_result, Qt.ConnectionType.QueuedConnection)
+        self.processor.result_started.connect(self.overlay.begin_result, Qt.ConnectionType.QueuedConnection)
+        self.processor.result_delta.connect(self.overlay.append_text, Qt.ConnectionType.QueuedConnection)
         self.processor.status_changed.connect(self._on_status_changed, Qt.ConnectionType.QueuedConnection)
         self.processor.transcription_ready.connect(self._on_transcription, Qt.ConnectionType.QueuedConnection)
         self.processor.recording_started.connect(self._on_recording_started, Qt.ConnectionType.QueuedConnection)
         self.processor.recording_stopped.connect(self._on_recording_stopped, Qt.ConnectionType.QueuedConnection)
         
+        self._update_provider_health()
         self.tray.pause_resume_clicked.connect(self._on_pause_resume)
+        self.tray.view_history_clicked.connect(self._on_view_history)
         self.tray.quit_clicked.connect(self._on_quit)
         
         # Setup hotkeys
         self._setup_hotkeys()
         
-        # Start audio capture
-        self.audio.start(self.processor.on_audio)
-        self.logger.info("Meeting Assistant started - listening for triggers")
+        # Start pipeline workers, then audio capture
+        self.processor.start()
+        try:
+            self.audio.start(self.processor.on_audio, self.processor.on_partial)
+            self.logger.info("Meeting Assistant started - listening for triggers")
+        except Exception as e:
+            self.logger.error(f"Could not start audio capture: {e}")
+            self.tray.show_message("⚠️ Microphone unavailable", str(e))
         
         # Handle Ctrl+C gracefully
         signal.signal(signal.SIGINT, lambda *args: self._on_quit())
@@ -270,8 +685,111 @@ class MeetingAssistant:
         # Run Qt event loop
         return app.exec()
     
+    def run_replay(self) -> int:
+        """
+        Run the pipeline headless over the replay source and print a report.
+        
+        No Qt event loop runs, so signals are connected directly and handled
+        on the emitting worker thread.
+        """
+        from PyQt6.QtCore import Qt
+        
+        self.processor = self._create_processor()
+        results = []
+        
+        def on_result(request_id: int, result: ResearchResult):
+            results.append(result)
+            status = "ok" if result.success else f"error: {result.error}"
+            print(f"  [{result.provider}] {result.topic} - {result.latency_ms}ms ({status})")
+        
+        self.processor.result_ready.connect(on_result, Qt.ConnectionType.DirectConnection)
+        
+        mode = "real-time" if self.replay_source.realtime else "as fast as possible"
+        print(f"Replaying {len(self.replay_source.files)} file(s), {mode}")
+        
+        started = time.monotonic()
+        self.processor.start()
+        self.audio.start(self.processor.on_audio, self.processor.on_partial)
+        
+        try:
+            self.audio.wait_source_done()
+            self.processor.wait_idle()
+        except KeyboardInterrupt:
+            print("\nInterrupted")
+        
+        elapsed = time.monotonic() - started
+        metrics = self.processor.metrics()
+        
+        self.audio.stop()
+        self.processor.stop()
+        if self.prefetcher is not None:
+            self.prefetcher.close()
+        self.research.close()
+        self.retention.stop()
+        self.session_logger.end_session()
+        if self.session_index is not None:
+            self.session_index.close()
+        if self.transcript_cache is not None:
+            self.transcript_cache.close()
+        if self.asr_worker is not None:
+            self.asr_worker.close()
+        
+        audio_seconds = self.replay_source.seconds_read
+        print("\nReplay summary")
+        print(f"  Audio replayed:  {audio_seconds:.1f}s in {elapsed:.1f}s "
+              f"({audio_seconds / elapsed if elapsed else 0:.1f}x real time)")
+        print(f"  Utterances:      {metrics['capture']['utterances']}")
+        print(f"  Transcripts:     {self.processor.transcripts}")
+        print(f"  Triggers:        {self.processor.triggers}")
+        if "partials" in metrics:
+            partials = metrics["partials"]
+            print(f"  Partials:        {partials['transcribed']} transcribed, "
+                  f"{partials['early_triggers']} early triggers, {partials['deduped_triggers']} deduped")
+        print(f"  Research results: {len(results)}")
+        if "trigger_latency_ms" in metrics:
+            latency = metrics["trigger_latency_ms"]
+            print(f"  Trigger latency: avg {latency['avg']}ms, p50 {latency['p50']}ms, "
+                  f"p95 {latency['p95']}ms, max {latency['max']}ms")
+        for name in ("vad", "asr", "trigger", "research"):
+            stage = metrics[name]
+            print(f"  Stage {name:<9} processed {stage['processed']:>5}, dropped {stage['dropped']:>4}, "
+                  f"avg {stage['avg_latency_ms']}ms, max queue {stage['queue_max_depth']}")
+        if "asr_cache" in metrics:
+            cache = metrics["asr_cache"]
+            print(f"  ASR cache:       {cache['memory_hits'] + cache['disk_hits']} hits, "
+                  f"{cache['misses']} misses ({cache['hit_rate']:.0%}), saved {cache['saved_ms'] / 1000:.1f}s")
+        if "research_cache" in metrics:
+            cache = metrics["research_cache"]
+            print(f"  Research cache:  {cache['memory_hits'] + cache['disk_hits']} hits, "
+                  f"{cache['misses']} misses ({cache['hit_rate']:.0%})")
+        for name, health in metrics.get("research_health", {}).items():
+            latency = f"{health['latency_ewma_ms']:.0f}ms" if health['latency_ewma_ms'] is not None else "n/a"
+            print(f"  Provider {name:<8} {health['state']}, {health['requests']} requests, "
+                  f"error rate {health['error_rate']:.0%}, latency ewma {latency}")
+        if "research_prefetch" in metrics:
+            prefetch = metrics["research_prefetch"]
+            print(f"  Prefetch:        {prefetch['prefetched']} prefetched, {prefetch['hits']}/{prefetch['triggers']} "
+                  f"triggers hit ({prefetch['hit_rate']:.0%}), {prefetch['useful_rate']:.0%} of prefetches used")
+        cancellation = metrics["research_cancellation"]
+        if cancellation["cancelled"]:
+            print(f"  Cancelled:       {cancellation['cancelled']} requests "
+                  f"({cancellation['superseded']} superseded), ~{cancellation['tokens_saved']} output tokens saved")
+        if "research_coalescing" in metrics:
+            coalescing = metrics["research_coalescing"]
+            print(f"  Coalesced:       {coalescing['coalesced']} requests joined "
+                  f"{coalescing['flights']} provider calls")
+        if "research_hedging" in metrics:
+            hedging = metrics["research_hedging"]
+            print(f"  Hedging:         {hedging['hedged']}/{hedging['requests']} hedged, "
+                  f"{hedging['secondary_wins']} won by secondary, est. saved {hedging['saved_ms_total'] / 1000:.1f}s")
+        
+        return 0
+    
     def _setup_hotkeys(self):
         """Setup global hotkeys"""
+        # Imported here: pynput needs a display server, replay mode does not
+        from .utils import HotkeyManager
+        
         self.hotkeys = HotkeyManager()
         hotkey_config = self.settings.get('hotkeys')
         
@@ -283,23 +801,45 @@ class MeetingAssistant:
         
         self.hotkeys.start()
     
-    def _on_result(self, result: ResearchResult):
+    def _on_result(self, request_id: int, result: ResearchResult):
         """Handle research result"""
-        self.logger.info(f"_on_result called with topic: {result.topic}")
+        self.logger.info(f"_on_result called for #{request_id} with topic: {result.topic}")
         self.logger.info(f"Result success: {result.success}, summary length: {len(result.summary)}")
         
         try:
-            self.overlay.show_result(result)
-            self.logger.info("Overlay show_result called")
+            self.overlay.finish_result(result, request_id)
+            self.logger.info("Overlay finish_result called")
         except Exception as e:
             self.logger.error(f"Error showing overlay: {e}")
         
+        self._update_provider_health()
+        
         if result.success:
             self.tray.show_message(
                 f"🔍 {result.topic}",
                 result.summary[:100] + "..." if len(result.summary) > 100 else result.summary
             )
     
+    def _update_provider_health(self):
+        """Reflect research provider circuit states in the tray"""
+        health = self.research.provider_health()
+        self.tray.set_provider_health({name: h.state for name, h in health.items()})
+    
+    def _on_view_history(self):
+        """Summarize recent sessions from the session index"""
+        if self.session_index is None:
+            self.tray.show_message("📋 History", f"Session logs are in {self.settings.get_log_dir()}")
+            return
+        
+        sessions = self.session_index.list_sessions(limit=5)
+        total = self.session_index.count_sessions()
+        lines = [
+            f"{(s['started_at'] or '')[:16].replace('T', ' ')} - "
+            f"{s['search_count']} searches, {s['transcript_count']} transcripts"
+            for s in sessions
+        ]
+        self.tray.show_message(f"📋 {total} sessions", "\n".join(lines) or "No sessions yet")
+    
     def _on_status_changed(self, status: str):
         """Handle status change"""
         self.tray.set_status(status)
@@ -341,17 +881,54 @@ class MeetingAssistant:
         self.logger.info("Shutting down...")
         
         self.audio.stop()
+        self.processor.stop()
+        if self.prefetcher is not None:
+            self.prefetcher.close()
+        self.research.close()
         self.hotkeys.stop()
+        self.retention.stop()
         self.session_logger.end_session()
+        if self.session_index is not None:
+            self.session_index.close()
+        if self.transcript_cache is not None:
+            self.transcript_cache.close()
+        if self.asr_worker is not None:
+            self.asr_worker.close()
         
         QApplication.instance().quit()
 
 
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Voice-Activated Meeting Research Assistant")
+    parser.add_argument(
+        "--replay", metavar="PATH", nargs="+",
+        help="Replay WAV file(s) or directories through the pipeline instead of the microphone",
+    )
+    parser.add_argument(
+        "--fast", action="store_true",
+        help="With --replay, process audio as fast as possible instead of in real time",
+    )
+    parser.add_argument("--log-level", default="INFO", help="Logging level")
+    return parser.parse_args(argv)
+
+
 def main():
     """Entry point"""
-    setup_logging("INFO")
+    args = parse_args()
+    setup_logging(args.log_level)
     
     try:
+        if args.replay:
+            sample_rate = SettingsManager().get('audio', 'sample_rate') or 16000
+            source = FileAudioSource(
+                args.replay,
+                sample_rate=sample_rate,
+                realtime=not args.fast,
+            )
+            assistant = MeetingAssistant(replay_source=source)
+            sys.exit(assistant.run_replay())
+        
         assistant = MeetingAssistant()
         sys.exit(assistant.run())
     except KeyboardInterrupt:
@@ -0,0 +1,263 @@
+"""Two-tier research result cache: in-memory LRU in front of SQLite"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+import logging
+
+from .providers.base import ResearchResult
+
+logger = logging.getLogger(__name__)
+
+DISK_TRIM_RATIO = 0.9  # A full disk tier is trimmed to this share of its cap
+EXPIRE_INTERVAL_SECONDS = 600.0  # How often put() sweeps expired rows (get() drops them lazily)
+
+
+def normalize_topic(topic: str) -> str:
+    """Normalize a topic so trivially different phrasings share a cache entry"""
+    topic = topic.lower().strip()
+    topic = re.sub(r"[^\w\s+#.-]", " ", topic)
+    topic = re.sub(r"\s+", " ", topic)
+    return topic.strip(" .-")
+
+
+def make_cache_key(topic: str, context: str, provider: str, model: str) -> str:
+    """Build a cache key from the normalized topic, context hash, provider and model"""
+    context_hash = hashlib.sha256(context.encode("utf-8")).hexdigest()
+    raw = "\0".join([normalize_topic(topic), context_hash, provider, model])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for the research cache"""
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    memory_entries: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "memory_entries": self.memory_entries,
+            "hit_rate": round(self.hit_rate, 3),
+        }
+
+
+class ResearchCache:
+    """Caches successful ResearchResults in memory (LRU + TTL) and on disk"""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        memory_max_entries: int = 256,
+        disk_max_entries: int = 5000,
+        ttl_seconds: float = 7 * 24 * 3600,
+        disk_enabled: bool = True,
+    ):
+        self.memory_max_entries = memory_max_entries
+        self.disk_max_entries = disk_max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._memory: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+        self._db: Optional[sqlite3.Connection] = None
+        self._disk_rows = 0  # Upper bound on the disk row count (replacements overcount)
+        self._expired_at = 0.0  # Last expiry sweep (monotonic)
+        if disk_enabled:
+            path = Path(path or Path.home() / "MeetingAssistant" / "cache" / "research.sqlite3")
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(str(path), check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    """CREATE TABLE IF NOT EXISTS results (
+                        key TEXT PRIMARY KEY,
+                        created_at REAL NOT NULL,
+                        accessed_at REAL NOT NULL,
+                        payload TEXT NOT NULL
+                    )"""
+                )
+                self._db.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_results_accessed ON results(accessed_at)"
+                )
+                self._db.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_results_created ON results(created_at)"
+                )
+                self._expire_disk()
+                self._disk_rows = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+                self._db.commit()
+                logger.info(f"Research cache at {path}")
+            except sqlite3.Error as e:
+                logger.error(f"Failed to open research cache {path}: {e}")
+                self._db = None
+
+    def get(self, key: str) -> Optional[ResearchResult]:
+        """Look up a cached result, promoting disk hits into memory"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, payload = entry
+                if now - created_at <= self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    self._stats.memory_hits += 1
+                    return self._to_result(payload)
+                del self._memory[key]
+
+            if self._db is not None:
+                try:
+                    row = self._db.execute(
+                        "SELECT created_at, payload FROM results WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None:
+                        created_at, raw = row
+                        if now - created_at <= self.ttl_seconds:
+                            self._db.execute(
+                                "UPDATE results SET accessed_at = ? WHERE key = ?", (now, key)
+                            )
+                            self._db.commit()
+                            payload = json.loads(raw)
+                            self._remember(key, created_at, payload)
+                            self._stats.disk_hits += 1
+                            return self._to_result(payload)
+                        self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+                        self._db.commit()
+                except sqlite3.Error as e:
+                    logger.error(f"Research cache read failed: {e}")
+
+            self._stats.misses += 1
+            return None
+
+    def contains(self, key: str) -> bool:
+        """True if a fresh entry exists; unlike get(), not counted in stats or promoted"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and now - entry[0] <= self.ttl_seconds:
+                return True
+            if self._db is None:
+                return False
+            try:
+                row = self._db.execute(
+                    "SELECT created_at FROM results WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.error(f"Research cache read failed: {e}")
+                return False
+            return row is not None and now - row[0] <= self.ttl_seconds
+
+    def put(self, key: str, result: ResearchResult):
+        """Store a successful result in both tiers"""
+        if not result.success or not result.summary:
+            return
+
+        now = time.time()
+        payload = result.to_dict()
+        with self._lock:
+            self._remember(key, now, payload)
+            self._stats.stores += 1
+
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO results (key, created_at, accessed_at, payload) "
+                        "VALUES (?, ?, ?, ?)",
+                        (key, now, now, json.dumps(payload)),
+                    )
+                    self._evict_disk()
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.error(f"Research cache write failed: {e}")
+
+    def clear(self):
+        """Drop all cached entries"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+                self._disk_rows = 0
+
+    def close(self):
+        """Close the disk store"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            self._stats.memory_entries = len(self._memory)
+            return CacheStats(**vars(self._stats))
+
+    def _remember(self, key: str, created_at: float, payload: dict):
+        """Insert into the memory tier, evicting least recently used entries"""
+        self._memory[key] = (created_at, payload)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_max_entries:
+            self._memory.popitem(last=False)
+            self._stats.evictions += 1
+
+    def _expire_disk(self):
+        """Delete expired rows (indexed on created_at)"""
+        cutoff = time.time() - self.ttl_seconds
+        deleted = self._db.execute("DELETE FROM results WHERE created_at < ?", (cutoff,)).rowcount
+        self._disk_rows = max(self._disk_rows - max(deleted, 0), 0)
+        self._expired_at = time.monotonic()
+
+    def _evict_disk(self):
+        """
+        Sweep expired entries every EXPIRE_INTERVAL_SECONDS and trim the disk
+        tier to its size cap, least recently used first.
+
+        Rows are only counted once the running upper bound passes the cap,
+        and a full tier is trimmed well below the cap, so most puts run
+        neither query.
+        """
+        if time.monotonic() - self._expired_at >= EXPIRE_INTERVAL_SECONDS:
+            self._expire_disk()
+        self._disk_rows += 1
+        if self._disk_rows <= self.disk_max_entries:
+            return
+        count = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        excess = count - int(self.disk_max_entries * DISK_TRIM_RATIO) if count > self.disk_max_entries else 0
+        self._disk_rows = count - excess
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM results WHERE key IN "
+                "(SELECT key FROM results ORDER BY accessed_at ASC LIMIT ?)",
+                (excess,),
+            )
+            self._stats.evictions += excess
+
+    @staticmethod
+    def _to_result(payload: dict) -> ResearchResult:
+        fields = {k: v for k, v in payload.items() if k in ResearchResult.__dataclass_fields__}
+        fields["cached"] = True
+        return ResearchResult(**fields)
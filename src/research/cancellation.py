@@ -0,0 +1,153 @@
+"""Cancellation tokens and "latest wins" slots for research requests"""
+
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4  # Rough output-token estimate for English text
+
+
+@dataclass
+class CancellationStats:
+    """Counters for cancelled research requests"""
+    cancelled: int = 0  # Requests cancelled before finishing
+    superseded: int = 0  # ...of which by a newer request in the same slot
+    calls_stopped: int = 0  # Provider calls stopped (not shared with another request)
+    tokens_saved: int = 0  # Estimated output tokens not generated
+    streamed_tokens: int = 0  # Estimated output tokens received before cancelling
+
+    def to_dict(self) -> dict:
+        return {
+            "cancelled": self.cancelled,
+            "superseded": self.superseded,
+            "calls_stopped": self.calls_stopped,
+            "tokens_saved": self.tokens_saved,
+            "streamed_tokens": self.streamed_tokens,
+        }
+
+
+class CancellationToken:
+    """
+    Handle for one research request.
+
+    cancel() may be called from any thread; it cancels the request's task
+    on the research event loop, which closes the provider's HTTP stream.
+    """
+
+    def __init__(self, request_id: int, topic: str, slot: Optional[str] = None):
+        self.request_id = request_id
+        self.topic = topic
+        self.slot = slot
+        self.created_at = time.monotonic()
+        self.reason: Optional[str] = None
+        self.streamed_chars = 0
+        self._future: Optional[Future] = None
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.reason is not None
+
+    def bind(self, future: Future):
+        """Attach the request's future; cancels it at once if already cancelled"""
+        with self._lock:
+            self._future = future
+            cancelled = self.cancelled
+        if cancelled:
+            future.cancel()
+
+    def cancel(self, reason: str = "cancelled") -> bool:
+        """
+        Cancel the request.
+
+        Returns:
+            False if it had already finished or been cancelled
+        """
+        with self._lock:
+            if self.cancelled or (self._future is not None and self._future.done()):
+                return False
+            self.reason = reason
+            future = self._future
+        if future is not None:
+            future.cancel()
+        return True
+
+
+class CancellationRegistry:
+    """
+    Issues request ids and tokens, and enforces "latest wins" per slot.
+
+    A slot is a place a result is shown (e.g. the overlay). Activating a new
+    token in a slot cancels the request that held it, if still running.
+    """
+
+    def __init__(self, latest_wins: bool = True):
+        self.latest_wins = latest_wins
+        self._ids = itertools.count(1)
+        self._slots: Dict[str, CancellationToken] = {}
+        self._stats = CancellationStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CancellationStats:
+        with self._lock:
+            return replace(self._stats)
+
+    def create(self, topic: str, slot: Optional[str] = None) -> CancellationToken:
+        """New token with the next request id"""
+        return CancellationToken(next(self._ids), topic, slot)
+
+    def activate(self, token: CancellationToken):
+        """Make the token the slot's current request, superseding the previous one"""
+        if token.slot is None or not self.latest_wins:
+            return
+        with self._lock:
+            previous = self._slots.get(token.slot)
+            self._slots[token.slot] = token
+        if previous is not None and previous is not token:
+            if previous.cancel(f"superseded by #{token.request_id}"):
+                logger.info(f"Research #{previous.request_id} '{previous.topic}' superseded by "
+                            f"#{token.request_id} '{token.topic}'")
+
+    def release(self, token: CancellationToken):
+        """Forget a finished request so it no longer holds its slot"""
+        if token.slot is None:
+            return
+        with self._lock:
+            if self._slots.get(token.slot) is token:
+                del self._slots[token.slot]
+
+    def record_cancelled(self, token: CancellationToken, max_tokens: int, call_stopped: bool):
+        """
+        Count a cancelled request and log what it saved.
+
+        Args:
+            token: The cancelled request
+            max_tokens: Output token limit of its provider
+            call_stopped: False if the provider call kept running for another
+                request sharing it, in which case nothing was saved
+        """
+        streamed = token.streamed_chars // CHARS_PER_TOKEN
+        reason = token.reason or "cancelled"
+        saved = max(0, max_tokens - streamed) if call_stopped else 0
+        with self._lock:
+            self._stats.cancelled += 1
+            self._stats.superseded += int(reason.startswith("superseded"))
+            self._stats.calls_stopped += int(call_stopped)
+            self._stats.tokens_saved += saved
+            self._stats.streamed_tokens += streamed
+        self.release(token)
+
+        elapsed = time.monotonic() - token.created_at
+        if call_stopped:
+            logger.info(f"Cancelled research #{token.request_id} '{token.topic}' ({reason}) after "
+                        f"{elapsed:.1f}s: ~{streamed} tokens streamed, up to ~{saved} output tokens saved")
+        else:
+            logger.info(f"Cancelled research #{token.request_id} '{token.topic}' ({reason}); "
+                        f"its provider call continues for another request")
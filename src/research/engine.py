@@ -2,10 +2,21 @@
 
 import asyncio
 import logging
-from typing import Dict, Optional
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable, Dict, Optional
 
 from .providers.base import BaseProvider, ResearchResult
+from .providers.compatible import COMPATIBLE_ENDPOINTS, OpenAICompatibleProvider
 from .providers.openai_provider import OpenAIProvider
+from .cache import ResearchCache, CacheStats, make_cache_key
+from .cancellation import CancellationRegistry, CancellationStats, CancellationToken
+from .hedging import Hedger, HedgeStats
+from .health import HealthTracker, ProviderHealth
+from .singleflight import CoalesceStats, SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +35,23 @@ class ResearchEngine:
         self._context = settings.get('research', {}).get('context', '')
         self._meeting_context = settings.get('research', {}).get('meeting_context', '')
         
+        # Long-lived event loop so provider clients keep their connection pools
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        
         self._init_providers()
+        self._init_cache()
+        self._init_health()
+        self._init_hedging()
+        
+        # Concurrent requests for the same topic share one provider call
+        coalesce = settings.get('research', {}).get('coalesce_requests', True)
+        self._single_flight: Optional[SingleFlight] = SingleFlight() if coalesce else None
+        
+        # A newer request for the same slot (e.g. the overlay) cancels the older one
+        latest_wins = settings.get('research', {}).get('latest_wins', True)
+        self._cancellation = CancellationRegistry(latest_wins=latest_wins)
     
     def _init_providers(self):
         """Initialize enabled providers"""
@@ -40,16 +67,36 @@ class ResearchEngine:
         # OpenAI
         if api_config.get('openai', {}).get('enabled', False):
             model = api_config['openai'].get('model', 'gpt-4o-mini')
+            base_url = api_config['openai'].get('base_url') or None
             self._providers['openai'] = OpenAIProvider(
                 model=model,
                 max_tokens=max_tokens,
                 temperature=temperature,
                 timeout_seconds=timeout,
                 web_search=web_search,
+                base_url=base_url,
             )
-            logger.info(f"Initialized OpenAI provider with model: {model}")
+            logger.info(f"Initialized OpenAI provider with model: {model}"
+                        + (f" ({base_url})" if base_url else ""))
         
-        # TODO: Add other providers (DeepSeek, Gemini, GLM) in Phase 3
+        # DeepSeek, Gemini, GLM: OpenAI-compatible endpoints, keys from the environment
+        for name in COMPATIBLE_ENDPOINTS:
+            provider_config = api_config.get(name, {})
+            if not provider_config.get('enabled', False):
+                continue
+            try:
+                self._providers[name] = OpenAICompatibleProvider(
+                    name=name,
+                    model=provider_config.get('model', ''),
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    timeout_seconds=timeout,
+                    web_search=web_search,
+                    base_url=provider_config.get('base_url') or None,
+                )
+                logger.info(f"Initialized {name} provider with model: {provider_config.get('model')}")
+            except ValueError as e:
+                logger.warning(f"Skipping {name} provider: {e}")
         
         # Set default provider
         self._default_provider = research_config.get('default_provider', 'openai')
@@ -57,6 +104,69 @@ class ResearchEngine:
             self._default_provider = list(self._providers.keys())[0]
             logger.warning(f"Default provider not available, using: {self._default_provider}")
     
+    def _init_cache(self):
+        """Initialize the research result cache"""
+        cache_config = self.settings.get('research', {}).get('cache', {})
+        self._cache: Optional[ResearchCache] = None
+        
+        if not cache_config.get('enabled', False):
+            return
+        
+        path = cache_config.get('path')
+        self._cache = ResearchCache(
+            path=Path(path).expanduser() if path else None,
+            memory_max_entries=cache_config.get('memory_max_entries', 256),
+            disk_max_entries=cache_config.get('disk_max_entries', 5000),
+            ttl_seconds=cache_config.get('ttl_seconds', 7 * 24 * 3600),
+            disk_enabled=cache_config.get('disk_enabled', True),
+        )
+    
+    def _init_health(self):
+        """Set up circuit breakers and the provider fallback chain"""
+        research_config = self.settings.get('research', {})
+        health_config = research_config.get('health', {})
+        self._health = HealthTracker(
+            window=health_config.get('window', 20),
+            min_requests=health_config.get('min_requests', 5),
+            failure_rate=health_config.get('failure_rate', 0.5),
+            consecutive_failures=health_config.get('consecutive_failures', 3),
+            open_seconds=health_config.get('open_seconds', 30),
+            max_open_seconds=health_config.get('max_open_seconds', 300),
+        )
+        
+        # Default provider first, then the configured chain (default: every enabled provider)
+        chain = [self._default_provider] + list(research_config.get('fallback_chain') or self._providers)
+        self._fallback_chain = []
+        for name in chain:
+            if name in self._providers and name not in self._fallback_chain:
+                self._fallback_chain.append(name)
+        if len(self._fallback_chain) > 1:
+            logger.info(f"Research fallback chain: {' -> '.join(self._fallback_chain)}")
+    
+    def _init_hedging(self):
+        """Set up hedged requests against a secondary provider"""
+        hedging_config = self.settings.get('research', {}).get('hedging', {})
+        self._hedger: Optional[Hedger] = None
+        self._secondary_provider: Optional[str] = None
+        
+        if not hedging_config.get('enabled', False):
+            return
+        
+        secondary = hedging_config.get('secondary_provider') or next(
+            (name for name in self._providers if name != self._default_provider), None
+        )
+        if secondary not in self._providers or secondary == self._default_provider:
+            logger.warning(f"Hedging disabled: secondary provider {secondary!r} is not available")
+            return
+        
+        self._secondary_provider = secondary
+        self._hedger = Hedger(
+            budget_ms=hedging_config.get('first_token_budget_ms', 1200),
+            probe_every=hedging_config.get('probe_every', 10),
+        )
+        logger.info(f"Hedging {self._default_provider} with {secondary} after "
+                    f"{self._hedger.budget_ms:.0f}ms without a first token")
+    
     def get_context(self) -> str:
         """Get combined research context"""
         context = self._context
@@ -78,6 +188,8 @@ class ResearchEngine:
         self,
         topic: str,
         provider: Optional[str] = None,
+        on_delta: Optional[Callable[[str], None]] = None,
+        token: Optional[CancellationToken] = None,
     ) -> ResearchResult:
         """
         Research a topic using the specified or default provider.
@@ -85,6 +197,10 @@ class ResearchEngine:
         Args:
             topic: Topic to research
             provider: Provider name (optional, uses default if not specified)
+            on_delta: If given, the response is streamed and each text delta
+                is passed to this callback (on the event loop thread)
+            token: Cancellation token; its cancellation is counted and logged
+                with the estimated cost saved
             
         Returns:
             ResearchResult with summary or error
@@ -105,27 +221,294 @@ class ResearchEngine:
         provider_instance = self._providers[provider_name]
         context = self.get_context()
         
-        logger.info(f"Researching '{topic}' with {provider_name}")
+        cache_key = None
+        if self._cache is not None:
+            start_time = time.time()
+            cache_key = make_cache_key(topic, context, provider_name, provider_instance.model)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                latency_ms = int((time.time() - start_time) * 1000)
+                logger.info(f"Cache hit for '{topic}' ({latency_ms}ms)")
+                if on_delta is not None:
+                    on_delta(cached.summary)
+                return replace(cached, topic=topic, latency_ms=latency_ms, first_token_ms=latency_ms)
+        
+        async def call(forward: Optional[Callable[[str], None]]) -> ResearchResult:
+            if provider is None:
+                chain = self._health.route(self._fallback_chain)
+                if not chain:
+                    logger.warning(f"No healthy provider for '{topic}', all circuits are open")
+                    return ResearchResult(
+                        topic=topic,
+                        summary="",
+                        provider="none",
+                        model="",
+                        latency_ms=0,
+                        success=False,
+                        error="All research providers are unavailable, retrying shortly",
+                    )
+                result = await self._research_chain(topic, context, chain, forward)
+            else:
+                # An explicit provider is honoured as-is: no fallback or hedging
+                logger.info(f"Researching '{topic}' with {provider_name}")
+                result = await self._call_provider(provider_name, topic, context, forward)
+            
+            # Stored under the requested route even if the secondary answered
+            if cache_key is not None and result.success:
+                self._cache.put(cache_key, result)
+            return result
+        
+        if token is not None and on_delta is not None:
+            stream_to = on_delta
+            
+            def on_delta(delta: str):
+                token.streamed_chars += len(delta)
+                stream_to(delta)
+        
+        flight_key = make_cache_key(topic, context, provider or "", provider_instance.model)
+        try:
+            if self._single_flight is None:
+                return await call(on_delta)
+            return await self._single_flight.run(flight_key, topic, call, on_delta)
+        except asyncio.CancelledError:
+            if token is not None:
+                # A coalesced call keeps running while anyone else awaits it
+                shared = self._single_flight is not None and self._single_flight.waiters(flight_key) > 0
+                self._cancellation.record_cancelled(token, provider_instance.max_tokens, not shared)
+            raise
+    
+    async def _call_provider(
+        self,
+        name: str,
+        topic: str,
+        context: str,
+        on_delta: Optional[Callable[[str], None]],
+    ) -> ResearchResult:
+        """Single provider request, with its outcome recorded in the health tracker"""
+        provider_instance = self._providers[name]
+        try:
+            if on_delta is not None:
+                result = await provider_instance.research_streaming(topic, context, on_delta)
+            else:
+                result = await provider_instance.research(topic, context)
+        except asyncio.CancelledError:
+            self._health.release(name)
+            raise
+        self._record_health(name, result)
+        return result
+    
+    def _record_health(self, name: str, result: Optional[ResearchResult]):
+        """Health hook for finished (or, with result=None, cancelled) requests"""
+        if result is None:
+            self._health.release(name)
+        else:
+            self._health.record(name, result.success, result.latency_ms if result.success else None)
+    
+    async def _research_chain(
+        self,
+        topic: str,
+        context: str,
+        chain: list,
+        on_delta: Optional[Callable[[str], None]],
+    ) -> ResearchResult:
+        """
+        Try providers in health order until one succeeds.
+        
+        The first provider is hedged when hedging is enabled. Falling back
+        stops once any text has been streamed to the overlay.
+        """
+        streamed = False
+        
+        def forward(delta: str):
+            nonlocal streamed
+            streamed = True
+            on_delta(delta)
+        
+        result = None
+        tried = set()
+        for name in chain:
+            if name in tried or not self._health.begin(name):
+                continue
+            tried.add(name)
+            if result is not None:
+                logger.warning(f"{result.provider} failed for '{topic}' ({result.error}), falling back to {name}")
+            
+            remaining = [n for n in chain if n not in tried]
+            if self._hedger is not None and remaining:
+                secondary = self._secondary_provider if self._secondary_provider in remaining else remaining[0]
+                logger.info(f"Researching '{topic}' with {name} (hedged by {secondary})")
+                
+                def allow(candidate: str) -> bool:
+                    if not self._health.begin(candidate):
+                        return False
+                    tried.add(candidate)
+                    return True
+                
+                result = await self._hedger.run(
+                    self._providers[name], self._providers[secondary], topic, context,
+                    forward if on_delta is not None else None,
+                    allow=allow, on_done=self._record_health,
+                )
+            else:
+                logger.info(f"Researching '{topic}' with {name}")
+                result = await self._call_provider(name, topic, context, forward if on_delta is not None else None)
+            
+            if result.success or streamed:
+                break
+        
+        if result is None:
+            # Every candidate's half-open trial was already taken
+            result = ResearchResult(
+                topic=topic,
+                summary="",
+                provider="none",
+                model="",
+                latency_ms=0,
+                success=False,
+                error="All research providers are unavailable, retrying shortly",
+            )
+        return result
+    
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop thread on first use"""
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(self._loop,),
+                    name="research-loop",
+                    daemon=True,
+                )
+                self._loop_thread.start()
+                logger.debug("Research event loop started")
+            return self._loop
+    
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop):
+        """Event loop thread body"""
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+    
+    def submit(
+        self,
+        topic: str,
+        provider: Optional[str] = None,
+        on_delta: Optional[Callable[[str], None]] = None,
+        token: Optional[CancellationToken] = None,
+    ) -> Future:
+        """
+        Schedule research() on the background event loop.
+        
+        Thread-safe; may be called from any thread. Several submissions can
+        be in flight at once and share the providers' HTTP connections.
+        
+        Args:
+            token: From create_token(); if it has a slot, the request still
+                running in that slot is cancelled once this one is queued
         
-        return await provider_instance.research(topic, context)
+        Returns:
+            concurrent.futures.Future resolving to a ResearchResult, or
+            cancelled if the token is
+        """
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self.research(topic, provider, on_delta, token), loop)
+        if token is not None:
+            token.bind(future)
+            # Queued after the new request, so a coalesced call is joined before it can be dropped
+            self._cancellation.activate(token)
+            future.add_done_callback(lambda _future: self._cancellation.release(token))
+        return future
+    
+    def create_token(self, topic: str, slot: Optional[str] = None) -> CancellationToken:
+        """
+        New cancellation token with a fresh request id.
+        
+        Args:
+            topic: Topic the request is for (used in logs)
+            slot: Where the result is shown; a later request in the same slot
+                supersedes this one ("latest wins")
+        """
+        return self._cancellation.create(topic, slot)
     
     def research_sync(
         self,
         topic: str,
         provider: Optional[str] = None,
     ) -> ResearchResult:
-        """Synchronous wrapper for research()"""
-        loop = asyncio.new_event_loop()
+        """Synchronous wrapper for research(), runs on the background loop"""
+        return self.submit(topic, provider).result()
+    
+    def close(self):
+        """Stop the background event loop and release provider clients"""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = None
+            self._loop_thread = None
+        
+        if loop is None:
+            return
+        
+        async def _close_providers():
+            if self._hedger is not None:
+                await self._hedger.close()
+            for provider in self._providers.values():
+                try:
+                    await provider.close()
+                except Exception as e:
+                    logger.debug(f"Error closing provider {provider.provider_name}: {e}")
+        
         try:
-            return loop.run_until_complete(self.research(topic, provider))
-        finally:
-            loop.close()
+            asyncio.run_coroutine_threadsafe(_close_providers(), loop).result(timeout=2.0)
+        except Exception as e:
+            logger.debug(f"Error closing providers: {e}")
+        
+        loop.call_soon_threadsafe(loop.stop)
+        if thread:
+            thread.join(timeout=2.0)
+        loop.close()
+        logger.debug("Research event loop stopped")
+        
+        if self._cache is not None:
+            self._cache.close()
+    
+    def is_cached(self, topic: str, provider: Optional[str] = None) -> bool:
+        """True if research() for this topic would be answered from the cache"""
+        provider_name = provider or self._default_provider
+        if self._cache is None or provider_name not in self._providers:
+            return False
+        model = self._providers[provider_name].model
+        return self._cache.contains(make_cache_key(topic, self.get_context(), provider_name, model))
     
     @property
     def available_providers(self) -> list:
         """List of available provider names"""
         return list(self._providers.keys())
     
+    @property
+    def cache_stats(self) -> Optional[CacheStats]:
+        """Research cache hit/miss counters (None if caching is disabled)"""
+        return self._cache.stats if self._cache is not None else None
+    
+    def provider_health(self) -> Dict[str, ProviderHealth]:
+        """Circuit state, error rate and latency per provider (thread-safe)"""
+        return self._health.snapshot(self._providers)
+    
+    @property
+    def cancellation_stats(self) -> CancellationStats:
+        """Cancelled and superseded request counters"""
+        return self._cancellation.stats
+    
+    @property
+    def coalesce_stats(self) -> Optional[CoalesceStats]:
+        """Coalesced request counters (None if coalescing is disabled)"""
+        return self._single_flight.stats if self._single_flight is not None else None
+    
+    @property
+    def hedge_stats(self) -> Optional[HedgeStats]:
+        """Hedged request counters (None if hedging is disabled)"""
+        return self._hedger.stats if self._hedger is not None else None
+    
     @property
     def default_provider(self) -> Optional[str]:
         """Current default provider name"""
@@ -0,0 +1,222 @@
+"""Per-provider health tracking and circuit breaking"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"  # Healthy: requests flow
+OPEN = "open"  # Failing: requests are skipped until the cool-down ends
+HALF_OPEN = "half_open"  # Cool-down over: one trial request decides
+
+
+@dataclass
+class ProviderHealth:
+    """Snapshot of one provider's health"""
+    name: str
+    state: str
+    error_rate: float  # Over the rolling window
+    latency_ewma_ms: Optional[float]  # Successful requests only
+    requests: int
+    failures: int
+    consecutive_failures: int
+    retry_in_s: float = 0.0  # Time left before an open circuit allows a trial
+
+    @property
+    def available(self) -> bool:
+        return self.state != OPEN
+
+    def to_dict(self) -> dict:
+        return {
+            "state": self.state,
+            "error_rate": round(self.error_rate, 3),
+            "latency_ewma_ms": round(self.latency_ewma_ms, 1) if self.latency_ewma_ms is not None else None,
+            "requests": self.requests,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_in_s": round(self.retry_in_s, 1),
+        }
+
+
+class _Circuit:
+    """Mutable state behind one provider's breaker"""
+
+    def __init__(self, window: int):
+        self.state = CLOSED
+        self.outcomes: Deque[bool] = deque(maxlen=window)  # True = success
+        self.latency_ewma_ms: Optional[float] = None
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.last_failure_at = 0.0
+        self.open_until = 0.0
+        self.open_seconds = 0.0  # Current cool-down (doubles while trials keep failing)
+        self.trial_in_flight = False
+
+    @property
+    def error_rate(self) -> float:
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+
+class HealthTracker:
+    """
+    Rolling error rate, latency EWMA and a circuit breaker per provider.
+
+    A circuit opens when the error rate over the last `window` requests
+    reaches `failure_rate` (after at least `min_requests`), or after
+    `consecutive_failures` failures in a row. Open providers are skipped
+    without a request. After `open_seconds` one trial request is let
+    through (half-open): success closes the circuit, failure re-opens it
+    with the cool-down doubled, up to `max_open_seconds`.
+    """
+
+    def __init__(
+        self,
+        window: int = 20,
+        min_requests: int = 5,
+        failure_rate: float = 0.5,
+        consecutive_failures: int = 3,
+        open_seconds: float = 30.0,
+        max_open_seconds: float = 300.0,
+        degraded_error_rate: float = 0.2,
+        ewma_alpha: float = 0.2,
+    ):
+        self.window = window
+        self.min_requests = min_requests
+        self.failure_rate = failure_rate
+        self.consecutive_failures = consecutive_failures
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.degraded_error_rate = degraded_error_rate
+        self.ewma_alpha = ewma_alpha
+
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, name: str) -> _Circuit:
+        circuit = self._circuits.get(name)
+        if circuit is None:
+            circuit = self._circuits[name] = _Circuit(self.window)
+        return circuit
+
+    def _state(self, circuit: _Circuit, now: float) -> str:
+        """Effective state: an open circuit whose cool-down has ended is half-open"""
+        if circuit.state == OPEN and now >= circuit.open_until:
+            return HALF_OPEN
+        return circuit.state
+
+    def route(self, chain: Iterable[str]) -> List[str]:
+        """
+        Order a fallback chain by health.
+
+        Healthy providers keep their configured order, followed by degraded
+        ones (error rate above degraded_error_rate and a failure within the
+        last open_seconds). A half-open provider keeps its place so its one
+        trial request is actually sent; open providers are left out.
+        """
+        now = time.monotonic()
+        healthy, degraded = [], []
+        with self._lock:
+            for name in chain:
+                circuit = self._circuit(name)
+                state = self._state(circuit, now)
+                if state == CLOSED:
+                    recent = now - circuit.last_failure_at < self.open_seconds
+                    is_degraded = recent and circuit.error_rate > self.degraded_error_rate
+                    (degraded if is_degraded else healthy).append(name)
+                elif state == HALF_OPEN and not circuit.trial_in_flight:
+                    healthy.append(name)
+        return healthy + degraded
+
+    def begin(self, name: str) -> bool:
+        """
+        Claim permission to send a request.
+
+        Returns:
+            False if the circuit is open, or half-open with its trial
+            request already in flight
+        """
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuit(name)
+            state = self._state(circuit, now)
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not circuit.trial_in_flight:
+                circuit.state = HALF_OPEN
+                circuit.trial_in_flight = True
+                logger.info(f"Circuit for {name} half-open, sending a trial request")
+                return True
+            return False
+
+    def release(self, name: str):
+        """Give back a begin() whose request was cancelled before it finished"""
+        with self._lock:
+            self._circuit(name).trial_in_flight = False
+
+    def record(self, name: str, success: bool, latency_ms: Optional[float] = None):
+        """Record the outcome of a finished request"""
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuit(name)
+            circuit.requests += 1
+            circuit.outcomes.append(success)
+            circuit.trial_in_flight = False
+
+            if success:
+                circuit.consecutive_failures = 0
+                if latency_ms is not None:
+                    circuit.latency_ewma_ms = latency_ms if circuit.latency_ewma_ms is None else (
+                        self.ewma_alpha * latency_ms + (1 - self.ewma_alpha) * circuit.latency_ewma_ms
+                    )
+                if circuit.state != CLOSED:
+                    logger.info(f"Circuit for {name} closed")
+                    circuit.state = CLOSED
+                    circuit.open_seconds = 0.0
+                    circuit.outcomes.clear()
+                    circuit.outcomes.append(True)
+                return
+
+            circuit.failures += 1
+            circuit.consecutive_failures += 1
+            circuit.last_failure_at = now
+            if circuit.state == HALF_OPEN:
+                # Trial failed: back off further
+                self._open(name, circuit, now, min(circuit.open_seconds * 2, self.max_open_seconds))
+            elif circuit.state == CLOSED and (
+                circuit.consecutive_failures >= self.consecutive_failures
+                or (len(circuit.outcomes) >= self.min_requests and circuit.error_rate >= self.failure_rate)
+            ):
+                self._open(name, circuit, now, self.open_seconds)
+
+    def _open(self, name: str, circuit: _Circuit, now: float, seconds: float):
+        circuit.state = OPEN
+        circuit.open_seconds = seconds
+        circuit.open_until = now + seconds
+        logger.warning(f"Circuit for {name} opened for {seconds:.0f}s "
+                       f"(error rate {circuit.error_rate:.0%}, {circuit.consecutive_failures} consecutive failures)")
+
+    def snapshot(self, names: Optional[Iterable[str]] = None) -> Dict[str, ProviderHealth]:
+        """Health of the given (default: all known) providers"""
+        now = time.monotonic()
+        with self._lock:
+            names = list(names) if names is not None else list(self._circuits)
+            health = {}
+            for name in names:
+                circuit = self._circuit(name)
+                state = self._state(circuit, now)
+                health[name] = ProviderHealth(
+                    name=name,
+                    state=state,
+                    error_rate=circuit.error_rate,
+                    latency_ewma_ms=circuit.latency_ewma_ms,
+                    requests=circuit.requests,
+                    failures=circuit.failures,
+                    consecutive_failures=circuit.consecutive_failures,
+                    retry_in_s=max(0.0, circuit.open_until - now) if state == OPEN else 0.0,
+                )
+            return health
@@ -0,0 +1,253 @@
+"""Hedged research requests: race a secondary provider against a slow primary"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, Optional
+import logging
+
+from .providers.base import BaseProvider, ResearchResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HedgeStats:
+    """Counters for hedged research requests"""
+    requests: int = 0  # Requests eligible for hedging
+    hedged: int = 0  # Requests where the secondary was fired
+    wins: Dict[str, int] = field(default_factory=dict)  # Provider -> requests it answered
+    secondary_wins: int = 0
+    rescued: int = 0  # Primary failed, secondary answered
+    failed: int = 0  # No provider answered
+    cancelled: int = 0  # Losing requests cancelled
+    probes: int = 0  # Losing primaries left running to their first token
+    saved_ms_total: float = 0.0  # Estimated first-token time saved by secondary wins
+    saved_ms_ewma: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_rate": round(self.hedged / self.requests, 3) if self.requests else 0.0,
+            "wins": dict(self.wins),
+            "secondary_wins": self.secondary_wins,
+            "rescued": self.rescued,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "probes": self.probes,
+            "saved_ms_total": round(self.saved_ms_total, 1),
+            "saved_ms_ewma": round(self.saved_ms_ewma, 1),
+        }
+
+
+class Hedger:
+    """
+    Issues a request to the primary provider and, if no first token arrives
+    within `budget_ms` (or the primary fails first), the same request to the
+    secondary. The first provider to produce output wins; the other request
+    is cancelled, which closes its HTTP stream.
+
+    Saved latency is estimated from the primary's slow tail: the first-token
+    time of a primary that was hedged feeds an EWMA of how long a slow
+    primary takes, and a secondary win is credited with the difference
+    between that estimate and its own first-token time. A primary that keeps
+    losing would never report that time, so every `probe_every`-th losing
+    primary is left running until its first token before it is cancelled.
+    """
+
+    def __init__(self, budget_ms: float = 1200, ewma_alpha: float = 0.2, probe_every: int = 10):
+        self.budget_ms = budget_ms
+        self.ewma_alpha = ewma_alpha
+        self.probe_every = probe_every
+        self._tail_ms: Dict[str, float] = {}  # Primary -> first-token EWMA when over budget
+        self._stats = HedgeStats()
+        self._probes = set()  # Background probe tasks (kept referenced until done)
+
+    @property
+    def stats(self) -> HedgeStats:
+        return replace(self._stats, wins=dict(self._stats.wins))
+
+    async def run(
+        self,
+        primary: BaseProvider,
+        secondary: BaseProvider,
+        topic: str,
+        context: str,
+        on_delta: Optional[Callable[[str], None]] = None,
+        allow: Optional[Callable[[str], bool]] = None,
+        on_done: Optional[Callable[[str, Optional[ResearchResult]], None]] = None,
+    ) -> ResearchResult:
+        """
+        Research a topic with hedging.
+
+        Args:
+            primary: Provider asked first
+            secondary: Provider raced against a slow or failing primary
+            topic: Topic to research
+            context: System context
+            on_delta: Streaming callback; only the winner's deltas reach it
+            allow: Asked before the secondary is fired; returning False
+                (e.g. its circuit is open) skips the hedge
+            on_done: Called with each provider's result when its request
+                finishes, or None if it was cancelled
+
+        Returns:
+            The winner's ResearchResult, with latencies measured from the
+            start of the hedged request
+        """
+        self._stats.requests += 1
+        start = time.monotonic()
+        winner: Optional[str] = None
+        first_token_at: Dict[str, float] = {}
+        started = {primary.provider_name: asyncio.Event(), secondary.provider_name: asyncio.Event()}
+        claimed = asyncio.Event()
+
+        def claim(name: str) -> bool:
+            """Record a provider's first output; the first one to get here wins"""
+            nonlocal winner
+            if name not in first_token_at:
+                first_token_at[name] = time.monotonic()
+                started[name].set()
+            if winner is None:
+                winner = name
+                claimed.set()
+            return winner == name
+
+        async def attempt(provider: BaseProvider) -> ResearchResult:
+            name = provider.provider_name
+            try:
+                if on_delta is not None:
+                    def forward(delta: str):
+                        if claim(name):
+                            on_delta(delta)
+                    result = await provider.research_streaming(topic, context, forward)
+                else:
+                    result = await provider.research(topic, context)
+                    if result.success:
+                        claim(name)
+            except asyncio.CancelledError:
+                if on_done is not None:
+                    on_done(name, None)
+                raise
+            if on_done is not None:
+                on_done(name, result)
+            return result
+
+        tasks = {primary.provider_name: asyncio.ensure_future(attempt(primary))}
+        waiter = asyncio.ensure_future(claimed.wait())
+        try:
+            await asyncio.wait(
+                [tasks[primary.provider_name], waiter],
+                timeout=self.budget_ms / 1000,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+
+            if winner is None and allow is not None and not allow(secondary.provider_name):
+                logger.info(f"Not hedging '{topic}': {secondary.provider_name} is unavailable")
+            elif winner is None:
+                # No output within the budget (or the primary already failed)
+                reason = "failed" if tasks[primary.provider_name].done() else f"no token in {self.budget_ms:.0f}ms"
+                logger.info(f"Hedging '{topic}': {primary.provider_name} {reason}, "
+                            f"asking {secondary.provider_name}")
+                self._stats.hedged += 1
+                tasks[secondary.provider_name] = asyncio.ensure_future(attempt(secondary))
+
+            while winner is None and not all(task.done() for task in tasks.values()):
+                pending = [task for task in tasks.values() if not task.done()]
+                await asyncio.wait(pending + [waiter], return_when=asyncio.FIRST_COMPLETED)
+
+            # Cancel the loser; cancelling a streaming request closes its connection
+            losers = {name: task for name, task in tasks.items() if name != winner and not task.done()}
+            if winner is not None and primary.provider_name in losers and self._should_probe():
+                probe = asyncio.ensure_future(self._probe(
+                    primary.provider_name, losers.pop(primary.provider_name),
+                    started[primary.provider_name], first_token_at, start,
+                ))
+                self._probes.add(probe)
+                probe.add_done_callback(self._probes.discard)
+            for task in losers.values():
+                task.cancel()
+            if losers:
+                await asyncio.gather(*losers.values(), return_exceptions=True)
+                self._stats.cancelled += len(losers)
+        except BaseException:
+            # The hedged request itself was cancelled: stop both providers
+            for task in tasks.values():
+                task.cancel()
+            raise
+        finally:
+            waiter.cancel()
+
+        if winner is None:
+            # Nobody produced output: report the last provider tried
+            result = tasks.get(secondary.provider_name, tasks[primary.provider_name]).result()
+            if not result.success:
+                self._stats.failed += 1
+            return replace(result, latency_ms=int((time.monotonic() - start) * 1000), hedged=len(tasks) > 1)
+
+        result = await tasks[winner]
+        hedged = len(tasks) > 1
+        first_token_ms = (first_token_at[winner] - start) * 1000
+        primary_task = tasks[primary.provider_name]
+        primary_failed = primary_task.done() and not primary_task.cancelled() and not primary_task.result().success
+        self._record(primary.provider_name, winner, first_token_ms, hedged, primary_failed)
+        return replace(
+            result,
+            latency_ms=int((time.monotonic() - start) * 1000),
+            first_token_ms=int(first_token_ms),
+            hedged=hedged,
+        )
+
+    def _record(self, primary: str, winner: str, first_token_ms: float, hedged: bool, primary_failed: bool):
+        """Update win counts and the saved-latency estimate"""
+        stats = self._stats
+        stats.wins[winner] = stats.wins.get(winner, 0) + 1
+        if not hedged:
+            return
+
+        if winner == primary:
+            # A slow primary that still won: learn how slow its tail is
+            self._update_tail(primary, first_token_ms)
+            return
+
+        stats.secondary_wins += 1
+        if primary_failed:
+            stats.rescued += 1
+        tail = self._tail_ms.get(primary)
+        saved = max(0.0, tail - first_token_ms) if tail is not None else 0.0
+        stats.saved_ms_total += saved
+        stats.saved_ms_ewma = self.ewma_alpha * saved + (1 - self.ewma_alpha) * stats.saved_ms_ewma
+        logger.info(f"Hedge won by {winner} (first token {first_token_ms:.0f}ms, est. saved {saved:.0f}ms)")
+
+    async def close(self):
+        """Cancel probes still waiting for a first token"""
+        probes = list(self._probes)
+        for probe in probes:
+            probe.cancel()
+        await asyncio.gather(*probes, return_exceptions=True)
+
+    def _update_tail(self, primary: str, first_token_ms: float):
+        tail = self._tail_ms.get(primary)
+        self._tail_ms[primary] = first_token_ms if tail is None else (
+            self.ewma_alpha * first_token_ms + (1 - self.ewma_alpha) * tail
+        )
+
+    def _should_probe(self) -> bool:
+        """Every probe_every-th secondary win (counting the one being decided)"""
+        return bool(self.probe_every) and (self._stats.secondary_wins + 1) % self.probe_every == 0
+
+    async def _probe(self, name: str, task: asyncio.Future, started: asyncio.Event,
+                     first_token_at: Dict[str, float], start: float):
+        """Let a losing primary run to its first token, record it, then cancel it"""
+        waiter = asyncio.ensure_future(started.wait())
+        try:
+            await asyncio.wait([task, waiter], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        self._stats.probes += 1
+        self._stats.cancelled += 1
+        if name in first_token_at:
+            self._update_tail(name, (first_token_at[name] - start) * 1000)
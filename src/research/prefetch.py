@@ -0,0 +1,338 @@
+"""Speculative research of topics mentioned in ordinary conversation"""
+
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+import logging
+
+from .cache import normalize_topic
+
+if TYPE_CHECKING:
+    from .engine import ResearchEngine
+
+logger = logging.getLogger(__name__)
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.?!])\s+")
+_WORD_PATTERN = re.compile(r"[A-Za-z0-9][\w+#&'-]*")
+_ACRONYM_PATTERN = re.compile(r"[A-Z][A-Z0-9&]{1,7}s?")
+
+# Capitalized words that are not topics on their own
+_STOPWORDS = {
+    "i", "i'm", "i've", "i'll", "i'd", "ok", "okay", "the", "a", "an", "and", "but", "so", "or",
+    "we", "you", "he", "she", "they", "it", "this", "that", "these", "those", "my", "our", "your",
+    "yes", "no", "hi", "hello", "thanks", "well", "um", "uh", "monday", "tuesday", "wednesday",
+    "thursday", "friday", "saturday", "sunday", "am", "pm", "mr", "mrs", "ms", "dr",
+}
+
+MAX_RUN_WORDS = 4  # Longest capitalized run taken as one name
+
+
+def extract_candidates(text: str, dictionary: Optional[Dict[str, str]] = None) -> List[str]:
+    """
+    Entities worth researching: acronyms, runs of capitalized words and
+    known product names.
+
+    Runs are split at punctuation ("Yeah, John Smith" is two runs). ASR
+    capitalizes every sentence start, so a sentence's first word is dropped
+    from its run unless it is an acronym; dictionary names are always kept.
+
+    Args:
+        text: Transcript
+        dictionary: Normalized phrase -> name as configured (see build_dictionary)
+
+    Returns:
+        Candidates in order of appearance, without duplicates
+    """
+    found: List[str] = []
+    seen = set()
+
+    def add(candidate: str):
+        key = normalize_topic(candidate)
+        if key and key not in seen:
+            seen.add(key)
+            found.append(candidate)
+
+    max_words = max((len(phrase.split()) for phrase in dictionary), default=0) if dictionary else 0
+    for sentence in _SENTENCE_SPLIT.split(text.strip()):
+        matches = list(_WORD_PATTERN.finditer(sentence))
+        words = [match.group() for match in matches]
+        lower = [word.lower() for word in words]
+        # Indices of words preceded by punctuation rather than just spaces
+        breaks = {
+            i for i in range(1, len(matches))
+            if sentence[matches[i - 1].end():matches[i].start()].strip()
+        }
+        run: List[Tuple[int, str]] = []
+
+        def flush():
+            while run and (run[0][1].lower() in _STOPWORDS
+                           or run[0][0] == 0 and not _ACRONYM_PATTERN.fullmatch(run[0][1])):
+                run.pop(0)
+            if run:
+                add(" ".join(word for _, word in run[:MAX_RUN_WORDS]))
+            run.clear()
+
+        i = 0
+        while i < len(words):
+            if i in breaks:
+                flush()
+            # Dictionary hits win over capitalization (they may be lowercase)
+            hit = None
+            for size in range(min(max_words, len(words) - i), 0, -1):
+                if any(j in breaks for j in range(i + 1, i + size)):
+                    continue
+                name = dictionary.get(" ".join(lower[i:i + size])) if dictionary else None
+                if name is not None:
+                    hit = (name, size)
+                    break
+            if hit is not None:
+                flush()
+                add(hit[0])
+                i += hit[1]
+                continue
+
+            word = words[i]
+            if word[0].isupper() and lower[i] not in _STOPWORDS or run and word[0].isupper():
+                run.append((i, word))
+            else:
+                flush()
+            i += 1
+        flush()
+    return found
+
+
+def build_dictionary(names: Iterable[str]) -> Dict[str, str]:
+    """Lookup table for extract_candidates(): lowercase phrase -> configured name"""
+    return {" ".join(_WORD_PATTERN.findall(name.lower())): name for name in names if name.strip()}
+
+
+@dataclass
+class PrefetchStats:
+    """Counters for speculative research"""
+    transcripts: int = 0  # Non-trigger transcripts observed
+    candidates: int = 0  # Entities extracted
+    already_cached: int = 0  # Candidates skipped because research was already cached
+    dropped: int = 0  # Candidates pushed out of the queue or too old when reached
+    prefetched: int = 0  # Research requests issued
+    failed: int = 0
+    budget_exhausted: bool = False
+    triggers: int = 0  # Explicit research triggers seen
+    hits: int = 0  # ...for a topic prefetched (finished or still in flight)
+    used: int = 0  # Distinct prefetches a trigger asked for
+
+    def to_dict(self) -> dict:
+        return {
+            "transcripts": self.transcripts,
+            "candidates": self.candidates,
+            "already_cached": self.already_cached,
+            "dropped": self.dropped,
+            "prefetched": self.prefetched,
+            "failed": self.failed,
+            "budget_exhausted": self.budget_exhausted,
+            "triggers": self.triggers,
+            "hits": self.hits,
+            "hit_rate": round(self.hits / self.triggers, 3) if self.triggers else 0.0,
+            "useful_rate": round(self.used / self.prefetched, 3) if self.prefetched else 0.0,
+        }
+
+
+class Prefetcher:
+    """
+    Researches entities from ordinary conversation ahead of an explicit
+    trigger, so that "did you say X" is usually a cache hit (or joins the
+    request already in flight).
+
+    Prefetching stays out of the way of triggered research:
+    - at most `max_in_flight` prefetches run at once, and none start while
+      `busy()` reports triggered research in flight
+    - a token bucket allows `rate_per_minute` requests, and `max_requests`
+      caps the whole session
+    - candidates wait in a small queue, newest first; older ones are dropped
+      when it overflows or after `max_age_seconds`
+
+    observe() and record_trigger() may be called from any thread.
+    """
+
+    def __init__(
+        self,
+        engine: "ResearchEngine",
+        rate_per_minute: float = 4.0,
+        max_requests: int = 60,
+        max_in_flight: int = 1,
+        queue_size: int = 8,
+        max_age_seconds: float = 60.0,
+        dictionary: Iterable[str] = (),
+        busy: Optional[Callable[[], bool]] = None,
+    ):
+        """
+        Args:
+            engine: Research engine whose cache is filled
+            rate_per_minute: Sustained prefetch rate
+            max_requests: Prefetch budget for the session
+            max_in_flight: Concurrent prefetches
+            queue_size: Candidates waiting for a slot
+            max_age_seconds: Candidates older than this are no longer relevant
+            dictionary: Known product names, matched case-insensitively
+            busy: Returns True while triggered research is running; can
+                also be set later through the `busy` attribute
+        """
+        self.engine = engine
+        self.rate_per_minute = rate_per_minute
+        self.max_requests = max_requests
+        self.max_in_flight = max_in_flight
+        self.max_age_seconds = max_age_seconds
+        self.busy = busy
+        self._dictionary = build_dictionary(dictionary)
+
+        self._queue: Deque[Tuple[float, str]] = deque(maxlen=queue_size)
+        self._prefetched: Dict[str, str] = {}  # Topic key -> "in_flight" | "done" | "failed"
+        self._used = set()
+        self._in_flight = 0
+        self._tokens = 1.0  # Token bucket, capacity 1: requests are spaced out
+        self._refilled_at = time.monotonic()
+        self._timer: Optional[threading.Timer] = None  # Pending pump, off the caller's thread
+        self._timer_due = 0.0
+        self._closed = False
+        self._stats = PrefetchStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> PrefetchStats:
+        with self._lock:
+            return replace(self._stats)
+
+    def observe(self, text: str):
+        """Queue the entities of a transcript that had no trigger"""
+        candidates = extract_candidates(text, self._dictionary)
+        now = time.monotonic()
+        with self._lock:
+            self._stats.transcripts += 1
+            for candidate in candidates:
+                if normalize_topic(candidate) in self._prefetched:
+                    continue
+                self._stats.candidates += 1
+                if len(self._queue) == self._queue.maxlen:
+                    self._stats.dropped += 1
+                self._queue.append((now, candidate))
+        if candidates:
+            logger.debug(f"Prefetch candidates: {candidates}")
+        self.pump()
+
+    def record_trigger(self, topic: str) -> bool:
+        """
+        Count an explicit research trigger.
+
+        Returns:
+            True if its topic was prefetched
+        """
+        key = normalize_topic(topic)
+        with self._lock:
+            self._stats.triggers += 1
+            state = self._prefetched.get(key)
+            if state is None or state == "failed":
+                return False
+            self._stats.hits += 1
+            if key not in self._used:
+                self._used.add(key)
+                self._stats.used += 1
+        logger.info(f"Prefetch hit for '{topic}' ({state.replace('_', ' ')})")
+        return True
+
+    def pump(self):
+        """Start queued prefetches while the limits allow"""
+        while True:
+            topic = self._next_topic()
+            if topic is None:
+                return
+            if self.engine.is_cached(topic):
+                # Nothing to fetch: give back what _next_topic() claimed
+                with self._lock:
+                    del self._prefetched[normalize_topic(topic)]
+                    self._stats.already_cached += 1
+                    self._stats.prefetched -= 1
+                    self._in_flight -= 1
+                    self._tokens += 1
+                continue
+
+            logger.info(f"Prefetching '{topic}'")
+            future = self.engine.submit(topic)
+            future.add_done_callback(lambda f, topic=topic: self._on_done(f, topic))
+
+    def _next_topic(self) -> Optional[str]:
+        """Claim a slot, a rate token and the newest fresh candidate, or None"""
+        now = time.monotonic()
+        with self._lock:
+            self._tokens = min(1.0, self._tokens + (now - self._refilled_at) * self.rate_per_minute / 60)
+            self._refilled_at = now
+            if self._closed or not self._queue or self._in_flight >= self.max_in_flight:
+                return None
+            if self._tokens < 1:
+                self._schedule_retry((1 - self._tokens) * 60 / self.rate_per_minute)
+                return None
+            if self._stats.prefetched >= self.max_requests:
+                if not self._stats.budget_exhausted:
+                    logger.info(f"Prefetch budget of {self.max_requests} requests used up")
+                self._stats.budget_exhausted = True
+                return None
+            if self.busy is not None and self.busy():
+                return None
+
+            while self._queue:
+                queued_at, topic = self._queue.pop()
+                key = normalize_topic(topic)
+                if now - queued_at > self.max_age_seconds:
+                    self._stats.dropped += 1
+                    continue
+                if key in self._prefetched:
+                    continue
+                self._prefetched[key] = "in_flight"
+                self._in_flight += 1
+                self._tokens -= 1
+                self._stats.prefetched += 1
+                return topic
+            return None
+
+    def schedule_pump(self, delay: float = 0.0):
+        """pump() on a timer thread: pump() reads SQLite, so never call it on the event loop"""
+        with self._lock:
+            self._schedule_retry(delay)
+
+    def _schedule_retry(self, delay: float):
+        """Pump again after delay seconds (called with the lock held)"""
+        due = time.monotonic() + delay
+        if self._closed or (self._timer is not None and self._timer_due <= due):
+            return  # A pump is already due by then
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self._on_timer)
+        self._timer_due = due
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_timer(self):
+        with self._lock:
+            self._timer = None
+        self.pump()
+
+    def close(self):
+        """Stop starting prefetches; requests already issued finish on their own"""
+        with self._lock:
+            self._closed = True
+            self._queue.clear()
+            if self._timer is not None:
+                self._timer.cancel()
+
+    def _on_done(self, future, topic: str):
+        """Record a finished prefetch (on the research event loop thread)"""
+        success = not future.cancelled() and future.exception() is None and future.result().success
+        with self._lock:
+            self._in_flight -= 1
+            self._prefetched[normalize_topic(topic)] = "done" if success else "failed"
+            if not success:
+                self._stats.failed += 1
+            self._schedule_retry(0)  # See schedule_pump()
+        if not success:
+            logger.debug(f"Prefetch of '{topic}' failed")
@@ -1,4 +1,5 @@
 from .base import BaseProvider
+from .compatible import OpenAICompatibleProvider
 from .openai_provider import OpenAIProvider
 
-__all__ = ['BaseProvider', 'OpenAIProvider']
+__all__ = ['BaseProvider', 'OpenAICompatibleProvider', 'OpenAIProvider']
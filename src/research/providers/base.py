@@ -2,7 +2,8 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import AsyncIterator, Callable, Optional
+import asyncio
 import time
 
 
@@ -16,6 +17,9 @@ class ResearchResult:
     latency_ms: int
     success: bool
     error: Optional[str] = None
+    cached: bool = False
+    first_token_ms: Optional[int] = None
+    hedged: bool = False  # A second provider was raced against the first
     
     def to_dict(self) -> dict:
         return {
@@ -26,6 +30,9 @@ class ResearchResult:
             "latency_ms": self.latency_ms,
             "success": self.success,
             "error": self.error,
+            "cached": self.cached,
+            "first_token_ms": self.first_token_ms,
+            "hedged": self.hedged,
         }
 
 
@@ -66,6 +73,75 @@ class BaseProvider(ABC):
         """
         pass
     
+    async def research_stream(self, topic: str, context: str) -> AsyncIterator[str]:
+        """
+        Research a topic, yielding the summary as text deltas.
+        
+        Providers without native streaming yield the whole summary at once.
+        
+        Raises:
+            RuntimeError if the research request failed
+        """
+        result = await self.research(topic, context)
+        if not result.success:
+            raise RuntimeError(result.error or "Research failed")
+        yield result.summary
+    
+    async def research_streaming(
+        self,
+        topic: str,
+        context: str,
+        on_delta: Callable[[str], None],
+    ) -> ResearchResult:
+        """
+        Consume research_stream(), forwarding each delta to on_delta.
+        
+        Returns:
+            ResearchResult with the full summary, time-to-first-token and
+            total latency
+        """
+        start_time = time.time()
+        first_token_ms = None
+        parts = []
+        
+        try:
+            async for delta in self.research_stream(topic, context):
+                if not delta:
+                    continue
+                if first_token_ms is None:
+                    first_token_ms = int((time.time() - start_time) * 1000)
+                parts.append(delta)
+                on_delta(delta)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            return self._create_result(
+                topic=topic,
+                latency_ms=int((time.time() - start_time) * 1000),
+                success=False,
+                error="Request timed out",
+            )
+        except Exception as e:
+            return self._create_result(
+                topic=topic,
+                latency_ms=int((time.time() - start_time) * 1000),
+                success=False,
+                error=str(e),
+            )
+        
+        result = self._create_result(
+            topic=topic,
+            summary="".join(parts).strip(),
+            latency_ms=int((time.time() - start_time) * 1000),
+            success=True,
+        )
+        result.first_token_ms = first_token_ms
+        return result
+    
+    async def close(self) -> None:
+        """Release any network resources held by the provider"""
+        pass
+    
     def _create_result(
         self,
         topic: str,
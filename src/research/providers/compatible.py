@@ -0,0 +1,53 @@
+"""Providers that expose an OpenAI-compatible chat completions API"""
+
+import os
+import logging
+from typing import Optional
+
+from .openai_provider import OpenAIProvider
+
+logger = logging.getLogger(__name__)
+
+# name -> (default endpoint, API key environment variable)
+COMPATIBLE_ENDPOINTS = {
+    "deepseek": ("https://api.deepseek.com", "DEEPSEEK_API_KEY"),
+    "gemini": ("https://generativelanguage.googleapis.com/v1beta/openai/", "GEMINI_API_KEY"),
+    "glm": ("https://open.bigmodel.cn/api/paas/v4/", "GLM_API_KEY"),
+}
+
+
+class OpenAICompatibleProvider(OpenAIProvider):
+    """DeepSeek, Gemini or GLM through their OpenAI-compatible endpoints"""
+
+    def __init__(
+        self,
+        name: str,
+        model: str,
+        max_tokens: int = 250,
+        temperature: float = 0.3,
+        timeout_seconds: int = 15,
+        web_search: bool = True,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+    ):
+        if name not in COMPATIBLE_ENDPOINTS:
+            raise ValueError(f"Unknown provider '{name}', expected one of {list(COMPATIBLE_ENDPOINTS)}")
+        default_url, key_env = COMPATIBLE_ENDPOINTS[name]
+        api_key = api_key or os.getenv(key_env)
+        if not api_key:
+            raise ValueError(f"{key_env} is not set")
+
+        super().__init__(
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            timeout_seconds=timeout_seconds,
+            web_search=web_search,
+            api_key=api_key,
+            base_url=base_url or default_url,
+        )
+        self._name = name
+
+    @property
+    def provider_name(self) -> str:
+        return self._name
@@ -3,7 +3,7 @@
 import asyncio
 import time
 import logging
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from openai import AsyncOpenAI
 from .base import BaseProvider, ResearchResult
@@ -22,52 +22,83 @@ class OpenAIProvider(BaseProvider):
         timeout_seconds: int = 15,
         web_search: bool = True,
         api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
     ):
         super().__init__(model, max_tokens, temperature, timeout_seconds, web_search)
-        self._client = AsyncOpenAI(api_key=api_key) if api_key else AsyncOpenAI()
+        client_kwargs = {}
+        if api_key:
+            client_kwargs["api_key"] = api_key
+        if base_url:
+            client_kwargs["base_url"] = base_url
+        self._client = AsyncOpenAI(**client_kwargs)
     
     @property
     def provider_name(self) -> str:
         return "openai"
     
+    async def close(self) -> None:
+        """Close the underlying HTTP client"""
+        await self._client.close()
+    
+    def _request_kwargs(self, topic: str, context: str) -> dict:
+        """Build chat completion request kwargs"""
+        messages = [
+            {"role": "system", "content": context},
+            {"role": "user", "content": f"Research this topic briefly: {topic}"}
+        ]
+        
+        # Note: web_search tool disabled for MVP - model returns content directly
+        # TODO: Implement actual web search in Phase 3
+        
+        return {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "timeout": self.timeout_seconds,
+        }
+    
+    async def research_stream(self, topic: str, context: str) -> AsyncIterator[str]:
+        """Stream research deltas using the OpenAI streaming API"""
+        kwargs = self._request_kwargs(topic, context)
+        
+        logger.info(f"Streaming request to {self.provider_name}: model={self.model}, max_tokens={self.max_tokens}")
+        stream = await self._client.chat.completions.create(stream=True, **kwargs)
+        
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+        finally:
+            # Closes the HTTP response if the consumer stops early
+            await stream.close()
+    
     async def research(self, topic: str, context: str) -> ResearchResult:
         """Research topic using OpenAI API"""
         start_time = time.time()
         
         try:
-            messages = [
-                {"role": "system", "content": context},
-                {"role": "user", "content": f"Research this topic briefly: {topic}"}
-            ]
-            
-            # Build request kwargs
-            kwargs = {
-                "model": self.model,
-                "messages": messages,
-                "max_tokens": self.max_tokens,
-                "temperature": self.temperature,
-                "timeout": self.timeout_seconds,
-            }
-            
-            # Note: web_search tool disabled for MVP - model returns content directly
-            # TODO: Implement actual web search in Phase 3
+            kwargs = self._request_kwargs(topic, context)
             
             # Make API call
-            logger.info(f"Sending request to OpenAI: model={self.model}, max_tokens={self.max_tokens}")
+            logger.info(f"Sending request to {self.provider_name}: model={self.model}, max_tokens={self.max_tokens}")
             response = await self._client.chat.completions.create(**kwargs)
             
             message = response.choices[0].message
-            logger.info(f"OpenAI raw response: content={message.content!r}, tool_calls={message.tool_calls}")
+            logger.info(f"{self.provider_name} raw response: content={message.content!r}, tool_calls={message.tool_calls}")
             
             summary = message.content or ""
             
             if not summary and message.tool_calls:
                 logger.warning("Model returned tool_calls instead of content - tools should be disabled!")
             
-            logger.info(f"OpenAI response content length: {len(summary)}")
+            logger.info(f"{self.provider_name} response content length: {len(summary)}")
             latency_ms = int((time.time() - start_time) * 1000)
             
-            logger.info(f"OpenAI research completed in {latency_ms}ms")
+            logger.info(f"{self.provider_name} research completed in {latency_ms}ms")
             
             return self._create_result(
                 topic=topic,
@@ -78,7 +109,7 @@ class OpenAIProvider(BaseProvider):
             
         except asyncio.TimeoutError:
             latency_ms = int((time.time() - start_time) * 1000)
-            logger.error(f"OpenAI request timed out after {latency_ms}ms")
+            logger.error(f"{self.provider_name} request timed out after {latency_ms}ms")
             return self._create_result(
                 topic=topic,
                 latency_ms=latency_ms,
@@ -88,7 +119,7 @@ class OpenAIProvider(BaseProvider):
             
         except Exception as e:
             latency_ms = int((time.time() - start_time) * 1000)
-            logger.error(f"OpenAI request failed: {e}")
+            logger.error(f"{self.provider_name} request failed: {e}")
             return self._create_result(
                 topic=topic,
                 latency_ms=latency_ms,
@@ -0,0 +1,142 @@
+"""Single-flight coalescing: concurrent identical research requests share one call"""
+
+import asyncio
+import time
+from dataclasses import dataclass, replace
+from typing import Awaitable, Callable, Dict, List, Optional
+import logging
+
+from .providers.base import ResearchResult
+
+logger = logging.getLogger(__name__)
+
+DeltaCallback = Callable[[str], None]
+
+
+@dataclass
+class CoalesceStats:
+    """Counters for coalesced research requests"""
+    flights: int = 0  # Provider calls started
+    coalesced: int = 0  # Requests that joined a call already in flight
+    cancelled: int = 0  # Calls cancelled because every waiter went away
+    in_flight: int = 0
+
+    def to_dict(self) -> dict:
+        requests = self.flights + self.coalesced
+        return {
+            "flights": self.flights,
+            "coalesced": self.coalesced,
+            "coalesce_rate": round(self.coalesced / requests, 3) if requests else 0.0,
+            "cancelled": self.cancelled,
+            "in_flight": self.in_flight,
+        }
+
+
+class _Flight:
+    """One in-flight call and the callers waiting on it"""
+
+    def __init__(self, streaming: bool):
+        self.task: Optional[asyncio.Task] = None
+        self.streaming = streaming
+        self.parts: List[str] = []  # Deltas so far, replayed to late joiners
+        self.listeners: List[DeltaCallback] = []
+        self.waiters = 0
+
+    def forward(self, delta: str):
+        self.parts.append(delta)
+        for listener in list(self.listeners):
+            listener(delta)
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent research requests by key.
+
+    The first request for a key starts the call; requests for the same key
+    arriving while it is in flight wait on the same task instead of starting
+    their own. Streaming joiners first get the text streamed so far, then
+    the remaining deltas. The call runs as its own task, so one caller being
+    cancelled does not cancel it for the others; it is only cancelled once
+    every caller has gone away. Must be used from a single event loop.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self._stats = CoalesceStats()
+
+    @property
+    def stats(self) -> CoalesceStats:
+        return replace(self._stats)
+
+    async def run(
+        self,
+        key: str,
+        topic: str,
+        call: Callable[[Optional[DeltaCallback]], Awaitable[ResearchResult]],
+        on_delta: Optional[DeltaCallback] = None,
+    ) -> ResearchResult:
+        """
+        Run `call`, or join the identical call already in flight.
+
+        Args:
+            key: Identity of the request (normalized topic, context, route)
+            topic: Topic as this caller phrased it, used in its result
+            call: Starts the request; receives a streaming callback, or None
+                if the call should not stream
+            on_delta: This caller's streaming callback
+
+        Returns:
+            The shared ResearchResult, carrying this caller's topic
+        """
+        start = time.monotonic()
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(streaming=on_delta is not None)
+            flight.task = asyncio.ensure_future(call(flight.forward if flight.streaming else None))
+            flight.task.add_done_callback(lambda _task: self._finish(key, flight))
+            self._flights[key] = flight
+            self._stats.flights += 1
+            self._stats.in_flight += 1
+            joined = False
+        else:
+            self._stats.coalesced += 1
+            joined = True
+            logger.info(f"Coalesced '{topic}' with the request already in flight")
+
+        listener = None
+        if on_delta is not None and flight.streaming:
+            if flight.parts:
+                on_delta("".join(flight.parts))
+            listener = on_delta
+            flight.listeners.append(listener)
+
+        flight.waiters += 1
+        try:
+            result = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.task.cancelled():
+                raise
+            # This caller went away; stop the call if nobody else is waiting
+            flight.waiters -= 1
+            if listener is not None:
+                flight.listeners.remove(listener)
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+                self._stats.cancelled += 1
+            raise
+
+        if on_delta is not None and not flight.streaming and result.success:
+            on_delta(result.summary)
+        if not joined:
+            return result
+        return replace(result, topic=topic, latency_ms=int((time.monotonic() - start) * 1000))
+
+    def waiters(self, key: str) -> int:
+        """Callers still waiting on the call in flight for key"""
+        flight = self._flights.get(key)
+        return flight.waiters if flight is not None and not flight.task.done() else 0
+
+    def _finish(self, key: str, flight: _Flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        self._stats.in_flight -= 1
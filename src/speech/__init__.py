@@ -1,4 +1,6 @@
+from .asr_worker import ASRWorker
 from .recognizer import SpeechRecognizer
+from .transcript_cache import TranscriptCache
 from .trigger_detector import TriggerDetector
 
-__all__ = ['SpeechRecognizer', 'TriggerDetector']
+__all__ = ['ASRWorker', 'SpeechRecognizer', 'TranscriptCache', 'TriggerDetector']
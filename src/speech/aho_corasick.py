@@ -0,0 +1,95 @@
+"""Aho–Corasick automaton for matching many phrases in one pass"""
+
+from collections import deque
+from typing import Dict, Generic, Iterable, List, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class AhoCorasick(Generic[V]):
+    """
+    Multi-pattern string matcher.
+
+    Patterns are added with an associated value and compiled into a trie
+    with failure links; `find_all` then reports every occurrence of every
+    pattern in a single left-to-right pass, so the cost per text does not
+    grow with the number of patterns.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, V]] = ()):
+        # Node 0 is the root; each node has transitions, a failure link and
+        # the (length, value) of every pattern ending there
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, V]]] = [[]]
+        self._built = True
+        self._count = 0
+
+        for pattern, value in patterns:
+            self.add(pattern, value)
+        self.build()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, pattern: str, value: V):
+        """Add a pattern; call build() before matching again"""
+        if not pattern:
+            return
+
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = next_node
+
+        self._out[node].append((len(pattern), value))
+        self._count += 1
+        self._built = False
+
+    def build(self):
+        """Compute failure links (breadth-first) and merge outputs along them"""
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+        self._built = True
+
+    def find_all(self, text: str) -> List[Tuple[int, int, V]]:
+        """
+        Find every pattern occurrence in text.
+
+        Returns:
+            (start, end, value) tuples, ordered by end position
+        """
+        if not self._built:
+            self.build()
+
+        goto, fail, out = self._goto, self._fail, self._out
+        matches = []
+        node = 0
+        for end, char in enumerate(text, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                for length, value in out[node]:
+                    matches.append((end - length, end, value))
+        return matches
@@ -0,0 +1,336 @@
+"""
+Dedicated process for local Whisper inference.
+
+The faster-whisper model is loaded (and warmed up with a dummy inference) in
+a child process at startup, so the first utterance of a meeting doesn't pay
+for model loading and inference never competes with Qt and audio capture
+for the GIL. Audio is handed over through shared memory slots; only small
+request tuples cross the process boundary. The worker transcribes one
+request at a time, in arrival order.
+"""
+
+import itertools
+import multiprocessing as mp
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_STOP = None
+
+
+@dataclass
+class ASRWorkerStats:
+    """Request counters for the ASR worker"""
+    requests: int = 0
+    completed: int = 0
+    errors: int = 0
+    oversized: int = 0  # Requests too long for a slot (sent via a one-off buffer)
+    slot_timeouts: int = 0  # Requests failed because no slot came free (worker stuck)
+    load_ms: float = 0.0
+    warmup_ms: float = 0.0
+    total_inference_ms: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "completed": self.completed,
+            "errors": self.errors,
+            "oversized": self.oversized,
+            "slot_timeouts": self.slot_timeouts,
+            "load_ms": round(self.load_ms, 1),
+            "warmup_ms": round(self.warmup_ms, 1),
+            "avg_inference_ms": round(self.total_inference_ms / self.completed, 1) if self.completed else 0.0,
+        }
+
+
+def _worker_main(model_size, language, cache_dir, batch_size, warmup,
+                 slot_names, slot_samples, requests, responses):
+    """Child process: load the model, then transcribe requests one at a time"""
+    from .recognizer import load_whisper_model, run_whisper
+
+    slots = [shared_memory.SharedMemory(name=name) for name in slot_names]
+    views = [np.ndarray((slot_samples,), dtype=np.float32, buffer=slot.buf) for slot in slots]
+
+    try:
+        started = time.monotonic()
+        model = load_whisper_model(model_size, cache_dir)
+        if batch_size:
+            try:
+                from faster_whisper import BatchedInferencePipeline
+                model = BatchedInferencePipeline(model=model)
+            except ImportError:
+                batch_size = 0  # Older faster-whisper: sequential decoding
+        load_ms = (time.monotonic() - started) * 1000
+
+        warmup_ms = 0.0
+        if warmup:
+            # The first inference initializes kernels and caches; do it now
+            started = time.monotonic()
+            noise = (np.random.default_rng(0).standard_normal(16000) * 1e-3).astype(np.float32)
+            run_whisper(model, noise, language, batch_size)
+            warmup_ms = (time.monotonic() - started) * 1000
+    except Exception as e:
+        responses.put(("ready", False, f"{type(e).__name__}: {e}", 0.0, 0.0))
+        for slot in slots:
+            slot.close()
+        return
+
+    responses.put(("ready", True, None, load_ms, warmup_ms))
+
+    while True:
+        request = requests.get()
+        if request is _STOP:
+            break
+
+        request_id, slot, shm_name, samples = request
+        extra = None
+        try:
+            if slot is not None:
+                audio = views[slot][:samples]
+            else:
+                extra = shared_memory.SharedMemory(name=shm_name)
+                audio = np.ndarray((samples,), dtype=np.float32, buffer=extra.buf)
+
+            started = time.monotonic()
+            text, confidence = run_whisper(model, audio, language, batch_size)
+            elapsed_ms = (time.monotonic() - started) * 1000
+            responses.put(("result", request_id, text, confidence, elapsed_ms, None))
+        except Exception as e:
+            responses.put(("result", request_id, "", 0.0, 0.0, f"{type(e).__name__}: {e}"))
+        finally:
+            audio = None
+            if extra is not None:
+                extra.close()
+
+    views.clear()
+    for slot in slots:
+        slot.close()
+
+
+class ASRWorker:
+    """
+    Client for the ASR worker process.
+
+    `slots` shared-memory buffers of `max_audio_seconds` each are allocated
+    up front; a request copies its audio into a free slot and sends only the
+    slot number. Audio longer than a slot gets a one-off buffer. The worker
+    is sequential: requests queue up and are transcribed one after another,
+    so extra slots only let callers hand over audio without waiting.
+    `batch_size` batches the 30 s windows within one utterance
+    (faster-whisper's BatchedInferencePipeline), not separate requests.
+    """
+
+    def __init__(
+        self,
+        model_size: str = "tiny",
+        language: str = "en",
+        cache_dir: Optional[Path] = None,
+        sample_rate: int = 16000,
+        max_audio_seconds: float = 30.0,
+        slots: int = 4,
+        batch_size: int = 0,
+        warmup: bool = True,
+        slot_timeout: float = 30.0,
+    ):
+        self.model_size = model_size
+        self.language = language
+        self.cache_dir = cache_dir or Path.home() / "MeetingAssistant" / "cache" / "whisper_model"
+        self.slot_samples = int(max_audio_seconds * sample_rate)
+        self.batch_size = batch_size
+        self.warmup = warmup
+        self.slot_timeout = slot_timeout  # Wait for a free slot before failing the request
+
+        self._slots = [
+            shared_memory.SharedMemory(create=True, size=self.slot_samples * 4) for _ in range(slots)
+        ]
+        self._views = [
+            np.ndarray((self.slot_samples,), dtype=np.float32, buffer=slot.buf) for slot in self._slots
+        ]
+        self._free_slots: "queue.Queue[int]" = queue.Queue()
+        for i in range(slots):
+            self._free_slots.put(i)
+
+        ctx = mp.get_context("spawn")  # No forked Qt/PortAudio state in the child
+        self._requests = ctx.Queue()
+        self._responses = ctx.Queue()
+        self._process: Optional[mp.process.BaseProcess] = None
+
+        self._pending: Dict[int, Tuple[Future, Optional[int], Optional[shared_memory.SharedMemory]]] = {}
+        self._pending_lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._ready = threading.Event()
+        self._ok = False
+        self.error: Optional[str] = None
+        self._stats = ASRWorkerStats()
+        self._reader: Optional[threading.Thread] = None
+        self._closed = False
+
+    def start(self):
+        """Start the worker process; the model loads in the background"""
+        self._process = mp.get_context("spawn").Process(
+            target=_worker_main,
+            args=(self.model_size, self.language, str(self.cache_dir), self.batch_size,
+                  self.warmup, [slot.name for slot in self._slots],
+                  self.slot_samples, self._requests, self._responses),
+            name="asr-worker",
+            daemon=True,
+        )
+        self._process.start()
+        self._reader = threading.Thread(target=self._read_responses, name="asr-worker-reader", daemon=True)
+        self._reader.start()
+        logger.info(f"ASR worker starting (pid {self._process.pid}, model {self.model_size})")
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the model to load and warm up.
+
+        Returns:
+            True if the worker is ready, False on failure or timeout
+        """
+        self._ready.wait(timeout)
+        return self._ok
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ok and self._process is not None and self._process.is_alive()
+
+    @property
+    def failed(self) -> bool:
+        """True once the worker has reported a load failure or died"""
+        if self._ready.is_set() and not self._ok:
+            return True
+        return self._process is not None and not self._process.is_alive() and not self._closed
+
+    def submit(self, audio: np.ndarray) -> Future:
+        """Queue audio for transcription; the future resolves to (text, confidence)"""
+        future: Future = Future()
+        if self._closed or self._process is None:
+            future.set_exception(RuntimeError("ASR worker is not running"))
+            return future
+
+        audio = np.asarray(audio, dtype=np.float32)
+        request_id = next(self._ids)
+        slot = extra = None
+
+        if len(audio) <= self.slot_samples:
+            try:
+                slot = self._free_slots.get(timeout=self.slot_timeout)
+            except queue.Empty:
+                # Every slot is held by a request the worker has not answered
+                self._stats.slot_timeouts += 1
+                future.set_exception(TimeoutError(f"No free ASR slot within {self.slot_timeout:.0f}s"))
+                return future
+            self._views[slot][:len(audio)] = audio
+            shm_name = None
+        else:
+            extra = shared_memory.SharedMemory(create=True, size=max(len(audio) * 4, 4))
+            np.ndarray((len(audio),), dtype=np.float32, buffer=extra.buf)[:] = audio
+            shm_name = extra.name
+            self._stats.oversized += 1
+
+        with self._pending_lock:
+            self._pending[request_id] = (future, slot, extra)
+        self._stats.requests += 1
+        self._requests.put((request_id, slot, shm_name, len(audio)))
+        return future
+
+    def transcribe(self, audio: np.ndarray, timeout: Optional[float] = 60.0) -> Tuple[str, float]:
+        """Blocking transcription through the worker"""
+        return self.submit(audio).result(timeout=timeout)
+
+    def _read_responses(self):
+        """Resolve futures from worker responses (runs on a reader thread)"""
+        while True:
+            try:
+                message = self._responses.get(timeout=0.5)
+            except queue.Empty:
+                if self._process is not None and not self._process.is_alive():
+                    self._fail_pending("ASR worker exited")
+                    self._ready.set()
+                    return
+                continue
+            except (EOFError, OSError):
+                return
+
+            if message is _STOP:
+                return
+
+            if message[0] == "ready":
+                _, ok, error, load_ms, warmup_ms = message
+                self._ok = ok
+                self.error = error
+                self._stats.load_ms = load_ms
+                self._stats.warmup_ms = warmup_ms
+                if ok:
+                    logger.info(f"ASR worker ready (load {load_ms:.0f}ms, warm-up {warmup_ms:.0f}ms)")
+                else:
+                    logger.error(f"ASR worker failed to start: {error}")
+                self._ready.set()
+                continue
+
+            _, request_id, text, confidence, elapsed_ms, error = message
+            with self._pending_lock:
+                future, slot, extra = self._pending.pop(request_id, (None, None, None))
+            self._release(slot, extra)
+            if future is None:
+                continue
+
+            self._stats.completed += 1
+            self._stats.total_inference_ms += elapsed_ms
+            if error:
+                self._stats.errors += 1
+                future.set_exception(RuntimeError(error))
+            else:
+                future.set_result((text, confidence))
+
+    def _release(self, slot: Optional[int], extra: Optional[shared_memory.SharedMemory]):
+        if slot is not None:
+            self._free_slots.put(slot)
+        if extra is not None:
+            extra.close()
+            extra.unlink()
+
+    def _fail_pending(self, reason: str):
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        for future, slot, extra in pending.values():
+            self._release(slot, extra)
+            if not future.done():
+                future.set_exception(RuntimeError(reason))
+
+    @property
+    def stats(self) -> ASRWorkerStats:
+        return ASRWorkerStats(**vars(self._stats))
+
+    def close(self, timeout: float = 5.0):
+        """Stop the worker process and free the shared memory"""
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._process is not None:
+            self._requests.put(_STOP)
+            self._process.join(timeout=timeout)
+            if self._process.is_alive():
+                logger.warning("ASR worker did not exit, terminating")
+                self._process.terminate()
+                self._process.join(timeout=1.0)
+        self._responses.put(_STOP)
+        if self._reader is not None:
+            self._reader.join(timeout=1.0)
+        self._fail_pending("ASR worker closed")
+
+        self._views.clear()
+        for slot in self._slots:
+            slot.close()
+            slot.unlink()
@@ -0,0 +1,93 @@
+"""In-memory audio encoding for Whisper API uploads"""
+
+import io
+import wave
+import logging
+from typing import Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_FORMATS = ("wav", "flac", "ogg")
+
+_soundfile_warned = False
+
+
+def to_int16(audio: np.ndarray) -> np.ndarray:
+    """Convert float32 audio in [-1.0, 1.0] to int16 PCM"""
+    if audio.dtype == np.int16:
+        return audio
+    scaled = np.clip(audio, -1.0, 1.0) * 32767.0
+    return scaled.astype(np.int16)
+
+
+def _encode_wav(audio_int16: np.ndarray, sample_rate: int) -> io.BytesIO:
+    """Encode 16-bit mono PCM as WAV"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(audio_int16.tobytes())
+    return buffer
+
+
+def _encode_soundfile(audio_int16: np.ndarray, sample_rate: int, fmt: str) -> io.BytesIO:
+    """Encode with libsndfile (FLAC or OGG Opus/Vorbis)"""
+    import soundfile as sf
+
+    buffer = io.BytesIO()
+    if fmt == "flac":
+        sf.write(buffer, audio_int16, sample_rate, format="FLAC", subtype="PCM_16")
+    else:
+        subtype = "OPUS" if "OPUS" in sf.available_subtypes("OGG") else "VORBIS"
+        sf.write(buffer, audio_int16, sample_rate, format="OGG", subtype=subtype)
+    return buffer
+
+
+def encode_audio(
+    audio: np.ndarray,
+    sample_rate: int = 16000,
+    fmt: str = "wav",
+) -> Tuple[io.BytesIO, str]:
+    """
+    Encode audio into an in-memory file suitable for upload.
+
+    Compressed formats need the optional soundfile package; without it
+    the audio is sent as WAV.
+
+    Args:
+        audio: Mono audio as float32 (-1.0 to 1.0) or int16
+        sample_rate: Sample rate of audio
+        fmt: One of "wav", "flac", "ogg"
+
+    Returns:
+        Tuple of (buffer positioned at 0 with a .name, actual format used)
+    """
+    global _soundfile_warned
+
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported upload format: {fmt}")
+
+    audio_int16 = to_int16(audio)
+
+    buffer = None
+    if fmt != "wav":
+        try:
+            buffer = _encode_soundfile(audio_int16, sample_rate, fmt)
+        except ImportError:
+            if not _soundfile_warned:
+                logger.warning(f"soundfile not available, uploading WAV instead of {fmt}")
+                _soundfile_warned = True
+            fmt = "wav"
+        except Exception as e:
+            logger.warning(f"{fmt} encoding failed ({e}), uploading WAV")
+            fmt = "wav"
+
+    if buffer is None:
+        buffer = _encode_wav(audio_int16, sample_rate)
+
+    buffer.seek(0)
+    buffer.name = f"audio.{fmt}"  # The API infers the format from the name
+    return buffer, fmt
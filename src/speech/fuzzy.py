@@ -0,0 +1,340 @@
+"""Approximate trigger phrase matching, tolerant of ASR spelling errors"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_VOWELS = set("aeiou")
+_TOKEN_PATTERN = re.compile(r"[\w']+")
+
+# Spoken reductions ASR writes out as heard, expanded before scoring (a
+# window containing one scores reduction_score times its similarity)
+_REDUCTIONS = {
+    "ya": ("you",),
+    "yah": ("you",),
+    "what's": ("what", "is"),
+    "whats": ("what", "is"),
+    "lookup": ("look", "up"),
+    "tellme": ("tell", "me"),
+}
+
+
+@lru_cache(maxsize=8192)
+def phonetic_key(word: str) -> str:
+    """
+    Metaphone-style sound key: 'did you say' gives 'TiTYoSa'.
+
+    A simplified single-key variant of (Double) Metaphone: silent letters are
+    dropped and similar-sounding consonants collapse to one (uppercase)
+    symbol. A word-initial vowel is 'A'; later vowel groups keep their first
+    vowel in lowercase, so 'see', 'say' and 'sue' stay apart.
+    """
+    word = "".join(c for c in word.lower() if "a" <= c <= "z")
+    if not word:
+        return ""
+
+    if word[:2] in ("kn", "gn", "pn", "wr", "ae"):
+        word = word[1:]
+    elif word[0] == "x":
+        word = "s" + word[1:]
+    elif word[:2] == "wh":
+        word = "w" + word[2:]
+
+    key = []
+    n = len(word)
+    for i, c in enumerate(word):
+        prev = word[i - 1] if i else ""
+        nxt = word[i + 1] if i + 1 < n else ""
+        after = word[i + 2] if i + 2 < n else ""
+        if c == prev and c != "c":
+            continue
+
+        if c in _VOWELS:
+            if i == 0:
+                key.append("A")
+            elif prev not in _VOWELS:
+                key.append(c)
+        elif c == "b":
+            if not (prev == "m" and i == n - 1):
+                key.append("B")
+        elif c == "c":
+            if nxt == "i" and after == "a" or nxt == "h":
+                key.append("K" if prev == "s" else "X")
+            elif nxt in ("i", "e", "y"):
+                key.append("S")
+            else:
+                key.append("K")
+        elif c == "d":
+            key.append("J" if nxt == "g" and after in ("e", "i", "y") else "T")
+        elif c == "g":
+            if nxt == "h" and after and after not in _VOWELS:
+                continue
+            if nxt == "n" and (i + 2 == n or word[i + 2:] == "ed"):
+                continue
+            if prev == "d" and nxt in ("i", "e", "y"):
+                continue  # "dge" is already a J
+            key.append("J" if nxt in ("i", "e", "y") and prev != "g" else "K")
+        elif c == "h":
+            if nxt in _VOWELS and prev not in ("c", "s", "p", "t", "g"):
+                key.append("H")
+        elif c == "k":
+            if prev != "c":
+                key.append("K")
+        elif c == "p":
+            key.append("F" if nxt == "h" else "P")
+        elif c == "q":
+            key.append("K")
+        elif c == "s":
+            key.append("X" if nxt == "h" or (nxt == "i" and after in ("o", "a")) else "S")
+        elif c == "t":
+            if nxt == "i" and after in ("o", "a"):
+                key.append("X")
+            elif nxt == "h":
+                key.append("0")
+            elif not (nxt == "c" and after == "h"):
+                key.append("T")
+        elif c == "v":
+            key.append("F")
+        elif c in ("w", "y"):
+            if nxt in _VOWELS:
+                key.append(c.upper())
+        elif c == "x":
+            key.append("KS")
+        elif c == "z":
+            key.append("S")
+        else:
+            key.append(c.upper())  # f, j, l, m, n, r
+    return "".join(key)
+
+
+def char_masks(pattern: str) -> Dict[str, int]:
+    """Bit mask of the positions of each character, for levenshtein()"""
+    masks: Dict[str, int] = {}
+    for i, c in enumerate(pattern):
+        masks[c] = masks.get(c, 0) | (1 << i)
+    return masks
+
+
+def levenshtein(a: str, b: str, masks: Optional[Dict[str, int]] = None) -> int:
+    """
+    Edit distance, computed bit-parallel (Myers/Hyyrö): one pass over b with
+    a handful of integer operations per character.
+
+    Args:
+        a: First string
+        b: Second string
+        masks: char_masks(a), when comparing the same `a` repeatedly
+    """
+    if not a:
+        return len(b)
+    if masks is None:
+        masks = char_masks(a)
+
+    all_bits = (1 << len(a)) - 1
+    last_bit = 1 << (len(a) - 1)
+    pv, mv, distance = all_bits, 0, len(a)
+    for c in b:
+        eq = masks.get(c, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & all_bits) ^ pv) | eq
+        ph = mv | (~(xh | pv) & all_bits)
+        mh = pv & xh
+        if ph & last_bit:
+            distance += 1
+        elif mh & last_bit:
+            distance -= 1
+        ph = ((ph << 1) | 1) & all_bits
+        mh = (mh << 1) & all_bits
+        pv = mh | (~(xv | ph) & all_bits)
+        mv = ph & xv
+    return distance
+
+
+def tokenize(text: str) -> List[Tuple[str, int, int]]:
+    """
+    Words with their (start, end) offsets; apostrophes stay inside words.
+
+    Reductions such as "ya" or "what's" are expanded, each expanded word
+    keeping the span of the original.
+    """
+    tokens = []
+    for m in _TOKEN_PATTERN.finditer(text):
+        for word in _REDUCTIONS.get(m.group(), (m.group(),)):
+            tokens.append((word, m.start(), m.end()))
+    return tokens
+
+
+@dataclass
+class FuzzyMatch:
+    """An approximate trigger occurrence"""
+    value: object  # What the phrase was registered with (e.g. its trigger type)
+    phrase: str  # Trigger phrase as configured
+    start: int  # Character span in the matched text
+    end: int
+    score: float  # Similarity, 0-1
+
+
+@dataclass
+class _Entry:
+    value: object
+    phrase: str
+    tokens: int
+    words: List[str]
+    joined: str  # Phrase without spaces or apostrophes
+    key: str  # phonetic_key(joined)
+    joined_masks: Dict[str, int]  # char_masks() of joined and key
+    key_masks: Dict[str, int]
+
+
+class FuzzyTriggerIndex:
+    """
+    Precomputed index for approximate phrase matching.
+
+    A phrase is compared with word windows of the text joined without spaces
+    (so 'lookup' still matches 'look up'), scoring a blend of phonetic-key
+    and spelling edit distance. The spelling alone must also reach
+    min_spelling_score, so sound-alike words ('see' for 'say', 'lock' for
+    'look') do not match, and so must every word of the phrase on its own
+    (or sound the same and be one letter off, like 'sae' for 'say'): a
+    close phrase with one wrong word ('did you stay') is not a match.
+    Reductions ("what's", "ya") are expanded but score below an exact
+    match. Phrases are bucketed by their first three consonant sounds, so
+    each text position only scores the few phrases that start with a
+    similar sound.
+    """
+
+    BUCKET_SYMBOLS = 3
+
+    def __init__(
+        self,
+        phrases: Iterable[Tuple[str, object]],
+        min_score: float = 0.8,
+        phonetic_weight: float = 0.5,
+        min_phrase_chars: int = 5,
+        min_spelling_score: float = 0.85,
+        reduction_score: float = 0.9,
+    ):
+        """
+        Args:
+            phrases: (phrase, value) pairs
+            min_score: Minimum similarity for a match
+            phonetic_weight: Share of the score from the phonetic keys; the
+                rest comes from spelling
+            min_phrase_chars: Shorter phrases are left to exact matching
+            min_spelling_score: Minimum spelling similarity on its own
+            reduction_score: Score factor for windows containing an expanded
+                reduction, so "what's" is never an exact "what is"
+        """
+        self.min_score = min_score
+        self.phonetic_weight = phonetic_weight
+        self.min_spelling_score = min_spelling_score
+        self.reduction_score = reduction_score
+        self._buckets: Dict[str, List[_Entry]] = {}
+        self._bucket_lengths = set()
+
+        for phrase, value in phrases:
+            words = [word for word, _, _ in tokenize(phrase.lower())]
+            joined = "".join(words).replace("'", "")
+            bucket = self._skeleton(words)[:self.BUCKET_SYMBOLS]
+            if len(joined) < min_phrase_chars or not bucket:
+                continue
+            key = phonetic_key(joined)
+            entry = _Entry(value, phrase, len(words), words, joined, key, char_masks(joined), char_masks(key))
+            self._buckets.setdefault(bucket, []).append(entry)
+            self._bucket_lengths.add(len(bucket))
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._buckets.values())
+
+    def _skeleton(self, words: List[str]) -> str:
+        """Consonant sounds of the first few words (vowels dropped, so word splits don't matter)"""
+        keys = (phonetic_key(word).lstrip("A") for word in words[:self.BUCKET_SYMBOLS])
+        return "".join(c for key in keys for c in key if not c.islower())
+
+    def find_all(self, text: str) -> List[FuzzyMatch]:
+        """
+        Score phrases against every position of the (lowercased) text.
+
+        Returns:
+            The best-scoring window per phrase and start position, for all
+            matches at or above min_score
+        """
+        tokens = tokenize(text)
+        words = [token[0] for token in tokens]
+        expanded = [text[start:end] != word for word, start, end in tokens]
+        matches = []
+        for i in range(len(tokens)):
+            skeleton = self._skeleton(words[i:i + self.BUCKET_SYMBOLS])
+            windows = {}  # size -> (joined, phonetic key)
+
+            for length in self._bucket_lengths:
+                for entry in self._buckets.get(skeleton[:length], ()) if len(skeleton) >= length else ():
+                    best = None
+                    for size in (entry.tokens, entry.tokens - 1, entry.tokens + 1):
+                        if size < 1 or i + size > len(tokens):
+                            continue
+                        if size not in windows:
+                            joined = "".join(words[i:i + size]).replace("'", "")
+                            windows[size] = (joined, phonetic_key(joined))
+                        score = self._score(*windows[size], entry)
+                        if score and any(expanded[i:i + size]):
+                            score *= self.reduction_score
+                        if score < self.min_score or best is not None and score <= best.score:
+                            continue
+                        if self._words_match(entry.words, words[i:i + size]):
+                            best = FuzzyMatch(entry.value, entry.phrase, tokens[i][1], tokens[i + size - 1][2], score)
+                    if best is not None:
+                        matches.append(best)
+        return matches
+
+    def _score(self, joined: str, key: str, entry: _Entry) -> float:
+        """Blend of phonetic and spelling similarity, 0 if it can't reach min_score"""
+        weight = self.phonetic_weight
+        longest = max(len(joined), len(entry.joined))
+        longest_key = max(len(key), len(entry.key), 1)
+
+        # Cheap upper bound from the length differences alone
+        spelling_bound = 1 - abs(len(joined) - len(entry.joined)) / longest
+        if spelling_bound < self.min_spelling_score:
+            return 0.0
+        phonetic_bound = 1 - abs(len(key) - len(entry.key)) / longest_key
+        if weight * phonetic_bound + (1 - weight) * spelling_bound < self.min_score:
+            return 0.0
+
+        phonetic = 1 - levenshtein(entry.key, key, entry.key_masks) / longest_key
+        if weight * phonetic + (1 - weight) * spelling_bound < self.min_score:
+            return 0.0
+
+        spelling = 1 - levenshtein(entry.joined, joined, entry.joined_masks) / longest
+        if spelling < self.min_spelling_score:
+            return 0.0
+        return weight * phonetic + (1 - weight) * spelling
+
+    def _words_match(self, phrase: List[str], window: List[str]) -> bool:
+        """
+        Whether every phrase word has a close counterpart in the window.
+
+        Words are paired in order; a word may also pair with two adjacent
+        words joined ('lookup' with 'look up'), as the window sizes allow.
+        """
+        if not phrase or not window:
+            return not phrase and not window
+        for take_phrase, take_window in ((1, 1), (2, 1), (1, 2)):
+            if take_phrase > len(phrase) or take_window > len(window):
+                continue
+            if (self._word_matches("".join(phrase[:take_phrase]), "".join(window[:take_window]))
+                    and self._words_match(phrase[take_phrase:], window[take_window:])):
+                return True
+        return False
+
+    def _word_matches(self, expected: str, heard: str) -> bool:
+        """Spelling close enough, or the same sound one letter off"""
+        expected = expected.replace("'", "")
+        heard = heard.replace("'", "")
+        if expected == heard:
+            return True
+        distance = levenshtein(expected, heard)
+        if 1 - distance / max(len(expected), len(heard)) >= self.min_spelling_score:
+            return True
+        return distance == 1 and phonetic_key(expected) == phonetic_key(heard)
@@ -1,13 +1,99 @@
 """Speech recognition using OpenAI Whisper API (or local faster-whisper)"""
 
 import logging
+import os
+import time
 import numpy as np
 from typing import Optional, Tuple
 from pathlib import Path
 
+from .asr_worker import ASRWorker
+from .encoding import encode_audio
+from .transcript_cache import TranscriptCache, audio_fingerprint
+
 logger = logging.getLogger(__name__)
 
 
+def load_whisper_model(model_size: str, cache_dir: Path):
+    """
+    Load a faster-whisper model, on CUDA if available.
+    
+    Raises:
+        ImportError: if faster-whisper is not installed
+    """
+    from faster_whisper import WhisperModel
+    
+    # Ensure cache directory exists
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    
+    # Use CPU for compatibility, switch to cuda if available
+    compute_type = "int8"
+    device = "cpu"
+    
+    try:
+        import torch
+        if torch.cuda.is_available():
+            device = "cuda"
+            compute_type = "float16"
+            logger.info("Using CUDA for Whisper")
+    except ImportError:
+        pass
+    
+    logger.info(f"Loading Whisper model: {model_size} (device={device})")
+    model = WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        download_root=str(cache_dir),
+    )
+    logger.info("Whisper model loaded")
+    return model
+
+
+def run_whisper(model, audio: np.ndarray, language: str, batch_size: int = 0) -> Tuple[str, float]:
+    """
+    Transcribe float32 audio with a loaded faster-whisper model.
+    
+    Args:
+        model: WhisperModel, or a BatchedInferencePipeline when batch_size > 0
+        audio: Audio data as float32 numpy array
+        language: Language code
+        batch_size: Decode this many 30 s windows at once (batched pipeline only)
+    
+    Returns:
+        Tuple of (transcribed_text, confidence_score)
+    """
+    kwargs = dict(
+        language=language,
+        beam_size=5,
+        vad_filter=True,
+        vad_parameters=dict(
+            min_silence_duration_ms=500,
+        ),
+    )
+    if batch_size:
+        kwargs["batch_size"] = batch_size
+    segments, info = model.transcribe(audio, **kwargs)
+    
+    # Collect all segments
+    text_parts = []
+    confidences = []
+    
+    for segment in segments:
+        text_parts.append(segment.text)
+        confidences.append(segment.avg_logprob)
+    
+    text = " ".join(text_parts).strip()
+    
+    # Convert log probability to confidence (rough approximation)
+    avg_confidence = 0.0
+    if confidences:
+        avg_log_prob = sum(confidences) / len(confidences)
+        avg_confidence = min(1.0, max(0.0, 1.0 + avg_log_prob))
+    
+    return text, avg_confidence
+
+
 class SpeechRecognizer:
     """Transcribes audio using OpenAI Whisper API (default) or local faster-whisper"""
     
@@ -17,11 +103,19 @@ class SpeechRecognizer:
         language: str = "en",
         use_api: bool = True,  # Default to API for compatibility
         cache_dir: Optional[Path] = None,
+        upload_format: str = "wav",
+        base_url: Optional[str] = None,
+        transcript_cache: Optional[TranscriptCache] = None,
+        asr_worker: Optional[ASRWorker] = None,
     ):
         self.model_size = model_size
         self.language = language
         self.use_api = use_api
+        self.upload_format = upload_format
+        self.base_url = base_url
         self.cache_dir = cache_dir or Path.home() / "MeetingAssistant" / "cache" / "whisper_model"
+        self.transcript_cache = transcript_cache
+        self.asr_worker = asr_worker  # Local mode: run the model in a worker process
         
         self._model = None
         self._api_client = None
@@ -31,92 +125,92 @@ class SpeechRecognizer:
         if self.use_api:
             if self._api_client is None:
                 from openai import OpenAI
-                self._api_client = OpenAI()
-                logger.info("Using OpenAI Whisper API")
+                self._api_client = OpenAI(base_url=self.base_url) if self.base_url else OpenAI()
+                logger.info(f"Using OpenAI Whisper API{f' at {self.base_url}' if self.base_url else ''}")
             return
         
         if self._model is not None:
             return
         
+        if self.asr_worker is not None:
+            # Normally already loaded and warm: the worker is started at app startup
+            if self.asr_worker.wait_ready(timeout=120) and not self.asr_worker.failed:
+                return
+            logger.warning(f"ASR worker unavailable ({self.asr_worker.error or 'exited'}), "
+                           "loading model in-process")
+            self.asr_worker = None
+        
         try:
-            from faster_whisper import WhisperModel
-            
-            # Ensure cache directory exists
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Use CPU for compatibility, switch to cuda if available
-            compute_type = "int8"
-            device = "cpu"
-            
-            try:
-                import torch
-                if torch.cuda.is_available():
-                    device = "cuda"
-                    compute_type = "float16"
-                    logger.info("Using CUDA for Whisper")
-            except ImportError:
-                pass
-            
-            logger.info(f"Loading Whisper model: {self.model_size} (device={device})")
-            self._model = WhisperModel(
-                self.model_size,
-                device=device,
-                compute_type=compute_type,
-                download_root=str(self.cache_dir),
-            )
-            logger.info("Whisper model loaded")
+            self._model = load_whisper_model(self.model_size, self.cache_dir)
         except ImportError:
             logger.warning("faster-whisper not available, falling back to API")
             self.use_api = True
             self._init_model()
     
-    def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> Tuple[str, float]:
+    def transcribe(self, audio: np.ndarray, sample_rate: int = 16000, use_cache: bool = True) -> Tuple[str, float]:
         """
         Transcribe audio to text.
         
         Args:
             audio: Audio data as float32 numpy array (normalized to -1.0 to 1.0)
             sample_rate: Sample rate of audio
+            use_cache: Consult and fill the transcript cache (off for
+                one-off audio such as streaming partial windows)
             
         Returns:
             Tuple of (transcribed_text, confidence_score)
         """
+        # Checked before loading the model, so a fully cached replay never does
+        key = None
+        if self.transcript_cache is not None and use_cache:
+            key = audio_fingerprint(audio, self.model_id, self.language, sample_rate)
+            cached = self.transcript_cache.get(key)
+            if cached is not None:
+                logger.debug(f"Transcript cache hit: '{cached[0]}'")
+                return cached
+        
         self._init_model()
         
+        started = time.monotonic()
         if self.use_api:
-            return self._transcribe_api(audio, sample_rate)
+            text, confidence = self._transcribe_api(audio, sample_rate)
         else:
-            return self._transcribe_local(audio)
+            text, confidence = self._transcribe_local(audio)
+        
+        # Failures come back as ("", 0.0) and must not be cached
+        if key is not None and confidence > 0:
+            self.transcript_cache.put(key, text, confidence, (time.monotonic() - started) * 1000)
+        return text, confidence
+    
+    @property
+    def model_id(self) -> str:
+        """
+        Model identifier used in transcript cache keys.
+        
+        For the API it includes the endpoint, so transcripts from a mock or
+        proxy server are never served for the real API (and vice versa).
+        """
+        if not self.use_api:
+            return f"local:{self.model_size}"
+        endpoint = self.base_url or os.getenv("OPENAI_BASE_URL") or "https://api.openai.com/v1"
+        return f"api:whisper-1@{endpoint.rstrip('/')}"
     
     def _transcribe_local(self, audio: np.ndarray) -> Tuple[str, float]:
         """Transcribe using local faster-whisper model"""
         try:
-            segments, info = self._model.transcribe(
-                audio,
-                language=self.language,
-                beam_size=5,
-                vad_filter=True,
-                vad_parameters=dict(
-                    min_silence_duration_ms=500,
-                ),
-            )
-            
-            # Collect all segments
-            text_parts = []
-            confidences = []
-            
-            for segment in segments:
-                text_parts.append(segment.text)
-                confidences.append(segment.avg_logprob)
-            
-            text = " ".join(text_parts).strip()
-            
-            # Convert log probability to confidence (rough approximation)
-            avg_confidence = 0.0
-            if confidences:
-                avg_log_prob = sum(confidences) / len(confidences)
-                avg_confidence = min(1.0, max(0.0, 1.0 + avg_log_prob))
-            
+            if self.asr_worker is not None:
+                try:
+                    text, avg_confidence = self.asr_worker.transcribe(audio)
+                except Exception:
+                    if not self.asr_worker.failed:
+                        raise  # Busy or one bad request: fail just this utterance
+                    # The worker died: transcribe in-process from now on
+                    logger.warning("ASR worker exited, loading model in-process")
+                    self.asr_worker = None
+                    self._init_model()
+                    text, avg_confidence = run_whisper(self._model, audio, self.language)
+            else:
+                text, avg_confidence = run_whisper(self._model, audio, self.language)
             logger.debug(f"Transcribed: '{text}' (confidence: {avg_confidence:.2f})")
             return text, avg_confidence
             
@@ -126,33 +220,17 @@ class SpeechRecognizer:
     
     def _transcribe_api(self, audio: np.ndarray, sample_rate: int) -> Tuple[str, float]:
         """Transcribe using OpenAI Whisper API"""
-        import tempfile
-        import wave
-        
         try:
-            # Convert to int16 for WAV
-            audio_int16 = (audio * 32767).astype(np.int16)
-            
-            # Write to temporary WAV file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                temp_path = f.name
-                with wave.open(f, 'wb') as wav:
-                    wav.setnchannels(1)
-                    wav.setsampwidth(2)
-                    wav.setframerate(sample_rate)
-                    wav.writeframes(audio_int16.tobytes())
+            # Encode in memory - no temp files on the latency-critical path
+            audio_file, fmt = encode_audio(audio, sample_rate, self.upload_format)
+            logger.debug(f"Uploading {audio_file.getbuffer().nbytes} bytes ({fmt})")
             
             # Send to API
-            with open(temp_path, 'rb') as audio_file:
-                response = self._api_client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    language=self.language,
-                )
-            
-            # Clean up
-            import os
-            os.unlink(temp_path)
+            response = self._api_client.audio.transcriptions.create(
+                model="whisper-1",
+                file=audio_file,
+                language=self.language,
+            )
             
             text = response.text.strip()
             logger.debug(f"API transcribed: '{text}'")
@@ -0,0 +1,223 @@
+"""Transcript cache keyed by an audio fingerprint"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+import logging
+
+import numpy as np
+
+from .encoding import to_int16
+
+logger = logging.getLogger(__name__)
+
+DISK_TRIM_RATIO = 0.9  # A full disk tier is trimmed to this share of its cap
+
+
+def audio_fingerprint(
+    audio: np.ndarray,
+    model: str,
+    language: str,
+    sample_rate: int = 16000,
+    drop_bits: int = 4,
+) -> str:
+    """
+    Fast fingerprint of an utterance for a given model and language.
+
+    Samples are quantized to int16 and the lowest `drop_bits` bits are
+    discarded, which makes most re-decodes of the same recording hash alike.
+    Identical audio (replays, benchmark runs) always does. Hashing 10 s of
+    16 kHz audio takes about a millisecond.
+    """
+    pcm = to_int16(audio)
+    if drop_bits:
+        pcm = np.right_shift(pcm, drop_bits)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{model}\0{language}\0{sample_rate}\0{len(pcm)}\0".encode("utf-8"))
+    digest.update(pcm.tobytes())
+    return digest.hexdigest()
+
+
+@dataclass
+class TranscriptCacheStats:
+    """Hit/miss counters for the transcript cache"""
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    memory_entries: int = 0
+    saved_ms: float = 0.0  # ASR time avoided, from the cost recorded with each entry
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "memory_entries": self.memory_entries,
+            "hit_rate": round(self.hit_rate, 3),
+            "saved_ms": round(self.saved_ms, 1),
+        }
+
+
+class TranscriptCache:
+    """Caches (text, confidence) per audio fingerprint in memory (LRU) and on disk"""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        memory_max_entries: int = 512,
+        disk_max_entries: int = 20000,
+        disk_enabled: bool = True,
+    ):
+        self.memory_max_entries = memory_max_entries
+        self.disk_max_entries = disk_max_entries
+
+        # key -> (text, confidence, asr_ms)
+        self._memory: "OrderedDict[str, Tuple[str, float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = TranscriptCacheStats()
+
+        self._db: Optional[sqlite3.Connection] = None
+        self._disk_rows = 0  # Upper bound on the disk row count (replacements overcount)
+        if disk_enabled:
+            path = Path(path or Path.home() / "MeetingAssistant" / "cache" / "transcripts.sqlite3")
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(str(path), check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    """CREATE TABLE IF NOT EXISTS transcripts (
+                        key TEXT PRIMARY KEY,
+                        text TEXT NOT NULL,
+                        confidence REAL NOT NULL,
+                        asr_ms REAL NOT NULL DEFAULT 0,
+                        accessed_at REAL NOT NULL
+                    )"""
+                )
+                self._db.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_transcripts_accessed ON transcripts(accessed_at)"
+                )
+                self._db.commit()
+                self._disk_rows = self._db.execute("SELECT COUNT(*) FROM transcripts").fetchone()[0]
+                logger.info(f"Transcript cache at {path}")
+            except sqlite3.Error as e:
+                logger.error(f"Failed to open transcript cache {path}: {e}")
+                self._db = None
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """Look up a transcript, promoting disk hits into memory"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self._stats.memory_hits += 1
+                self._stats.saved_ms += entry[2]
+                return entry[0], entry[1]
+
+            if self._db is not None:
+                try:
+                    row = self._db.execute(
+                        "SELECT text, confidence, asr_ms FROM transcripts WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None:
+                        self._db.execute(
+                            "UPDATE transcripts SET accessed_at = ? WHERE key = ?", (time.time(), key)
+                        )
+                        self._db.commit()
+                        self._remember(key, row)
+                        self._stats.disk_hits += 1
+                        self._stats.saved_ms += row[2]
+                        return row[0], row[1]
+                except sqlite3.Error as e:
+                    logger.error(f"Transcript cache read failed: {e}")
+
+            self._stats.misses += 1
+            return None
+
+    def put(self, key: str, text: str, confidence: float, asr_ms: float = 0.0):
+        """Store a transcript in both tiers"""
+        entry = (text, confidence, asr_ms)
+        with self._lock:
+            self._remember(key, entry)
+            self._stats.stores += 1
+
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO transcripts (key, text, confidence, asr_ms, accessed_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (key, text, confidence, asr_ms, time.time()),
+                    )
+                    self._evict_disk()
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.error(f"Transcript cache write failed: {e}")
+
+    def clear(self):
+        """Drop all cached entries"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM transcripts")
+                self._db.commit()
+                self._disk_rows = 0
+
+    def close(self):
+        """Close the disk store"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    @property
+    def stats(self) -> TranscriptCacheStats:
+        with self._lock:
+            self._stats.memory_entries = len(self._memory)
+            return TranscriptCacheStats(**vars(self._stats))
+
+    def _remember(self, key: str, entry: Tuple[str, float, float]):
+        """Insert into the memory tier, evicting least recently used entries"""
+        self._memory[key] = tuple(entry)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_max_entries:
+            self._memory.popitem(last=False)
+            self._stats.evictions += 1
+
+    def _evict_disk(self):
+        """
+        Trim the disk tier to its size cap, least recently used first.
+
+        Rows are only counted once the running upper bound passes the cap,
+        not on every put, and a full tier is trimmed well below the cap so
+        the next count is many puts away.
+        """
+        self._disk_rows += 1
+        if self._disk_rows <= self.disk_max_entries:
+            return
+        count = self._db.execute("SELECT COUNT(*) FROM transcripts").fetchone()[0]
+        excess = count - int(self.disk_max_entries * DISK_TRIM_RATIO) if count > self.disk_max_entries else 0
+        self._disk_rows = count - excess
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM transcripts WHERE key IN "
+                "(SELECT key FROM transcripts ORDER BY accessed_at ASC LIMIT ?)",
+                (excess,),
+            )
+            self._stats.evictions += excess
@@ -5,8 +5,14 @@ import logging
 from typing import Optional, Tuple, List
 from dataclasses import dataclass
 
+from .aho_corasick import AhoCorasick
+from .fuzzy import FuzzyTriggerIndex
+
 logger = logging.getLogger(__name__)
 
+# Whitespace after a research trigger, then the topic up to the end of the sentence
+_TOPIC_PATTERN = re.compile(r"\s+(.+?)(?:[.?!]|$)")
+
 
 @dataclass
 class TriggerMatch:
@@ -21,6 +27,13 @@ class TriggerMatch:
 class TriggerDetector:
     """Detects trigger phrases in transcribed text and extracts topics"""
     
+    # Match type -> config lists feeding it, in precedence order
+    TRIGGER_TYPES = (
+        ('research', ('research', 'custom')),
+        ('transcription_start', ('transcription_start',)),
+        ('transcription_stop', ('transcription_stop',)),
+    )
+    
     def __init__(self, triggers_config: dict):
         """
         Args:
@@ -29,52 +42,49 @@ class TriggerDetector:
                 - transcription_start: ["can you repeat that", ...]
                 - transcription_stop: ["end note", ...]
                 - custom: [...]
+                - fuzzy: {enabled, min_score, phonetic_weight, min_phrase_chars,
+                  min_spelling_score, reduction_score}
         """
         self.triggers = triggers_config
         self._compile_patterns()
     
     def _compile_patterns(self):
-        """Compile regex patterns for trigger detection"""
-        self._patterns = {}
-        
-        # Research triggers - need to extract topic
-        research_triggers = self.triggers.get('research', []) + self.triggers.get('custom', [])
-        research_patterns = []
-        for trigger in research_triggers:
-            # Escape special chars and create pattern
-            # Match trigger phrase followed by topic (rest of text)
-            escaped = re.escape(trigger.lower())
-            pattern = rf"(?:^|[.\s])({escaped})\s+(.+?)(?:[.?!]|$)"
-            research_patterns.append(pattern)
-        
-        if research_patterns:
-            self._patterns['research'] = re.compile(
-                '|'.join(research_patterns),
-                re.IGNORECASE
-            )
-        
-        # Transcription start triggers - no topic extraction
-        start_triggers = self.triggers.get('transcription_start', [])
-        if start_triggers:
-            patterns = [re.escape(t.lower()) for t in start_triggers]
-            self._patterns['transcription_start'] = re.compile(
-                '|'.join(patterns),
-                re.IGNORECASE
-            )
+        """Compile all trigger phrases into one Aho–Corasick automaton"""
+        phrases = []
+        for trigger_type, keys in self.TRIGGER_TYPES:
+            for key in keys:
+                for trigger in self.triggers.get(key, []):
+                    phrase = trigger.lower().strip()
+                    if phrase:
+                        phrases.append((phrase, trigger_type))
+        self._automaton = AhoCorasick(phrases)
         
-        # Transcription stop triggers - no topic extraction
-        stop_triggers = self.triggers.get('transcription_stop', [])
-        if stop_triggers:
-            patterns = [re.escape(t.lower()) for t in stop_triggers]
-            self._patterns['transcription_stop'] = re.compile(
-                '|'.join(patterns),
-                re.IGNORECASE
+        # Approximate matching for research phrases ASR mangled ("did ya say",
+        # "lookup"). Transcription start/stop phrases stay exact-only: a false
+        # start or stop is far more disruptive than a missed lookup
+        fuzzy = self.triggers.get('fuzzy') or {}
+        self._fuzzy = None
+        if fuzzy.get('enabled', False):
+            self._fuzzy = FuzzyTriggerIndex(
+                [(phrase, trigger_type) for phrase, trigger_type in phrases if trigger_type == 'research'],
+                min_score=fuzzy.get('min_score', 0.8),
+                phonetic_weight=fuzzy.get('phonetic_weight', 0.5),
+                min_phrase_chars=fuzzy.get('min_phrase_chars', 5),
+                min_spelling_score=fuzzy.get('min_spelling_score', 0.85),
+                reduction_score=fuzzy.get('reduction_score', 0.9),
             )
     
     def detect(self, text: str) -> Optional[TriggerMatch]:
         """
         Detect trigger phrase in text.
         
+        All trigger phrases are located in one pass; research triggers take
+        precedence, then transcription start, then stop. Within a type the
+        earliest (and at the same position, the longest) phrase wins. When
+        nothing matches exactly and fuzzy matching is enabled, the best
+        approximate research match is used, with its similarity as the
+        confidence.
+        
         Args:
             text: Transcribed text to check
             
@@ -87,63 +97,71 @@ class TriggerDetector:
         text_clean = text.strip()
         text_lower = text_clean.lower()
         
-        # Check research triggers first (most common use case)
-        if 'research' in self._patterns:
-            match = self._patterns['research'].search(text_lower)
-            if match:
-                # Find which group matched
-                groups = match.groups()
-                trigger_phrase = None
-                topic = None
-                
-                # Groups come in pairs (trigger, topic) for each alternative
-                for i in range(0, len(groups), 2):
-                    if groups[i] is not None:
-                        trigger_phrase = groups[i]
-                        topic = groups[i + 1] if i + 1 < len(groups) else None
-                        break
-                
-                if trigger_phrase and topic:
-                    # Clean up the topic
-                    topic = self._clean_topic(topic)
-                    if topic:
-                        logger.info(f"Research trigger detected: '{trigger_phrase}' -> topic: '{topic}'")
-                        return TriggerMatch(
-                            trigger_type='research',
-                            trigger_phrase=trigger_phrase,
-                            topic=topic,
-                            confidence=0.9,
-                            raw_text=text_clean
-                        )
+        found = {trigger_type: [] for trigger_type, _ in self.TRIGGER_TYPES}
+        for start, end, trigger_type in self._automaton.find_all(text_lower):
+            found[trigger_type].append((start, end, text_lower[start:end], 1.0))
+        for spans in found.values():
+            spans.sort(key=lambda span: (span[0], span[0] - span[1]))
         
-        # Check transcription start triggers
-        if 'transcription_start' in self._patterns:
-            match = self._patterns['transcription_start'].search(text_lower)
-            if match:
-                logger.info(f"Transcription start trigger detected: '{match.group()}'")
+        match = self._first_match(found, text_lower, text_clean)
+        if match is None and self._fuzzy is not None:
+            found = {trigger_type: [] for trigger_type, _ in self.TRIGGER_TYPES}
+            for fuzzy in self._fuzzy.find_all(text_lower):
+                found[fuzzy.value].append((fuzzy.start, fuzzy.end, fuzzy.phrase, fuzzy.score))
+            for spans in found.values():
+                spans.sort(key=lambda span: (-span[3], span[0]))
+            match = self._first_match(found, text_lower, text_clean)
+        return match
+    
+    def _first_match(self, found: dict, text_lower: str, text_clean: str) -> Optional[TriggerMatch]:
+        """
+        Pick the trigger to report from candidate spans.
+        
+        Args:
+            found: trigger type -> [(start, end, phrase, confidence)], best first
+            text_lower: Lowercased text the spans refer to
+            text_clean: Original text, reported as raw_text
+        """
+        # Check research triggers first (most common use case)
+        for start, end, trigger_phrase, confidence in found['research']:
+            if start > 0 and not (text_lower[start - 1] == '.' or text_lower[start - 1].isspace()):
+                continue  # Inside a word
+            topic = self._extract_topic(text_lower, end)
+            if topic:
+                logger.info(f"Research trigger detected: '{trigger_phrase}' -> topic: '{topic}' "
+                            f"(confidence {confidence:.2f})")
                 return TriggerMatch(
-                    trigger_type='transcription_start',
-                    trigger_phrase=match.group(),
-                    topic=None,
-                    confidence=0.9,
+                    trigger_type='research',
+                    trigger_phrase=trigger_phrase,
+                    topic=topic,
+                    confidence=round(confidence, 3),
                     raw_text=text_clean
                 )
         
-        # Check transcription stop triggers
-        if 'transcription_stop' in self._patterns:
-            match = self._patterns['transcription_stop'].search(text_lower)
-            if match:
-                logger.info(f"Transcription stop trigger detected: '{match.group()}'")
+        # Check transcription start/stop triggers
+        for trigger_type in ('transcription_start', 'transcription_stop'):
+            if found[trigger_type]:
+                _, _, trigger_phrase, confidence = found[trigger_type][0]
+                label = 'start' if trigger_type == 'transcription_start' else 'stop'
+                logger.info(f"Transcription {label} trigger detected: '{trigger_phrase}' "
+                            f"(confidence {confidence:.2f})")
                 return TriggerMatch(
-                    trigger_type='transcription_stop',
-                    trigger_phrase=match.group(),
+                    trigger_type=trigger_type,
+                    trigger_phrase=trigger_phrase,
                     topic=None,
-                    confidence=0.9,
+                    confidence=round(confidence, 3),
                     raw_text=text_clean
                 )
         
         return None
     
+    def _extract_topic(self, text: str, end: int) -> Optional[str]:
+        """Topic following a research trigger: the rest of the sentence"""
+        match = _TOPIC_PATTERN.match(text, end)
+        if not match:
+            return None
+        return self._clean_topic(match.group(1)) or None
+    
     def _clean_topic(self, topic: str) -> str:
         """Clean up extracted topic"""
         # Remove common filler words at start
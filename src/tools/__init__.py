@@ -0,0 +1 @@
+"""Developer tools: benchmarks and test servers"""
@@ -0,0 +1,65 @@
+"""
+Micro-benchmark: Whisper upload encoding time vs bytes sent.
+
+Run with: python -m src.tools.bench_encoding [--runs N]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from ..speech.encoding import SUPPORTED_FORMATS, encode_audio
+
+
+def synthetic_utterance(seconds: float, sample_rate: int = 16000, seed: int = 0) -> np.ndarray:
+    """Speech-like test signal: voiced harmonics with syllable-rate modulation plus noise"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    
+    pitch = 120 + 20 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 8))
+    envelope = np.clip(np.sin(2 * np.pi * 4 * t), 0, None) ** 0.5
+    
+    audio = 0.2 * voiced * envelope + 0.01 * rng.standard_normal(len(t))
+    return audio.astype(np.float32)
+
+
+def bench(durations, runs: int, sample_rate: int = 16000):
+    """Print encode time and size for each format and duration"""
+    print(f"{'duration':>8} {'format':>6} {'actual':>6} {'bytes':>9} {'ratio':>6} {'encode ms':>10}")
+    
+    for seconds in durations:
+        audio = synthetic_utterance(seconds, sample_rate)
+        baseline = None
+        
+        for fmt in SUPPORTED_FORMATS:
+            timings = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                buffer, actual = encode_audio(audio, sample_rate, fmt)
+                timings.append((time.perf_counter() - start) * 1000)
+            
+            size = buffer.getbuffer().nbytes
+            if baseline is None:
+                baseline = size
+            print(
+                f"{seconds:>7.0f}s {fmt:>6} {actual:>6} {size:>9} "
+                f"{baseline / size:>5.1f}x {np.median(timings):>10.2f}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="Encodes per measurement")
+    parser.add_argument(
+        "--durations", type=float, nargs="+", default=[2, 5, 10],
+        help="Utterance lengths in seconds",
+    )
+    args = parser.parse_args()
+    bench(args.durations, args.runs)
+
+
+if __name__ == "__main__":
+    main()
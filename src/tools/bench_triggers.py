@@ -0,0 +1,145 @@
+"""
+Micro-benchmark: trigger detection time vs number of trigger phrases.
+
+Compares the Aho–Corasick TriggerDetector with the previous approach of one
+alternation regex over all research triggers.
+
+Run with: python -m src.tools.bench_triggers [--runs N] [--sizes 10 100 1000] [--fuzzy]
+"""
+
+import argparse
+import copy
+import re
+import time
+
+import numpy as np
+
+from ..config.defaults import DEFAULT_SETTINGS
+from ..speech.trigger_detector import TriggerDetector
+
+WORDS = (
+    "cloud native edge data mesh zero trust identity graph stream vector secure "
+    "sentinel falcon nimbus quartz orbit beacon atlas vertex pulse harbor summit"
+).split()
+
+FILLER = (
+    "so we looked at the rollout plan last week and the team thinks the "
+    "migration can start after the quarterly review if the budget holds"
+)
+
+
+class RegexDetector:
+    """The previous detector: one regex alternation per trigger type"""
+
+    def __init__(self, triggers: dict):
+        research = triggers.get("research", []) + triggers.get("custom", [])
+        self._research = re.compile(
+            "|".join(rf"(?:^|[.\s])({re.escape(t.lower())})\s+(.+?)(?:[.?!]|$)" for t in research),
+            re.IGNORECASE,
+        )
+        self._others = [
+            re.compile("|".join(re.escape(t.lower()) for t in triggers.get(key, [])), re.IGNORECASE)
+            for key in ("transcription_start", "transcription_stop")
+            if triggers.get(key)
+        ]
+
+    def detect(self, text: str):
+        text_lower = text.strip().lower()
+        match = self._research.search(text_lower)
+        if match:
+            groups = match.groups()
+            for i in range(0, len(groups), 2):
+                if groups[i] is not None:
+                    return groups[i], groups[i + 1]
+        for pattern in self._others:
+            match = pattern.search(text_lower)
+            if match:
+                return match.group(), None
+        return None
+
+
+def synthetic_triggers(count: int, seed: int = 0, fuzzy: bool = False) -> dict:
+    """Default triggers plus `count` custom phrases like 'compare nimbus vector'"""
+    rng = np.random.default_rng(seed)
+    triggers = copy.deepcopy(DEFAULT_SETTINGS["triggers"])
+    triggers["fuzzy"]["enabled"] = fuzzy
+    custom = set()
+    while len(custom) < count:
+        custom.add(" ".join(rng.choice(WORDS, size=3)))
+    triggers["custom"] = sorted(custom)
+    return triggers
+
+
+def synthetic_texts(triggers: dict, count: int = 200, seed: int = 1) -> list:
+    """Utterances: a third with a custom trigger, a third with a default trigger, a third with none"""
+    rng = np.random.default_rng(seed)
+    custom = triggers["custom"] or triggers["research"]
+    texts = []
+    for i in range(count):
+        if i % 3 == 0:
+            phrase = custom[rng.integers(len(custom))]
+            texts.append(f"{FILLER} {phrase} kubernetes operators")
+        elif i % 3 == 1:
+            phrase = triggers["research"][rng.integers(len(triggers["research"]))]
+            texts.append(f"{FILLER}. {phrase} vector databases?")
+        else:
+            texts.append(FILLER)
+    return texts
+
+
+def time_detector(detect, texts, runs: int) -> float:
+    """Median microseconds per utterance"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for text in texts:
+            detect(text)
+        timings.append((time.perf_counter() - start) * 1e6 / len(texts))
+    return float(np.median(timings))
+
+
+def bench(sizes, runs: int, fuzzy: bool = False):
+    """Print build and per-utterance detection time for each trigger-set size"""
+    print(f"{'triggers':>8} {'build regex':>12} {'build ac':>9} {'regex us':>9} {'ac us':>7} {'speedup':>8} {'agree':>6}")
+
+    for size in sizes:
+        triggers = synthetic_triggers(size, fuzzy=fuzzy)
+        texts = synthetic_texts(triggers)
+
+        start = time.perf_counter()
+        regex = RegexDetector(triggers)
+        regex_build = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        detector = TriggerDetector(triggers)
+        ac_build = (time.perf_counter() - start) * 1000
+
+        # Both should find the same phrase (they can differ when one trigger is
+        # a prefix of another: the automaton prefers the longest)
+        agree = 0
+        for text in texts:
+            expected, match = regex.detect(text), detector.detect(text)
+            agree += (match.trigger_phrase if match else None) == (expected[0] if expected else None)
+
+        regex_us = time_detector(regex.detect, texts, runs)
+        ac_us = time_detector(detector.detect, texts, runs)
+        print(
+            f"{size:>8} {regex_build:>10.1f}ms {ac_build:>7.1f}ms {regex_us:>9.1f} {ac_us:>7.1f} "
+            f"{regex_us / ac_us:>7.1f}x {agree:>3}/{len(texts)}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Passes over the utterances per measurement")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[0, 10, 100, 500, 1000],
+        help="Numbers of custom trigger phrases",
+    )
+    parser.add_argument("--fuzzy", action="store_true", help="Enable fuzzy matching in the automaton detector")
+    args = parser.parse_args()
+    bench(args.sizes, args.runs, args.fuzzy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+"""
+Local OpenAI-compatible stand-in server for load and latency testing.
+
+Implements /v1/chat/completions (streaming and non-streaming) and
+/v1/audio/transcriptions with configurable latency, error rate and canned
+responses. Point the app at it with:
+
+    api:
+      openai:
+        base_url: "http://127.0.0.1:8765/v1"
+    speech:
+      base_url: "http://127.0.0.1:8765/v1"
+
+Run with: python -m src.tools.mockapi [--port 8765] [--latency-ms 800] ...
+"""
+
+import argparse
+import itertools
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SUMMARY = (
+    "{topic} is a widely used enterprise technology. Key capabilities include "
+    "centralized management, integration with existing security tooling and "
+    "support for large-scale deployments. It is relevant in security "
+    "conversations because of its visibility and control features."
+)
+
+DEFAULT_TRANSCRIPTS = [
+    "what is kubernetes",
+    "so we were looking at the quarterly numbers",
+    "did you say zero trust",
+    "tell me about Exabeam",
+]
+
+
+class LatencyModel:
+    """Samples delays (in seconds) from a configurable distribution"""
+
+    DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+
+    def __init__(self, mean_ms: float, jitter_ms: float = 0.0, distribution: str = "fixed"):
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+        self.mean_ms = mean_ms
+        self.jitter_ms = jitter_ms
+        self.distribution = distribution
+
+    def sample(self) -> float:
+        mean, jitter = self.mean_ms, self.jitter_ms
+        if self.distribution == "uniform":
+            value = random.uniform(mean - jitter, mean + jitter)
+        elif self.distribution == "normal":
+            value = random.gauss(mean, jitter)
+        elif self.distribution == "lognormal" and mean > 0:
+            # Heavy right tail, median ~= mean; jitter controls the spread
+            sigma = max(jitter / mean, 1e-6)
+            value = mean * random.lognormvariate(0, sigma)
+        else:
+            value = mean
+        return max(0.0, value) / 1000.0
+
+
+class MockConfig:
+    """Behaviour shared by all request handlers"""
+
+    def __init__(
+        self,
+        chat_latency: LatencyModel,
+        first_token: LatencyModel,
+        token_interval_ms: float,
+        transcription_latency: LatencyModel,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        responses: Optional[Dict[str, str]] = None,
+        transcripts: Optional[List[str]] = None,
+    ):
+        self.chat_latency = chat_latency
+        self.first_token = first_token
+        self.token_interval_ms = token_interval_ms
+        self.transcription_latency = transcription_latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.responses = responses or {}
+        self._transcripts = itertools.cycle(transcripts or DEFAULT_TRANSCRIPTS)
+        self._lock = threading.Lock()
+        self.counts: Dict[str, int] = {}
+
+    def count(self, key: str):
+        with self._lock:
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def next_transcript(self) -> str:
+        with self._lock:
+            return next(self._transcripts)
+
+    def summary_for(self, prompt: str) -> str:
+        """Canned response for the topic in a research prompt"""
+        match = re.search(r"briefly:\s*(.+)$", prompt, re.IGNORECASE | re.DOTALL)
+        topic = (match.group(1) if match else prompt).strip() or "This topic"
+        for key, text in self.responses.items():
+            if key.lower() in topic.lower():
+                return text
+        return DEFAULT_SUMMARY.format(topic=topic)
+
+
+class MockAPIHandler(BaseHTTPRequestHandler):
+    """Request handler for the OpenAI-compatible endpoints"""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real API
+    config: MockConfig = None  # Set by make_server()
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/v1/models":
+            self._send_json(200, {"object": "list", "data": [{"id": "mock", "object": "model"}]})
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        path = self.path.rstrip("/")
+
+        if path == "/v1/chat/completions":
+            self._chat(body)
+        elif path == "/v1/audio/transcriptions":
+            self._transcription(body)
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+    def _maybe_fail(self, endpoint: str) -> bool:
+        """Inject an error response according to the configured rate"""
+        if random.random() >= self.config.error_rate:
+            return False
+        self.config.count(f"{endpoint}_errors")
+        self._send_json(self.config.error_status, {
+            "error": {"message": "Injected mock error", "type": "server_error", "code": None}
+        })
+        return True
+
+    def _chat(self, body: bytes):
+        self.config.count("chat")
+        try:
+            request = json.loads(body or b"{}")
+        except json.JSONDecodeError:
+            self._send_json(400, {"error": {"message": "Invalid JSON"}})
+            return
+
+        if self._maybe_fail("chat"):
+            return
+
+        messages = request.get("messages", [])
+        prompt = messages[-1].get("content", "") if messages else ""
+        summary = self.config.summary_for(prompt)
+        model = request.get("model", "mock")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+
+        if request.get("stream"):
+            self._stream_chat(completion_id, model, summary)
+            return
+
+        time.sleep(self.config.chat_latency.sample())
+        words = len(summary.split())
+        self._send_json(200, {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": summary},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": len(prompt.split()), "completion_tokens": words,
+                      "total_tokens": len(prompt.split()) + words},
+        })
+
+    def _stream_chat(self, completion_id: str, model: str, summary: str):
+        """Send the summary as server-sent events over chunked encoding"""
+        self.config.count("chat_stream")
+        time.sleep(self.config.first_token.sample())
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def event(delta: dict, finish_reason=None):
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            self._write_chunk(f"data: {json.dumps(payload)}\n\n")
+
+        try:
+            event({"role": "assistant", "content": ""})
+            for word in re.findall(r"\S+\s*", summary):
+                event({"content": word})
+                time.sleep(self.config.token_interval_ms / 1000.0)
+            event({}, finish_reason="stop")
+            self._write_chunk("data: [DONE]\n\n")
+            self.wfile.write(b"0\r\n\r\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # Client cancelled mid-stream
+            self.config.count("chat_stream_cancelled")
+            self.close_connection = True
+
+    def _write_chunk(self, text: str):
+        data = text.encode("utf-8")
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def _transcription(self, body: bytes):
+        self.config.count("transcription")
+        if self._maybe_fail("transcription"):
+            return
+        time.sleep(self.config.transcription_latency.sample())
+        self._send_json(200, {"text": self.config.next_transcript()})
+
+    def _send_json(self, status: int, payload: dict):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def make_server(host: str, port: int, config: MockConfig) -> ThreadingHTTPServer:
+    """Create (but do not start) a mock API server"""
+    handler = type("ConfiguredMockAPIHandler", (MockAPIHandler,), {"config": config})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible mock server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=800,
+                        help="Mean non-streaming chat completion latency")
+    parser.add_argument("--jitter-ms", type=float, default=200,
+                        help="Spread of the latency distribution")
+    parser.add_argument("--distribution", default="lognormal", choices=LatencyModel.DISTRIBUTIONS)
+    parser.add_argument("--first-token-ms", type=float, default=300,
+                        help="Mean time to first token for streaming responses")
+    parser.add_argument("--token-ms", type=float, default=15,
+                        help="Delay between streamed tokens")
+    parser.add_argument("--transcription-ms", type=float, default=400,
+                        help="Mean transcription latency")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fraction of requests answered with an error (0-1)")
+    parser.add_argument("--error-status", type=int, default=500,
+                        help="HTTP status for injected errors (e.g. 429, 500, 503)")
+    parser.add_argument("--responses", help="JSON file mapping topic substrings to canned summaries")
+    parser.add_argument("--transcripts", help="Text file with one canned transcript per line (cycled)")
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible runs")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    responses = None
+    if args.responses:
+        with open(args.responses) as f:
+            responses = json.load(f)
+
+    transcripts = None
+    if args.transcripts:
+        with open(args.transcripts) as f:
+            transcripts = [line.strip() for line in f if line.strip()]
+
+    config = MockConfig(
+        chat_latency=LatencyModel(args.latency_ms, args.jitter_ms, args.distribution),
+        first_token=LatencyModel(args.first_token_ms, args.jitter_ms / 2, args.distribution),
+        token_interval_ms=args.token_ms,
+        transcription_latency=LatencyModel(args.transcription_ms, args.jitter_ms / 2, args.distribution),
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        responses=responses,
+        transcripts=transcripts,
+    )
+
+    server = make_server(args.host, args.port, config)
+    logger.info(f"Mock OpenAI API listening on http://{args.host}:{args.port}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        logger.info(f"Request counts: {config.counts}")
+
+
+if __name__ == "__main__":
+    main()
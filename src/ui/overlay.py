@@ -1,5 +1,7 @@
 """Overlay window for displaying research results"""
 
+from typing import Optional
+
 from PyQt6.QtWidgets import (
     QWidget, QLabel, QVBoxLayout, QHBoxLayout, 
     QPushButton, QGraphicsOpacityEffect, QApplication
@@ -26,6 +28,7 @@ class OverlayWindow(QWidget):
         auto_dismiss: bool = True,
         dismiss_seconds: int = 30,
         animation_ms: int = 200,
+        relayout_ms: int = 80,
     ):
         super().__init__()
         
@@ -35,6 +38,12 @@ class OverlayWindow(QWidget):
         self.auto_dismiss = auto_dismiss
         self.dismiss_seconds = dismiss_seconds
         self.animation_ms = animation_ms
+        self.relayout_ms = relayout_ms
+        
+        # Streaming state
+        self._streaming = False
+        self._stream_text = ""
+        self._request_id = 0  # Newest request shown; older ones are stale
         
         self._setup_window()
         self._setup_ui()
@@ -172,10 +181,16 @@ class OverlayWindow(QWidget):
         self.fade_out_anim.finished.connect(self._on_fade_out_complete)
     
     def _setup_timers(self):
-        """Setup auto-dismiss timer"""
+        """Setup auto-dismiss and streaming relayout timers"""
         self.dismiss_timer = QTimer(self)
         self.dismiss_timer.setSingleShot(True)
         self.dismiss_timer.timeout.connect(self.dismiss)
+        
+        # Coalesces streamed deltas into at most one relayout per interval
+        self.relayout_timer = QTimer(self)
+        self.relayout_timer.setSingleShot(True)
+        self.relayout_timer.setInterval(self.relayout_ms)
+        self.relayout_timer.timeout.connect(self._flush_stream_text)
     
     def show_result(self, result: ResearchResult):
         """Display a research result"""
@@ -183,6 +198,61 @@ class OverlayWindow(QWidget):
         logger = logging.getLogger(__name__)
         logger.info(f"Overlay.show_result called for: {result.topic}")
         
+        self._apply_result(result)
+        self._present()
+    
+    def begin_result(self, request_id: int, topic: str):
+        """Show the overlay for a result that will be streamed in"""
+        if request_id < self._request_id:
+            return
+        self._request_id = request_id
+        self._stream_text = ""
+        self._streaming = True
+        self.relayout_timer.stop()
+        
+        self.title_label.setText(topic)
+        self.content_label.setText("Researching...")
+        self.icon_label.setText("⏳")
+        self.provider_label.setText("📡 ...")
+        self.latency_label.setText("⏱️ ...")
+        
+        self._resize_to_text(self.content_label.text())
+        self._present()
+    
+    def append_text(self, request_id: int, text: str):
+        """Append a streamed delta; relayout is throttled"""
+        if not self._streaming or request_id != self._request_id:
+            return
+        self._stream_text += text
+        if not self.relayout_timer.isActive():
+            self.relayout_timer.start()
+    
+    def finish_result(self, result: ResearchResult, request_id: Optional[int] = None):
+        """Replace streamed text with the final result, unless a newer request has started"""
+        if request_id is not None:
+            if request_id < self._request_id:
+                return
+            self._request_id = request_id
+        was_streaming = self._streaming
+        self._streaming = False
+        self.relayout_timer.stop()
+        
+        self._apply_result(result)
+        if was_streaming and self.isVisible():
+            self._restart_dismiss_timer()
+        else:
+            self._present()
+    
+    def _flush_stream_text(self):
+        """Render accumulated streamed text"""
+        if not self._streaming:
+            return
+        self.icon_label.setText("🔍")
+        self.content_label.setText(self._stream_text)
+        self._resize_to_text(self._stream_text)
+    
+    def _apply_result(self, result: ResearchResult):
+        """Fill labels from a result and resize to fit"""
         self.title_label.setText(result.topic)
         
         if result.success:
@@ -193,22 +263,36 @@ class OverlayWindow(QWidget):
             self.icon_label.setText("⚠️")
         
         self.provider_label.setText(f"📡 {result.provider.title()} {result.model}")
-        self.latency_label.setText(f"⏱️ {result.latency_ms / 1000:.1f}s")
+        if result.cached:
+            self.latency_label.setText(f"⚡ cached {result.latency_ms}ms")
+        elif result.first_token_ms is not None:
+            self.latency_label.setText(
+                f"⏱️ {result.first_token_ms / 1000:.1f}s / {result.latency_ms / 1000:.1f}s"
+            )
+        else:
+            self.latency_label.setText(f"⏱️ {result.latency_ms / 1000:.1f}s")
         
-        # Calculate required height for word-wrapped text
+        self._resize_to_text(self.content_label.text())
+    
+    def _resize_to_text(self, text: str):
+        """Calculate required height for word-wrapped text"""
         from PyQt6.QtGui import QFontMetrics
         fm = QFontMetrics(self.content_label.font())
         text_width = self._width - 40  # Account for padding/margins
         text_rect = fm.boundingRect(0, 0, text_width, 10000, 
-                                     Qt.TextFlag.TextWordWrap, result.summary)
+                                     Qt.TextFlag.TextWordWrap, text)
         content_height = text_rect.height() + 120  # Add space for header/footer
         
         self.setFixedHeight(min(content_height, 600))  # Cap at 600px max
         self._position_window()
-        
+    
+    def _present(self):
+        """Show with animation and start the auto-dismiss timer"""
+        import logging
+        logger = logging.getLogger(__name__)
         logger.info(f"Overlay geometry: {self.geometry()}, visible: {self.isVisible()}")
         
-        # Show with animation
+        self.fade_out_anim.stop()
         self.show()
         self.raise_()  # Bring to front
         self.activateWindow()  # Activate (but shouldn't steal focus due to flags)
@@ -216,9 +300,14 @@ class OverlayWindow(QWidget):
         
         logger.info(f"Overlay shown, now visible: {self.isVisible()}")
         
-        # Start auto-dismiss timer
+        self._restart_dismiss_timer()
+    
+    def _restart_dismiss_timer(self):
+        """Start auto-dismiss timer"""
         if self.auto_dismiss:
             self.dismiss_timer.start(self.dismiss_seconds * 1000)
+        else:
+            self.dismiss_timer.stop()
     
     def _position_window(self):
         """Position window based on settings"""
@@ -20,6 +20,8 @@ class SystemTray(QObject):
         super().__init__()
         self.app = app
         self._is_listening = True
+        self._status_text = "🟢 Listening"
+        self._health_text = ""
         
         # Create icons
         self._icons = {
@@ -64,6 +66,11 @@ class SystemTray(QObject):
         self.status_action = self.menu.addAction("🟢 Listening")
         self.status_action.setEnabled(False)
         
+        # Research provider health (non-clickable, hidden until known)
+        self.health_action = self.menu.addAction("")
+        self.health_action.setEnabled(False)
+        self.health_action.setVisible(False)
+        
         self.menu.addSeparator()
         
         # Pause/Resume
@@ -124,8 +131,30 @@ class SystemTray(QObject):
                 'paused': '⏸️ Paused',
             }
             
-            self.status_action.setText(status_text.get(status, status))
-            self.tray.setToolTip(f"Meeting Assistant - {status_text.get(status, status)}")
+            self._status_text = status_text.get(status, status)
+            self.status_action.setText(self._status_text)
+            self._update_tooltip()
+    
+    def set_provider_health(self, states: dict):
+        """
+        Show research provider health.
+        
+        Args:
+            states: Provider name -> circuit state ('closed', 'half_open', 'open')
+        """
+        symbols = {'closed': '✅', 'half_open': '🟡', 'open': '⛔'}
+        self._health_text = "  ".join(
+            f"{symbols.get(state, '?')} {name}" for name, state in states.items()
+        )
+        self.health_action.setText(f"Providers: {self._health_text}")
+        self.health_action.setVisible(bool(states))
+        self._update_tooltip()
+    
+    def _update_tooltip(self):
+        tooltip = f"Meeting Assistant - {self._status_text}"
+        if self._health_text:
+            tooltip += f"\nProviders: {self._health_text}"
+        self.tray.setToolTip(tooltip)
     
     def show_message(self, title: str, message: str, icon: QSystemTrayIcon.MessageIcon = QSystemTrayIcon.MessageIcon.Information):
         """Show a system notification"""
@@ -47,6 +47,45 @@ def test_triggers():
             print(f"  ✗ '{phrase}' (no trigger)")
 
 
+def test_fuzzy_triggers():
+    """Fuzzy matching catches ASR near-misses but not ordinary speech"""
+    print("\n=== Testing Fuzzy Trigger Matching ===")
+    
+    triggers = dict(SettingsManager().get('triggers'))
+    triggers['fuzzy'] = dict(triggers.get('fuzzy') or {}, enabled=True)
+    detector = TriggerDetector(triggers)
+    
+    near_misses = {
+        "did ya say kubernetes": "Kubernetes",
+        "what's SIEM": "Siem",
+        "lookup zero trust": "Zero trust",
+        "did you sae kubernetes": "Kubernetes",
+    }
+    ordinary = [
+        "did you see that game",
+        "did you sue them",
+        "we searched for hours",
+        "wait is this on",
+        "lock up the office",
+        "I think you should",  # Near "thank you" (transcription stop)
+        "that help us",  # Near "that helps" (transcription stop)
+        "did you stay late",
+        "did you pay the invoice",
+        "the search form works",
+    ]
+    
+    for phrase, topic in near_misses.items():
+        result = detector.detect(phrase)
+        assert result is not None and result.topic == topic, f"'{phrase}' -> {result}"
+        assert result.confidence < 1.0, f"'{phrase}' scored as an exact match"
+        print(f"  ✓ '{phrase}' → {result.topic} ({result.confidence})")
+    
+    for phrase in ordinary:
+        result = detector.detect(phrase)
+        assert result is None, f"'{phrase}' falsely triggered {result.trigger_type}: {result.trigger_phrase}"
+        print(f"  ✓ '{phrase}' (no trigger)")
+
+
 def test_research():
     """Test research engine (requires valid API key)"""
     print("\n=== Testing Research Engine ===")
@@ -65,6 +104,7 @@ def test_research():
     print(f"\n  Researching: {topic}")
     
     result = engine.research_sync(topic)
+    engine.close()
     
     if result.success:
         print(f"  ✓ Success in {result.latency_ms}ms")
@@ -158,6 +198,7 @@ if __name__ == "__main__":
     print("=" * 40)
     
     test_triggers()
+    test_fuzzy_triggers()
     test_research()
     test_logging()
     